@@ -0,0 +1,144 @@
+"""
+Measures the request overhead Ordo adds on top of a broker call (NFR1).
+
+The app is driven in-process over httpx's ASGI transport against the mock
+adapter, which answers immediately, so the measured latency is the overhead
+of auth, routing, validation, orchestration and serialization. Run with:
+
+    PYTHONPATH=src python -m scripts.benchmark_api --requests 500
+"""
+
+import asyncio
+import statistics
+import time
+from typing import Dict, List, Tuple
+
+import httpx
+import typer
+
+from ordo.config import settings
+from ordo.main import app as ordo_app
+from ordo.security.edge_limit import edge_limiter
+from ordo.security.tokens import DEFAULT_CLIENT_ID
+
+app = typer.Typer()
+
+# NFR1: median overhead <= 50 ms, p95 <= 100 ms, no request above 250 ms.
+MEDIAN_BUDGET_MS = 50.0
+P95_BUDGET_MS = 100.0
+MAX_BUDGET_MS = 250.0
+
+ORDER = {"symbol": "RELIANCE-EQ", "quantity": 1, "transaction_type": "BUY"}
+
+# (name, method, path, json body)
+SCENARIOS: List[Tuple[str, str, str, Dict]] = [
+    (
+        "place_order",
+        "POST",
+        "/api/v1/orders",
+        {"targets": [{"broker": "mock"}], "order": ORDER},
+    ),
+    (
+        "modify_order",
+        "PATCH",
+        "/api/v1/brokers/mock/orders/MOCK-1",
+        {"changes": {"quantity": 2}},
+    ),
+    ("cancel_order", "DELETE", "/api/v1/brokers/mock/orders/MOCK-1", None),
+    ("order_book", "GET", "/api/v1/brokers/mock/orders", None),
+    ("trade_book", "GET", "/api/v1/brokers/mock/trades", None),
+    ("holdings", "GET", "/api/v1/brokers/mock/holdings", None),
+    ("positions", "GET", "/api/v1/brokers/mock/positions", None),
+]
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def measure(
+    client: httpx.AsyncClient,
+    method: str,
+    path: str,
+    body: Dict,
+    requests: int,
+    concurrency: int,
+) -> List[float]:
+    """Returns the latency, in milliseconds, of each of ``requests`` calls."""
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: List[float] = []
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.request(method, path, json=body)
+            samples.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                raise RuntimeError(f"{method} {path}: {response.status_code}")
+
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return samples
+
+
+async def run_benchmark(
+    requests: int, concurrency: int, warmup: int
+) -> Dict[str, Dict[str, float]]:
+    """Runs every scenario and returns median/p95/max latency per scenario."""
+    results = {}
+    # The limiter still runs on every request, but with room for the load.
+    edge_limiter.configure(
+        DEFAULT_CLIENT_ID, rate=1e6, burst=1e6, max_in_flight=concurrency + 1
+    )
+    headers = {"Authorization": f"Bearer {settings.ORDO_API_TOKEN}"}
+    async with ordo_app.router.lifespan_context(ordo_app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=ordo_app),
+            base_url="http://ordo",
+            headers=headers,
+        ) as client:
+            for name, method, path, body in SCENARIOS:
+                await measure(client, method, path, body, warmup, 1)
+                samples = await measure(
+                    client, method, path, body, requests, concurrency
+                )
+                results[name] = {
+                    "median_ms": statistics.median(samples),
+                    "p95_ms": percentile(samples, 0.95),
+                    "max_ms": max(samples),
+                }
+    return results
+
+
+def within_budget(stats: Dict[str, float]) -> bool:
+    return (
+        stats["median_ms"] <= MEDIAN_BUDGET_MS
+        and stats["p95_ms"] <= P95_BUDGET_MS
+        and stats["max_ms"] <= MAX_BUDGET_MS
+    )
+
+
+@app.command()
+def benchmark(
+    requests: int = typer.Option(200, help="Measured requests per scenario."),
+    concurrency: int = typer.Option(1, help="Requests in flight at once."),
+    warmup: int = typer.Option(20, help="Unmeasured requests per scenario."),
+):
+    """Benchmarks every order and book route against the NFR1 budgets."""
+    results = asyncio.run(run_benchmark(requests, concurrency, warmup))
+
+    typer.echo(f"{'scenario':<14}{'median':>10}{'p95':>10}{'max':>10}")
+    failed = False
+    for name, stats in results.items():
+        ok = within_budget(stats)
+        failed = failed or not ok
+        typer.echo(
+            f"{name:<14}{stats['median_ms']:>8.2f}ms{stats['p95_ms']:>8.2f}ms"
+            f"{stats['max_ms']:>8.2f}ms{'' if ok else '  OVER BUDGET'}"
+        )
+    if failed:
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List
 
@@ -11,6 +12,13 @@ class IBrokerAdapter(ABC):
     Abstract base class for all broker adapters.
     """
 
+    def account_key(self, session_data: Dict[str, Any]) -> str:
+        """
+        Identifies the broker account a call acts on, for per-account caching
+        and rate limiting. Adapters override this with their credential key.
+        """
+        return "default"
+
     @abstractmethod
     async def initiate_login(self, credentials: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -32,6 +40,33 @@ class IBrokerAdapter(ABC):
         """
         raise NotImplementedError
 
+    def validate_order(self, order_details: Dict[str, Any]):
+        """
+        Checks an order without sending it, raising ValueError if the broker
+        would reject its shape. Used to validate whole baskets up front.
+        """
+
+    async def place_order(
+        self, session_data: Dict[str, Any], order_details: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Places a single order.
+        """
+        raise NotImplementedError
+
+    async def place_orders(
+        self, session_data: Dict[str, Any], orders: List[Dict[str, Any]]
+    ) -> List[Any]:
+        """
+        Places a batch of orders concurrently. Returns one entry per order,
+        in input order: the order response, or the exception that order
+        raised. Adapters for brokers with a native basket API may override it.
+        """
+        return await asyncio.gather(
+            *(self.place_order(session_data, order) for order in orders),
+            return_exceptions=True,
+        )
+
     @abstractmethod
     async def modify_order(
         self, session_data: Dict[str, Any], order_id: str, **kwargs
@@ -1,13 +1,17 @@
 import hashlib
 import uuid
+from datetime import timedelta
 from typing import Any, Dict
 
 import httpx
 from pydantic import BaseModel, ValidationError
 
 from ordo.adapters.base import IBrokerAdapter
+from ordo.adapters.http_pool import HttpClientPool, http_clients
+from ordo.core.concurrency import gather_or_cancel
 from ordo.models.api.errors import ApiError, ApiException, CSRFError
 from ordo.models.api.portfolio import Portfolio, Holding, Funds
+from ordo.persistence.session_store import get_session_store
 from ordo.security.session import SessionManager
 from ordo.config import settings
 
@@ -27,9 +31,25 @@ class FyersAdapter(IBrokerAdapter):
     Adapter for interacting with the Fyers API (v3).
     """
 
-    def __init__(self):
+    def __init__(self, client_pool: HttpClientPool = http_clients):
         self.base_url = "https://api-t1.fyers.in/api/v3"
-        self.session_manager = SessionManager(settings.SECRET_KEY)
+        self.session_manager = SessionManager(
+            settings.SECRET_KEY,
+            store=get_session_store(),
+            broker_name="fyers",
+            access_token_ttl=timedelta(hours=settings.SESSION_ACCESS_TOKEN_TTL_HOURS),
+            cache_size=settings.SESSION_DECRYPT_CACHE_SIZE,
+            cache_ttl_seconds=settings.SESSION_DECRYPT_CACHE_TTL_SECONDS,
+        )
+        self._client_pool = client_pool
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """The shared, pooled client for Fyers."""
+        return self._client_pool.get_client("fyers")
+
+    def account_key(self, session_data: Dict[str, Any]) -> str:
+        return session_data.get("credentials", {}).get("app_id", "default")
 
     async def initiate_login(self, credentials: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -73,17 +93,17 @@ class FyersAdapter(IBrokerAdapter):
             f"{config.app_id}:{config.secret_id}".encode()
         ).hexdigest()
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/validate-authcode",
-                json={
-                    "grant_type": "authorization_code",
-                    "appIdHash": app_id_hash,
-                    "code": auth_code,
-                },
-            )
-            response.raise_for_status()
-            token_data = response.json()
+        client = self._client
+        response = await client.post(
+            f"{self.base_url}/validate-authcode",
+            json={
+                "grant_type": "authorization_code",
+                "appIdHash": app_id_hash,
+                "code": auth_code,
+            },
+        )
+        response.raise_for_status()
+        token_data = response.json()
 
         access_token = token_data["access_token"]
         refresh_token = token_data["refresh_token"]
@@ -108,18 +128,18 @@ class FyersAdapter(IBrokerAdapter):
             f"{config.app_id}:{config.secret_id}".encode()
         ).hexdigest()
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/validate-refresh-token",
-                json={
-                    "grant_type": "refresh_token",
-                    "appIdHash": app_id_hash,
-                    "refresh_token": refresh_token,
-                    "pin": pin,
-                },
-            )
-            response.raise_for_status()
-            token_data = response.json()
+        client = self._client
+        response = await client.post(
+            f"{self.base_url}/validate-refresh-token",
+            json={
+                "grant_type": "refresh_token",
+                "appIdHash": app_id_hash,
+                "refresh_token": refresh_token,
+                "pin": pin,
+            },
+        )
+        response.raise_for_status()
+        token_data = response.json()
 
         access_token = token_data["access_token"]
         self.session_manager.set_session(config.app_id, "access_token", access_token)
@@ -139,17 +159,17 @@ class FyersAdapter(IBrokerAdapter):
         headers = {"Authorization": f"{config.app_id}:{access_token}"}
         profile_url = f"{self.base_url}/profile"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(profile_url, headers=headers)
-                response.raise_for_status()
-                response_data = response.json()
-                if response_data.get("s") == "ok":
-                    return {"status": "active"}
-                else:
-                    return {"status": "inactive"}
-            except (httpx.HTTPStatusError, httpx.RequestError):
+        client = self._client
+        try:
+            response = await client.get(profile_url, headers=headers)
+            response.raise_for_status()
+            response_data = response.json()
+            if response_data.get("s") == "ok":
+                return {"status": "active"}
+            else:
                 return {"status": "inactive"}
+        except (httpx.HTTPStatusError, httpx.RequestError):
+            return {"status": "inactive"}
 
     async def get_portfolio(self, session_data: Dict[str, Any]) -> Portfolio:
         """
@@ -165,49 +185,47 @@ class FyersAdapter(IBrokerAdapter):
         holdings_url = f"{self.base_url}/holdings"
         funds_url = f"{self.base_url}/funds"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                holdings_response = await client.get(holdings_url, headers=headers)
-                holdings_response.raise_for_status()
-                holdings_data = holdings_response.json()
-                if holdings_data.get("s") != "ok":
-                    raise ApiException(
-                        ApiError(
-                            error_code="BROKER_API_ERROR",
-                            message=f"Fyers holdings error: {holdings_data.get('message', 'Unknown error')}",
-                            details={"response": holdings_data},
-                        )
-                    )
+        client = self._client
 
-                funds_response = await client.get(funds_url, headers=headers)
-                funds_response.raise_for_status()
-                funds_data = funds_response.json()
-                if funds_data.get("s") != "ok":
-                    raise ApiException(
-                        ApiError(
-                            error_code="BROKER_API_ERROR",
-                            message=f"Fyers funds error: {funds_data.get('message', 'Unknown error')}",
-                            details={"response": funds_data},
-                        )
-                    )
-
-            except httpx.HTTPStatusError as e:
+        async def fetch(url: str, label: str) -> Dict[str, Any]:
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            data = response.json()
+            if data.get("s") != "ok":
                 raise ApiException(
                     ApiError(
                         error_code="BROKER_API_ERROR",
-                        message=f"Fyers API error: {e.response.text}",
-                        details={"status_code": e.response.status_code},
+                        message=f"Fyers {label} error: {data.get('message', 'Unknown error')}",
+                        details={"response": data},
                     )
                 )
-            except ApiException:
-                raise
-            except Exception as e:
-                raise ApiException(
-                    ApiError(
-                        error_code="BROKER_REQUEST_FAILED",
-                        message=f"Failed to retrieve portfolio from Fyers: {e}",
-                    )
+            return data
+
+        try:
+            # Holdings and funds are independent, so fetch them concurrently.
+            holdings_data, funds_data = await gather_or_cancel(
+                fetch(holdings_url, "holdings"), fetch(funds_url, "funds")
+            )
+        except httpx.HTTPStatusError as e:
+            raise ApiException(
+                ApiError(
+                    error_code="BROKER_API_ERROR",
+                    message=f"Fyers API error: {e.response.text}",
+                    details={
+                        "status_code": e.response.status_code,
+                        "retry_after": e.response.headers.get("Retry-After"),
+                    },
                 )
+            )
+        except ApiException:
+            raise
+        except Exception as e:
+            raise ApiException(
+                ApiError(
+                    error_code="BROKER_REQUEST_FAILED",
+                    message=f"Failed to retrieve portfolio from Fyers: {e}",
+                )
+            )
 
         # Transform holdings
         holdings = [
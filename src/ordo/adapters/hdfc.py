@@ -1,11 +1,13 @@
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Union
 
 import httpx
 from pydantic import BaseModel, ValidationError, SecretStr, Field
 
 from ordo.adapters.base import IBrokerAdapter
+from ordo.adapters.http_pool import HttpClientPool, http_clients
+from ordo.core.concurrency import gather_or_cancel, parse_pool
 from ordo.models.api.errors import ApiError, ApiException
 from ordo.models.api.portfolio import Portfolio, Holding, Funds
 from ordo.models.api.order import (
@@ -23,6 +25,7 @@ from ordo.models.api.order import (
     OptionType,
 )
 from ordo.models.api.user import Profile
+from ordo.persistence.session_store import get_session_store
 from ordo.security.session import SessionManager
 from ordo.config import settings
 
@@ -236,14 +239,77 @@ class HDFCConfig(BaseModel):
     apiSecret: str
 
 
+# Order and trade books can run to thousands of rows late in the day, so
+# they are parsed from the raw body by module-level functions that
+# parse_pool can hand to a worker thread or process.
+
+
+def parse_order_book(body: bytes) -> List[Order]:
+    data = HDFCOrderBookResponse(**json.loads(body))
+    orders = []
+    for item in data.data:
+        timestamp_str = item.order_timestamp
+        if timestamp_str and timestamp_str.endswith("Z"):
+            timestamp_str = timestamp_str.replace("Z", "+00:00")
+
+        orders.append(
+            Order(
+                order_id=item.order_id,
+                symbol=item.tradingsymbol,
+                status=OrderStatus(item.status),
+                transaction_type=TransactionType(item.transaction_type),
+                order_type=OrderType.MARKET,  # HDFC does not provide order type in order book
+                product_type=ProductType(item.product),
+                quantity=item.quantity,
+                price=item.price,
+                timestamp=(
+                    datetime.fromisoformat(timestamp_str) if timestamp_str else None
+                ),
+            )
+        )
+    return orders
+
+
+def parse_trade_book(body: bytes) -> List[Trade]:
+    data = HDFCTradeBookResponse(**json.loads(body))
+    trades = []
+    for item in data.data:
+        trades.append(
+            Trade(
+                trade_id=item.trade_id,
+                order_id=item.order_id,
+                exchange=item.exchange,
+                product=ProductType(item.product),
+                average_price=item.average_price,
+                filled_quantity=item.filled_quantity,
+                exchange_order_id=item.exchange_order_id,
+                transaction_type=TransactionType(item.transaction_type),
+                fill_timestamp=datetime.strptime(
+                    item.fill_timestamp, "%d/%m/%Y %H:%M:%S"
+                ),
+                security_id=item.security_id,
+                company_name=item.company_name,
+            )
+        )
+    return trades
+
+
 class HDFCAdapter(IBrokerAdapter):
     """
     Adapter for interacting with the HDFC Securities API.
     """
 
-    def __init__(self):
+    def __init__(self, client_pool: HttpClientPool = http_clients):
         self.base_url = "https://developer.hdfcsec.com/oapi/v1"
-        self.session_manager = SessionManager(settings.SECRET_KEY)
+        self.session_manager = SessionManager(
+            settings.SECRET_KEY,
+            store=get_session_store(),
+            broker_name="hdfc",
+            access_token_ttl=timedelta(hours=settings.SESSION_ACCESS_TOKEN_TTL_HOURS),
+            cache_size=settings.SESSION_DECRYPT_CACHE_SIZE,
+            cache_ttl_seconds=settings.SESSION_DECRYPT_CACHE_TTL_SECONDS,
+        )
+        self._client_pool = client_pool
         self._headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
         }
@@ -256,30 +322,35 @@ class HDFCAdapter(IBrokerAdapter):
         except json.JSONDecodeError:
             return response.text
 
-    def _create_client(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(headers=self._headers)
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """The shared, pooled client for HDFC Securities."""
+        return self._client_pool.get_client("hdfc", headers=self._headers)
+
+    def account_key(self, session_data: Dict[str, Any]) -> str:
+        return session_data.get("credentials", {}).get("api_key", "default")
 
     async def _get_login_token(self, config: HDFCConfig) -> str:
         """Fetches the initial login token."""
-        async with self._create_client() as client:
-            token_response = await client.get(
-                f"{self.base_url}/login?api_key={config.api_key}"
-            )
-            token_response.raise_for_status()
-            token_data = HDFCLoginInitResponse(**token_response.json())
-            return token_data.tokenId
+        client = self._client
+        token_response = await client.get(
+            f"{self.base_url}/login?api_key={config.api_key}"
+        )
+        token_response.raise_for_status()
+        token_data = HDFCLoginInitResponse(**token_response.json())
+        return token_data.tokenId
 
     async def _validate_user(
         self, config: HDFCConfig, token_id: str
     ) -> HDFCLoginValidateResponse:
         """Validates username and password."""
-        async with self._create_client() as client:
-            validate_response = await client.post(
-                f"{self.base_url}/login/validate?api_key={config.api_key}&token_id={token_id}",
-                json={"username": config.username, "password": config.password},
-            )
-            validate_response.raise_for_status()
-            return HDFCLoginValidateResponse(**validate_response.json())
+        client = self._client
+        validate_response = await client.post(
+            f"{self.base_url}/login/validate?api_key={config.api_key}&token_id={token_id}",
+            json={"username": config.username, "password": config.password},
+        )
+        validate_response.raise_for_status()
+        return HDFCLoginValidateResponse(**validate_response.json())
 
     async def initiate_login(self, credentials: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -312,6 +383,7 @@ class HDFCAdapter(IBrokerAdapter):
                     message=f"HDFC API error during initiate_login: {e.response.text}",
                     details={
                         "status_code": e.response.status_code,
+                        "retry_after": e.response.headers.get("Retry-After"),
                         "response": e.response.json(),
                     },
                 )
@@ -404,44 +476,47 @@ class HDFCAdapter(IBrokerAdapter):
                 )
             )
 
-        async with httpx.AsyncClient() as client:
-            try:
-                if session_data.get("twoFAEnabled") and otp:
-                    request_token = await self._validate_2fa(
-                        client, config, token_id, otp
-                    )
+        client = self._client
+        try:
+            if session_data.get("twoFAEnabled") and otp:
+                request_token = await self._validate_2fa(client, config, token_id, otp)
 
-                request_token = await self._authorize_session(
-                    client, config, token_id, request_token, consent
-                )
-                access_token = await self._get_access_token(
-                    client, config, request_token
-                )
+            request_token = await self._authorize_session(
+                client, config, token_id, request_token, consent
+            )
+            access_token = await self._get_access_token(client, config, request_token)
 
-                self.session_manager.set_session(
-                    config.api_key, "access_token", access_token
-                )
-                return {"access_token": access_token}
+            self.session_manager.set_session(
+                config.api_key, "access_token", access_token
+            )
+            return {"access_token": access_token}
 
-            except httpx.HTTPStatusError as e:
-                response_content = self._get_response_json_or_text(e.response)
-                raise ApiException(
-                    ApiError(
-                        error_code="BROKER_API_ERROR",
-                        message=f"HDFC API error during complete_login: {e.response.text}",
-                        details={
-                            "status_code": e.response.status_code,
-                            "response": response_content,
-                        },
-                    )
+        except httpx.HTTPStatusError as e:
+            response_content = self._get_response_json_or_text(e.response)
+            raise ApiException(
+                ApiError(
+                    error_code="BROKER_API_ERROR",
+                    message=f"HDFC API error during complete_login: {e.response.text}",
+                    details={
+                        "status_code": e.response.status_code,
+                        "retry_after": e.response.headers.get("Retry-After"),
+                        "response": response_content,
+                    },
                 )
-            except Exception as e:
-                raise ApiException(
-                    ApiError(
-                        error_code="BROKER_REQUEST_FAILED",
-                        message=f"Failed to complete login with HDFC: {e}",
-                    )
+            )
+        except Exception as e:
+            raise ApiException(
+                ApiError(
+                    error_code="BROKER_REQUEST_FAILED",
+                    message=f"Failed to complete login with HDFC: {e}",
                 )
+            )
+
+    def validate_order(self, order_details: Dict[str, Any]):
+        try:
+            HDFCPlaceOrderRequest(**order_details)
+        except ValidationError as e:
+            raise ValueError(f"Invalid order details: {e}")
 
     async def place_order(
         self, session_data: Dict[str, Any], order_details: Dict[str, Any]
@@ -470,48 +545,49 @@ class HDFCAdapter(IBrokerAdapter):
             "Content-Type": "application/json",
         }
 
-        async with self._create_client() as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/orders/regular?api_key={config.api_key}",
-                    headers=headers,
-                    json=order_request.model_dump(exclude_none=True),
-                )
-                response.raise_for_status()
-                response_data = HDFCPlaceOrderResponse(**response.json())
-
-                order_id = response_data.data.order_id
-                status = response_data.status
-
-                if not order_id or not status:
-                    raise ApiException(
-                        ApiError(
-                            error_code="INVALID_ORDER_RESPONSE",
-                            message="Failed to place order: Missing order_id or status in response.",
-                        )
-                    )
+        client = self._client
+        try:
+            response = await client.post(
+                f"{self.base_url}/orders/regular?api_key={config.api_key}",
+                headers=headers,
+                json=order_request.model_dump(exclude_none=True),
+            )
+            response.raise_for_status()
+            response_data = HDFCPlaceOrderResponse(**response.json())
 
-                return {"order_id": order_id, "status": status}
+            order_id = response_data.data.order_id
+            status = response_data.status
 
-            except httpx.HTTPStatusError as e:
-                response_content = self._get_response_json_or_text(e.response)
+            if not order_id or not status:
                 raise ApiException(
                     ApiError(
-                        error_code="BROKER_API_ERROR",
-                        message=f"HDFC API error during order placement: {e.response.text}",
-                        details={
-                            "status_code": e.response.status_code,
-                            "response": response_content,
-                        },
+                        error_code="INVALID_ORDER_RESPONSE",
+                        message="Failed to place order: Missing order_id or status in response.",
                     )
                 )
-            except Exception as e:
-                raise ApiException(
-                    ApiError(
-                        error_code="BROKER_REQUEST_FAILED",
-                        message=f"Failed to place order with HDFC: {e}",
-                    )
+
+            return {"order_id": order_id, "status": status}
+
+        except httpx.HTTPStatusError as e:
+            response_content = self._get_response_json_or_text(e.response)
+            raise ApiException(
+                ApiError(
+                    error_code="BROKER_API_ERROR",
+                    message=f"HDFC API error during order placement: {e.response.text}",
+                    details={
+                        "status_code": e.response.status_code,
+                        "retry_after": e.response.headers.get("Retry-After"),
+                        "response": response_content,
+                    },
+                )
+            )
+        except Exception as e:
+            raise ApiException(
+                ApiError(
+                    error_code="BROKER_REQUEST_FAILED",
+                    message=f"Failed to place order with HDFC: {e}",
                 )
+            )
 
     async def get_portfolio(self, session_data: Dict[str, Any]) -> Portfolio:
         """
@@ -537,51 +613,47 @@ class HDFCAdapter(IBrokerAdapter):
 
         headers = {"Authorization": f"Bearer {access_token}"}
 
-        async with self._create_client() as client:
-            try:
-                # Retrieve Holdings
-                holdings_response = await client.get(
-                    f"{self.base_url}/holdings",
-                    headers=headers,
-                    params={
-                        "clientId": login_id
-                    },  # Assuming clientId is a query parameter
-                )
-                holdings_response.raise_for_status()
-                holdings_data = HDFCHoldingsResponse(**holdings_response.json())
-
-                # Retrieve Portfolio Summary
-                portfolio_summary_response = await client.get(
-                    f"{self.base_url}/portfolio",
-                    headers=headers,
-                    params={
-                        "clientId": login_id
-                    },  # Assuming clientId is a query parameter
-                )
-                portfolio_summary_response.raise_for_status()
-                portfolio_summary_data = HDFCPortfolioSummaryResponse(
-                    **portfolio_summary_response.json()
-                )
-
-            except httpx.HTTPStatusError as e:
-                response_content = self._get_response_json_or_text(e.response)
-                raise ApiException(
-                    ApiError(
-                        error_code="BROKER_API_ERROR",
-                        message=f"HDFC API error during portfolio retrieval: {e.response.text}",
-                        details={
-                            "status_code": e.response.status_code,
-                            "response": response_content,
-                        },
-                    )
+        client = self._client
+
+        async def fetch(path: str) -> Dict[str, Any]:
+            response = await client.get(
+                f"{self.base_url}/{path}",
+                headers=headers,
+                params={"clientId": login_id},  # Assuming clientId is a query parameter
+            )
+            response.raise_for_status()
+            return response.json()
+
+        try:
+            # Holdings and the portfolio summary are independent, so fetch
+            # them concurrently.
+            holdings_json, portfolio_summary_json = await gather_or_cancel(
+                fetch("holdings"), fetch("portfolio")
+            )
+            holdings_data = HDFCHoldingsResponse(**holdings_json)
+            portfolio_summary_data = HDFCPortfolioSummaryResponse(
+                **portfolio_summary_json
+            )
+        except httpx.HTTPStatusError as e:
+            response_content = self._get_response_json_or_text(e.response)
+            raise ApiException(
+                ApiError(
+                    error_code="BROKER_API_ERROR",
+                    message=f"HDFC API error during portfolio retrieval: {e.response.text}",
+                    details={
+                        "status_code": e.response.status_code,
+                        "retry_after": e.response.headers.get("Retry-After"),
+                        "response": response_content,
+                    },
                 )
-            except Exception as e:
-                raise ApiException(
-                    ApiError(
-                        error_code="BROKER_REQUEST_FAILED",
-                        message=f"Failed to retrieve portfolio from HDFC: {e}",
-                    )
+            )
+        except Exception as e:
+            raise ApiException(
+                ApiError(
+                    error_code="BROKER_REQUEST_FAILED",
+                    message=f"Failed to retrieve portfolio from HDFC: {e}",
                 )
+            )
 
         # --- Data Transformation ---
         holdings = [
@@ -648,13 +720,11 @@ class HDFCAdapter(IBrokerAdapter):
             "Content-Type": "application/json",
         }
         try:
-            async with self._create_client() as client:
-                response = await client.put(
-                    url, json=payload.model_dump(), headers=headers
-                )
-                response.raise_for_status()
-                data = HDFCOrderActionResponse(**response.json())
-                return OrderResponse(order_id=data.data.order_id, status="success")
+            client = self._client
+            response = await client.put(url, json=payload.model_dump(), headers=headers)
+            response.raise_for_status()
+            data = HDFCOrderActionResponse(**response.json())
+            return OrderResponse(order_id=data.data.order_id, status="success")
         except httpx.HTTPStatusError as e:
             response_content = self._get_response_json_or_text(e.response)
             raise ApiException(
@@ -663,6 +733,7 @@ class HDFCAdapter(IBrokerAdapter):
                     message=f"HDFC API error during modify_order: {e.response.text}",
                     details={
                         "status_code": e.response.status_code,
+                        "retry_after": e.response.headers.get("Retry-After"),
                         "response": response_content,
                     },
                 )
@@ -694,11 +765,11 @@ class HDFCAdapter(IBrokerAdapter):
             "Authorization": f"Bearer {access_token}",
         }
         try:
-            async with self._create_client() as client:
-                response = await client.delete(url, headers=headers)
-                response.raise_for_status()
-                data = HDFCOrderActionResponse(**response.json())
-                return OrderResponse(order_id=data.data.order_id, status="cancelled")
+            client = self._client
+            response = await client.delete(url, headers=headers)
+            response.raise_for_status()
+            data = HDFCOrderActionResponse(**response.json())
+            return OrderResponse(order_id=data.data.order_id, status="cancelled")
         except httpx.HTTPStatusError as e:
             response_content = self._get_response_json_or_text(e.response)
             raise ApiException(
@@ -707,6 +778,7 @@ class HDFCAdapter(IBrokerAdapter):
                     message=f"HDFC API error during cancel_order: {e.response.text}",
                     details={
                         "status_code": e.response.status_code,
+                        "retry_after": e.response.headers.get("Retry-After"),
                         "response": response_content,
                     },
                 )
@@ -736,34 +808,10 @@ class HDFCAdapter(IBrokerAdapter):
             "Authorization": f"Bearer {access_token}",
         }
         try:
-            async with self._create_client() as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                data = HDFCOrderBookResponse(**response.json())
-                orders = []
-            for item in data.data:
-                timestamp_str = item.order_timestamp
-                if timestamp_str and timestamp_str.endswith("Z"):
-                    timestamp_str = timestamp_str.replace("Z", "+00:00")
-
-                orders.append(
-                    Order(
-                        order_id=item.order_id,
-                        symbol=item.tradingsymbol,
-                        status=OrderStatus(item.status),
-                        transaction_type=TransactionType(item.transaction_type),
-                        order_type=OrderType.MARKET,  # HDFC does not provide order type in order book
-                        product_type=ProductType(item.product),
-                        quantity=item.quantity,
-                        price=item.price,
-                        timestamp=(
-                            datetime.fromisoformat(timestamp_str)
-                            if timestamp_str
-                            else None
-                        ),
-                    )
-                )
-            return orders
+            client = self._client
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            return await parse_pool.parse(response.content, parse_order_book)
         except httpx.HTTPStatusError as e:
             response_content = self._get_response_json_or_text(e.response)
             raise ApiException(
@@ -772,6 +820,7 @@ class HDFCAdapter(IBrokerAdapter):
                     message=f"HDFC API error during get_order_book: {e.response.text}",
                     details={
                         "status_code": e.response.status_code,
+                        "retry_after": e.response.headers.get("Retry-After"),
                         "response": response_content,
                     },
                 )
@@ -801,30 +850,10 @@ class HDFCAdapter(IBrokerAdapter):
             "Authorization": f"Bearer {access_token}",
         }
         try:
-            async with self._create_client() as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                data = HDFCTradeBookResponse(**response.json())
-                trades = []
-            for item in data.data:
-                trades.append(
-                    Trade(
-                        trade_id=item.trade_id,
-                        order_id=item.order_id,
-                        exchange=item.exchange,
-                        product=ProductType(item.product),
-                        average_price=item.average_price,
-                        filled_quantity=item.filled_quantity,
-                        exchange_order_id=item.exchange_order_id,
-                        transaction_type=TransactionType(item.transaction_type),
-                        fill_timestamp=datetime.strptime(
-                            item.fill_timestamp, "%d/%m/%Y %H:%M:%S"
-                        ),
-                        security_id=item.security_id,
-                        company_name=item.company_name,
-                    )
-                )
-            return trades
+            client = self._client
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            return await parse_pool.parse(response.content, parse_trade_book)
         except httpx.HTTPStatusError as e:
             response_content = self._get_response_json_or_text(e.response)
             raise ApiException(
@@ -833,6 +862,7 @@ class HDFCAdapter(IBrokerAdapter):
                     message=f"HDFC API error during get_trade_book: {e.response.text}",
                     details={
                         "status_code": e.response.status_code,
+                        "retry_after": e.response.headers.get("Retry-After"),
                         "response": response_content,
                     },
                 )
@@ -862,13 +892,11 @@ class HDFCAdapter(IBrokerAdapter):
             "Authorization": f"Bearer {access_token}",
         }
         try:
-            async with self._create_client() as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                data = HDFCProfileResponse(**response.json())
-                return Profile(
-                    client_id=data.client_id, name=data.name, email=data.email
-                )
+            client = self._client
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            data = HDFCProfileResponse(**response.json())
+            return Profile(client_id=data.client_id, name=data.name, email=data.email)
         except httpx.HTTPStatusError as e:
             response_content = self._get_response_json_or_text(e.response)
             raise ApiException(
@@ -877,6 +905,7 @@ class HDFCAdapter(IBrokerAdapter):
                     message=f"HDFC API error during get_profile: {e.response.text}",
                     details={
                         "status_code": e.response.status_code,
+                        "retry_after": e.response.headers.get("Retry-After"),
                         "response": response_content,
                     },
                 )
@@ -913,30 +942,28 @@ class HDFCAdapter(IBrokerAdapter):
         headers = {"Authorization": f"Bearer {access_token}"}
 
         try:
-            async with self._create_client() as client:
-                # Retrieve Holdings
-                holdings_response = await client.get(
-                    f"{self.base_url}/holdings",
-                    headers=headers,
-                    params={
-                        "clientId": login_id
-                    },  # Assuming clientId is a query parameter
-                )
-                holdings_response.raise_for_status()
-                holdings_data = HDFCHoldingsResponse(**holdings_response.json())
-
-                return [
-                    Holding(
-                        symbol=h.symbol,
-                        quantity=h.quantity,
-                        ltp=h.currentPrice,
-                        avg_price=h.averagePrice,
-                        pnl=h.profitLoss,
-                        day_pnl=0.0,  # HDFC API does not provide day P&L in the holdings endpoint.
-                        value=h.totalValue,
-                    )
-                    for h in holdings_data.holdings
-                ]
+            client = self._client
+            # Retrieve Holdings
+            holdings_response = await client.get(
+                f"{self.base_url}/holdings",
+                headers=headers,
+                params={"clientId": login_id},  # Assuming clientId is a query parameter
+            )
+            holdings_response.raise_for_status()
+            holdings_data = HDFCHoldingsResponse(**holdings_response.json())
+
+            return [
+                Holding(
+                    symbol=h.symbol,
+                    quantity=h.quantity,
+                    ltp=h.currentPrice,
+                    avg_price=h.averagePrice,
+                    pnl=h.profitLoss,
+                    day_pnl=0.0,  # HDFC API does not provide day P&L in the holdings endpoint.
+                    value=h.totalValue,
+                )
+                for h in holdings_data.holdings
+            ]
         except httpx.HTTPStatusError as e:
             response_content = self._get_response_json_or_text(e.response)
             raise ApiException(
@@ -945,6 +972,7 @@ class HDFCAdapter(IBrokerAdapter):
                     message=f"HDFC API error during get_holdings: {e.response.text}",
                     details={
                         "status_code": e.response.status_code,
+                        "retry_after": e.response.headers.get("Retry-After"),
                         "response": response_content,
                     },
                 )
@@ -974,23 +1002,23 @@ class HDFCAdapter(IBrokerAdapter):
             "Authorization": f"Bearer {access_token}",
         }
         try:
-            async with self._create_client() as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                response_data = HDFCPositionsResponse(**response.json())
-                positions = []
-                for item in response_data.data.net:
-                    positions.append(
-                        Position(
-                            symbol=item.security_id,
-                            quantity=item.net_qty,
-                            product_type=ProductType(item.product),
-                            exchange=item.exchange,
-                            instrument_type=item.instrument_segment,
-                            realised_pnl=item.realised_pl_overall_position,
-                        )
+            client = self._client
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            response_data = HDFCPositionsResponse(**response.json())
+            positions = []
+            for item in response_data.data.net:
+                positions.append(
+                    Position(
+                        symbol=item.security_id,
+                        quantity=item.net_qty,
+                        product_type=ProductType(item.product),
+                        exchange=item.exchange,
+                        instrument_type=item.instrument_segment,
+                        realised_pnl=item.realised_pl_overall_position,
                     )
-                return positions
+                )
+            return positions
         except httpx.HTTPStatusError as e:
             response_content = self._get_response_json_or_text(e.response)
             raise ApiException(
@@ -999,6 +1027,7 @@ class HDFCAdapter(IBrokerAdapter):
                     message=f"HDFC API error during get_positions: {e.response.text}",
                     details={
                         "status_code": e.response.status_code,
+                        "retry_after": e.response.headers.get("Retry-After"),
                         "response": response_content,
                     },
                 )
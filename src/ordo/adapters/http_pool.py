@@ -0,0 +1,125 @@
+"""Shared, pooled HTTP clients for broker adapters."""
+
+from typing import Any, Dict, Optional
+
+import httpx
+
+from ordo.config import settings
+from ordo.core.metrics import BROKER_HTTP_RESPONSES
+from ordo.core.tracing import httpx_event_hooks, tracing
+
+
+def _pool_usage(client: httpx.AsyncClient) -> Dict[str, int]:
+    """
+    Reads connection counts from the client's connection pool, or returns an
+    empty dict when they aren't available. httpx does not expose its pool
+    publicly, so this relies on httpcore internals and must not fail if those
+    change (or the transport is not a pooled one, e.g. under respx).
+    """
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    try:
+        connections = list(pool.connections)
+        idle = sum(1 for c in connections if c.is_idle())
+        requests = len(pool._requests)
+    except (AttributeError, TypeError):
+        return {}
+    return {
+        "connections": len(connections),
+        "active": len(connections) - idle,
+        "idle": idle,
+        "requests_in_flight": requests,
+    }
+
+
+class HttpClientPool:
+    """
+    Owns one long-lived ``httpx.AsyncClient`` per broker.
+
+    Clients are created lazily on first use and reused for every subsequent
+    request, so adapter calls share warm keep-alive connections instead of
+    paying a fresh TCP/TLS handshake each time. The FastAPI lifespan closes
+    the pool on shutdown.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        timeout: Optional[float] = None,
+        http2: Optional[bool] = None,
+    ):
+        self._max_connections = max_connections
+        self._max_keepalive_connections = max_keepalive_connections
+        self._keepalive_expiry = keepalive_expiry
+        self._timeout = timeout
+        self._http2 = http2
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self._max_connections or settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=self._max_keepalive_connections
+            or settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=self._keepalive_expiry or settings.HTTP_KEEPALIVE_EXPIRY,
+        )
+
+    def get_client(
+        self, broker_id: str, headers: Optional[Dict[str, str]] = None
+    ) -> httpx.AsyncClient:
+        """
+        Returns the shared client for a broker, creating it on first use.
+
+        ``headers`` are only applied when the client is created; they should be
+        static, broker-wide headers (e.g. a User-Agent), never per-user tokens.
+        """
+        client = self._clients.get(broker_id)
+        if client is None or client.is_closed:
+            http2 = self._http2 if self._http2 is not None else settings.HTTP2_ENABLED
+
+            async def count_status(response: httpx.Response):
+                BROKER_HTTP_RESPONSES.inc(broker_id, str(response.status_code))
+
+            hooks = httpx_event_hooks(tracing, broker_id)
+            hooks["response"].append(count_status)
+            client = httpx.AsyncClient(
+                headers=headers,
+                limits=self._limits(),
+                timeout=self._timeout or settings.HTTP_TIMEOUT_SECONDS,
+                http2=http2,
+                event_hooks=hooks,
+            )
+            self._clients[broker_id] = client
+        return client
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns connection pool usage per broker, for sizing the pool limits.
+        The connection counts are left out when the pool can't report them.
+        """
+        limits = self._limits()
+        return {
+            broker_id: {
+                **_pool_usage(client),
+                "max_connections": limits.max_connections,
+                "max_keepalive_connections": limits.max_keepalive_connections,
+                "closed": client.is_closed,
+            }
+            for broker_id, client in self._clients.items()
+        }
+
+    async def aclose(self):
+        """Closes every pooled client."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    async def __aenter__(self) -> "HttpClientPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+
+http_clients = HttpClientPool()
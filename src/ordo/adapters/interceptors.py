@@ -0,0 +1,113 @@
+"""Interceptor chain wrapped around broker adapter calls."""
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+
+from ordo.adapters.base import IBrokerAdapter
+
+READ_METHODS = frozenset(
+    {
+        "get_portfolio",
+        "get_order_book",
+        "get_trade_book",
+        "get_profile",
+        "get_holdings",
+        "get_positions",
+    }
+)
+WRITE_METHODS = frozenset({"place_order", "modify_order", "cancel_order"})
+INTERCEPTED_METHODS = READ_METHODS | WRITE_METHODS
+
+Proceed = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class AdapterCall:
+    """Describes one adapter method invocation as it passes the interceptors."""
+
+    broker_id: str
+    account_id: Optional[str]
+    account_key: str
+    method: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def is_write(self) -> bool:
+        return self.method in WRITE_METHODS
+
+    @property
+    def session_data(self) -> Dict[str, Any]:
+        if self.args:
+            return self.args[0]
+        return self.kwargs.get("session_data", {})
+
+
+class AdapterInterceptor:
+    """
+    Base class for cross-cutting behaviour around adapter calls.
+
+    ``proceed`` invokes the next interceptor (or the adapter itself); an
+    interceptor may short-circuit by not calling it.
+    """
+
+    async def __call__(self, call: AdapterCall, proceed: Proceed) -> Any:
+        return await proceed()
+
+
+async def run_interceptors(
+    interceptors: List[AdapterInterceptor], call: AdapterCall, final: Proceed
+) -> Any:
+    """Runs ``final`` through ``interceptors``, outermost first."""
+
+    async def proceed_from(index: int) -> Any:
+        if index == len(interceptors):
+            return await final()
+        return await interceptors[index](call, lambda: proceed_from(index + 1))
+
+    return await proceed_from(0)
+
+
+def _make_intercepted_method(adapter_class: Type[IBrokerAdapter], name: str):
+    original = getattr(adapter_class, name)
+
+    async def method(self, *args, **kwargs):
+        interceptors = self._interceptors
+        if not interceptors:
+            return await original(self, *args, **kwargs)
+        session_data = args[0] if args else kwargs.get("session_data")
+        call = AdapterCall(
+            broker_id=self.broker_id,
+            account_id=self.account_id,
+            account_key=self.account_key(session_data or {}),
+            method=name,
+            args=args,
+            kwargs=kwargs,
+        )
+        return await run_interceptors(
+            interceptors, call, lambda: original(self, *args, **kwargs)
+        )
+
+    method.__name__ = name
+    method.__qualname__ = f"{adapter_class.__name__}.{name}"
+    return method
+
+
+def intercepted_class(
+    adapter_class: Type[IBrokerAdapter],
+    broker_id: str,
+    interceptors: List[AdapterInterceptor],
+) -> Type[IBrokerAdapter]:
+    """
+    Returns a subclass of ``adapter_class`` whose data methods run through
+    ``interceptors``. The list is shared, not copied, so interceptors added to
+    it later apply to existing instances. Being a subclass, the result still
+    passes ``isinstance`` checks against the concrete adapter.
+    """
+    namespace: Dict[str, Any] = {
+        name: _make_intercepted_method(adapter_class, name)
+        for name in INTERCEPTED_METHODS
+        if hasattr(adapter_class, name)
+    }
+    namespace.update(broker_id=broker_id, account_id=None, _interceptors=interceptors)
+    return type(adapter_class.__name__, (adapter_class,), namespace)
@@ -1,5 +1,8 @@
-from typing import Any, Dict
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List
 
+from ordo.models.api.order import Order, OrderResponse, Position, Trade
 from ordo.models.api.portfolio import Portfolio, Holding, Funds
 
 from .base import IBrokerAdapter
@@ -98,25 +101,86 @@ class MockAdapter(IBrokerAdapter):
             total_value=total_value,
         )
 
+    async def place_order(
+        self, session_data: Dict[str, Any], order_details: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Simulates a successful order placement."""
+        return {"order_id": f"MOCK-{uuid.uuid4().hex[:12]}", "status": "success"}
+
     async def modify_order(
         self, session_data: Dict[str, Any], order_id: str, **kwargs
-    ) -> Any:
-        raise NotImplementedError
-
-    async def cancel_order(self, session_data: Dict[str, Any], order_id: str) -> Any:
-        raise NotImplementedError
-
-    async def get_order_book(self, session_data: Dict[str, Any]) -> Any:
-        raise NotImplementedError
+    ) -> OrderResponse:
+        """Simulates a successful order modification."""
+        return OrderResponse(order_id=order_id, status="modified")
+
+    async def cancel_order(
+        self, session_data: Dict[str, Any], order_id: str
+    ) -> OrderResponse:
+        """Simulates a successful order cancellation."""
+        return OrderResponse(order_id=order_id, status="cancelled")
+
+    async def get_order_book(self, session_data: Dict[str, Any]) -> List[Order]:
+        """Returns a hardcoded order book with one filled and one open order."""
+        timestamp = datetime(2024, 1, 1, 9, 15, tzinfo=timezone.utc)
+        return [
+            Order(
+                order_id="MOCK-ORDER-1",
+                symbol="RELIANCE-EQ",
+                status="completed",
+                transaction_type="BUY",
+                order_type="MARKET",
+                product_type="DELIVERY",
+                quantity=50,
+                price=2500.00,
+                timestamp=timestamp,
+            ),
+            Order(
+                order_id="MOCK-ORDER-2",
+                symbol="TCS-EQ",
+                status="open",
+                transaction_type="SELL",
+                order_type="LIMIT",
+                product_type="INTRADAY",
+                quantity=10,
+                price=3900.00,
+                timestamp=timestamp,
+            ),
+        ]
 
-    async def get_trade_book(self, session_data: Dict[str, Any]) -> Any:
-        raise NotImplementedError
+    async def get_trade_book(self, session_data: Dict[str, Any]) -> List[Trade]:
+        """Returns a hardcoded trade book matching the filled mock order."""
+        return [
+            Trade(
+                trade_id="MOCK-TRADE-1",
+                order_id="MOCK-ORDER-1",
+                exchange="NSE",
+                product="DELIVERY",
+                average_price=2500.00,
+                filled_quantity=50,
+                exchange_order_id="MOCK-EXCH-1",
+                transaction_type="BUY",
+                fill_timestamp=datetime(2024, 1, 1, 9, 15, tzinfo=timezone.utc),
+                security_id="2885",
+                company_name="RELIANCE INDUSTRIES LTD",
+            )
+        ]
 
     async def get_profile(self, session_data: Dict[str, Any]) -> Any:
         raise NotImplementedError
 
-    async def get_holdings(self, session_data: Dict[str, Any]) -> Any:
-        raise NotImplementedError
-
-    async def get_positions(self, session_data: Dict[str, Any]) -> Any:
-        raise NotImplementedError
+    async def get_holdings(self, session_data: Dict[str, Any]) -> List[Holding]:
+        """Returns the holdings of the mock portfolio."""
+        return (await self.get_portfolio(session_data)).holdings
+
+    async def get_positions(self, session_data: Dict[str, Any]) -> List[Position]:
+        """Returns a single hardcoded intraday position."""
+        return [
+            Position(
+                symbol="TCS-EQ",
+                quantity=-10,
+                product_type="INTRADAY",
+                exchange="NSE",
+                instrument_type="EQ",
+                realised_pnl=0.0,
+            )
+        ]
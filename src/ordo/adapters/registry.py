@@ -0,0 +1,137 @@
+"""Process-wide registry of broker adapter instances."""
+
+import importlib
+import threading
+from importlib.metadata import entry_points
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from ordo.adapters.base import IBrokerAdapter
+from ordo.adapters.interceptors import AdapterInterceptor, intercepted_class
+
+ENTRY_POINT_GROUP = "ordo.adapters"
+
+# Built-in adapters, referenced as "module:Class" so they are only imported
+# when first requested (importing them eagerly would be a circular import
+# through ordo.config).
+BUILTIN_ADAPTERS: Dict[str, str] = {
+    "mock": "ordo.adapters.mock:MockAdapter",
+    "fyers": "ordo.adapters.fyers:FyersAdapter",
+    "hdfc": "ordo.adapters.hdfc:HDFCAdapter",
+}
+
+AdapterTarget = Union[str, Type[IBrokerAdapter]]
+
+
+class AdapterRegistry:
+    """
+    Creates each broker adapter once and hands out the cached instance.
+
+    Adapters are looked up in a plugin table seeded with the built-in adapters
+    and, on a miss, in the ``ordo.adapters`` entry-point group. Instances are
+    cached per ``(broker, account_id)`` so that concurrent requests for the
+    same account share warm state (sessions, login ``state``, HTTP clients).
+
+    Every instance is created from an intercepted subclass of the adapter, so
+    interceptors installed with :meth:`use` wrap all of its data methods.
+    """
+
+    def __init__(self, plugins: Optional[Dict[str, AdapterTarget]] = None):
+        self._plugins: Dict[str, AdapterTarget] = dict(
+            BUILTIN_ADAPTERS if plugins is None else plugins
+        )
+        self._instances: Dict[Tuple[str, Optional[str]], IBrokerAdapter] = {}
+        self._classes: Dict[str, Type[IBrokerAdapter]] = {}
+        self._interceptors: List[AdapterInterceptor] = []
+        self._entry_points_loaded = False
+        self._lock = threading.Lock()
+
+    def register(self, name: str, target: AdapterTarget):
+        """Registers an adapter class (or "module:Class" path) under a name."""
+        with self._lock:
+            self._plugins[name] = target
+            self._classes.pop(name, None)
+            for key in [k for k in self._instances if k[0] == name]:
+                del self._instances[key]
+
+    def use(self, interceptor: AdapterInterceptor):
+        """
+        Appends an interceptor to the chain around every adapter call.
+        Interceptors run in the order they were added, outermost first.
+        """
+        self._interceptors.append(interceptor)
+
+    @property
+    def interceptors(self) -> List[AdapterInterceptor]:
+        return list(self._interceptors)
+
+    def available(self) -> List[str]:
+        """Returns the names of all known adapters."""
+        self._load_entry_points()
+        return sorted(self._plugins)
+
+    def get(self, broker: str, account_id: Optional[str] = None) -> IBrokerAdapter:
+        """
+        Returns the adapter instance for a broker (and optionally an account),
+        creating it on first use.
+        """
+        key = (broker, account_id)
+        adapter = self._instances.get(key)
+        if adapter is not None:
+            return adapter
+
+        with self._lock:
+            adapter = self._instances.get(key)
+            if adapter is None:
+                adapter = self._intercepted(broker)()
+                adapter.account_id = account_id
+                self._instances[key] = adapter
+        return adapter
+
+    def session_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the decrypted-session cache counters of every adapter
+        instance that keeps sessions, keyed ``broker:account_id``.
+        """
+        stats = {}
+        for (broker, account_id), adapter in list(self._instances.items()):
+            session_manager = getattr(adapter, "session_manager", None)
+            if session_manager is not None:
+                stats[f"{broker}:{account_id or ''}"] = session_manager.cache_stats()
+        return stats
+
+    def clear(self):
+        """Drops every cached adapter instance."""
+        with self._lock:
+            self._instances.clear()
+
+    def _intercepted(self, broker: str) -> Type[IBrokerAdapter]:
+        adapter_class = self._classes.get(broker)
+        if adapter_class is None:
+            adapter_class = intercepted_class(
+                self._resolve(broker), broker, self._interceptors
+            )
+            self._classes[broker] = adapter_class
+        return adapter_class
+
+    def _resolve(self, broker: str) -> Type[IBrokerAdapter]:
+        target = self._plugins.get(broker)
+        if target is None:
+            self._load_entry_points()
+            target = self._plugins.get(broker)
+        if target is None:
+            raise ValueError(f"Unknown adapter: {broker}")
+        if isinstance(target, str):
+            module_name, _, class_name = target.partition(":")
+            target = getattr(importlib.import_module(module_name), class_name)
+            self._plugins[broker] = target
+        return target
+
+    def _load_entry_points(self):
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            self._plugins.setdefault(entry_point.name, entry_point.value)
+
+
+adapter_registry = AdapterRegistry()
@@ -0,0 +1,182 @@
+"""The Prometheus scrape endpoint and the collectors behind it."""
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from ordo.adapters.http_pool import http_clients
+from ordo.adapters.registry import adapter_registry
+from ordo.core.audit import audit_log
+from ordo.core.circuit_breaker import CLOSED, HALF_OPEN, OPEN
+from ordo.core.concurrency import parse_pool
+from ordo.core.kill_switch import kill_switch
+from ordo.core.loop_monitor import loop_monitor
+from ordo.core.metrics import CONTENT_TYPE, metrics
+from ordo.core.pipeline import (
+    circuit_breakers,
+    rate_limiter,
+    read_cache,
+    retries,
+    single_flight,
+)
+from ordo.security.edge_limit import edge_limiter
+
+router = APIRouter(tags=["Status"])
+
+HTTP_POOL_CONNECTIONS = metrics.gauge(
+    "ordo_http_pool_connections",
+    "Connections in each broker's HTTP pool, by state.",
+    ("broker", "state"),
+)
+HTTP_POOL_REQUESTS = metrics.gauge(
+    "ordo_http_pool_requests_in_flight",
+    "Requests in flight or waiting for a connection, per broker HTTP pool.",
+    ("broker",),
+)
+HTTP_POOL_MAX_CONNECTIONS = metrics.gauge(
+    "ordo_http_pool_max_connections",
+    "Connection limit of each broker's HTTP pool.",
+    ("broker",),
+    merge="max",
+)
+CACHE_LOOKUPS = metrics.counter(
+    "ordo_read_cache_lookups_total", "Read-cache lookups, by result.", ("result",)
+)
+CACHE_HIT_RATIO = metrics.gauge(
+    "ordo_read_cache_hit_ratio",
+    "Share of read-cache lookups served from the cache.",
+    merge="all",
+)
+SESSION_CACHE_LOOKUPS = metrics.counter(
+    "ordo_session_cache_lookups_total",
+    "Decrypted-session cache lookups per adapter, by result.",
+    ("adapter", "result"),
+)
+SESSION_CACHE_ENTRIES = metrics.gauge(
+    "ordo_session_cache_entries",
+    "Decrypted session values cached per adapter.",
+    ("adapter",),
+)
+SINGLE_FLIGHT_CALLS = metrics.counter(
+    "ordo_single_flight_calls_total",
+    "Reads that started a broker call (leader) or joined one (coalesced).",
+    ("method", "role"),
+)
+CIRCUIT_STATE = metrics.gauge(
+    "ordo_circuit_breaker_state",
+    "1 for the current state of each adapter's circuit breaker.",
+    ("adapter", "state"),
+    merge="max",
+)
+BROKER_RETRIES = metrics.counter(
+    "ordo_broker_retries_total",
+    "Retries of broker calls, by the error that prompted them.",
+    ("broker", "method", "reason"),
+)
+BROKER_RETRY_GIVE_UPS = metrics.counter(
+    "ordo_broker_retry_give_ups_total",
+    "Retried broker calls that failed in the end, by why retrying stopped.",
+    ("broker", "method", "reason"),
+)
+RATE_LIMIT_QUEUE_DEPTH = metrics.gauge(
+    "ordo_broker_rate_limit_queue_depth",
+    "Calls waiting for a broker rate-limit token.",
+    ("bucket",),
+)
+EDGE_REQUESTS = metrics.counter(
+    "ordo_edge_requests_total",
+    "API requests per client, by edge quota decision.",
+    ("client", "decision"),
+)
+EDGE_IN_FLIGHT = metrics.gauge(
+    "ordo_edge_requests_in_flight", "API requests in flight per client.", ("client",)
+)
+LOOP_LAG_LAST = metrics.gauge(
+    "ordo_event_loop_lag_last_seconds",
+    "The most recent event-loop lag sample.",
+    merge="max",
+)
+KILL_SWITCH_ACTIVE = metrics.gauge(
+    "ordo_kill_switch_active", "1 while the kill-switch is active.", merge="max"
+)
+PARSE_CALLS = metrics.counter(
+    "ordo_parse_calls_total",
+    "Broker responses parsed, by where: inline, thread or process.",
+    ("mode",),
+)
+PARSE_IN_FLIGHT = metrics.gauge(
+    "ordo_parse_pool_in_flight",
+    "Parses running or queued in each parse pool.",
+    ("pool",),
+)
+PARSE_WORKERS = metrics.gauge(
+    "ordo_parse_pool_workers", "Workers in each parse pool.", ("pool",), merge="max"
+)
+AUDIT_RECORDS = metrics.counter(
+    "ordo_audit_records_total", "Audit records, by fate.", ("fate",)
+)
+
+
+def collect_service_stats():
+    """Copies the components' own counters into the metrics."""
+    for broker, pool in http_clients.stats().items():
+        HTTP_POOL_MAX_CONNECTIONS.set(pool["max_connections"], broker)
+        if "connections" not in pool:
+            continue
+        HTTP_POOL_CONNECTIONS.set(pool["active"], broker, "active")
+        HTTP_POOL_CONNECTIONS.set(pool["idle"], broker, "idle")
+        HTTP_POOL_REQUESTS.set(pool["requests_in_flight"], broker)
+
+    cache = read_cache.stats()
+    CACHE_LOOKUPS.set(cache["hits"], "hit")
+    CACHE_LOOKUPS.set(cache["misses"], "miss")
+    CACHE_HIT_RATIO.set(cache["hit_ratio"])
+
+    for adapter, session_cache in adapter_registry.session_cache_stats().items():
+        SESSION_CACHE_LOOKUPS.set(session_cache["hits"], adapter, "hit")
+        SESSION_CACHE_LOOKUPS.set(session_cache["misses"], adapter, "miss")
+        SESSION_CACHE_ENTRIES.set(session_cache["size"], adapter)
+
+    for method, counts in single_flight.stats()["methods"].items():
+        SINGLE_FLIGHT_CALLS.set(counts["calls"], method, "leader")
+        SINGLE_FLIGHT_CALLS.set(counts["coalesced"], method, "coalesced")
+
+    for adapter_id, breaker in circuit_breakers.stats().items():
+        for state in (CLOSED, OPEN, HALF_OPEN):
+            CIRCUIT_STATE.set(int(breaker["state"] == state), adapter_id, state)
+
+    for (broker, method, reason), count in retries.attempts.items():
+        # "attempt" counts every call, first attempts included.
+        if reason != "attempt":
+            BROKER_RETRIES.set(count, broker, method, reason)
+    for (broker, method, reason), count in retries.outcomes.items():
+        BROKER_RETRY_GIVE_UPS.set(count, broker, method, reason)
+
+    for bucket, limits in rate_limiter.stats().items():
+        RATE_LIMIT_QUEUE_DEPTH.set(limits["queue_depth"], bucket)
+
+    for client_id, quota in edge_limiter.stats().items():
+        EDGE_REQUESTS.set(quota["admitted"], client_id, "admitted")
+        EDGE_REQUESTS.set(quota["rejected"], client_id, "rejected")
+        EDGE_IN_FLIGHT.set(quota["in_flight"], client_id)
+
+    parsing = parse_pool.stats()
+    for mode, calls in parsing["calls"].items():
+        PARSE_CALLS.set(calls, mode)
+    for pool, usage in parsing["pools"].items():
+        PARSE_IN_FLIGHT.set(usage["in_flight"], pool)
+        PARSE_WORKERS.set(usage["workers"], pool)
+
+    LOOP_LAG_LAST.set(loop_monitor.last_lag)
+    KILL_SWITCH_ACTIVE.set(int(kill_switch.active))
+
+    audit = audit_log.stats()
+    for fate in ("written", "sampled_out", "dropped"):
+        AUDIT_RECORDS.set(audit[fate], fate)
+
+
+metrics.add_collector(collect_service_stats)
+
+
+@router.get("/metrics", summary="Prometheus metrics", include_in_schema=False)
+async def get_metrics():
+    return Response(content=await metrics.scrape(), media_type=CONTENT_TYPE)
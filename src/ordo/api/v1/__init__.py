@@ -0,0 +1,24 @@
+from fastapi import APIRouter
+
+from ordo.api.v1.endpoints import (
+    brokers,
+    diagnostics,
+    killswitch,
+    orchestrator,
+    orders,
+    status,
+    stream,
+    tokens,
+    traces,
+)
+
+api_router = APIRouter(prefix="/api/v1")
+api_router.include_router(status.router)
+api_router.include_router(orchestrator.router)
+api_router.include_router(orders.router)
+api_router.include_router(killswitch.router)
+api_router.include_router(brokers.router)
+api_router.include_router(tokens.router)
+api_router.include_router(stream.router)
+api_router.include_router(traces.router)
+api_router.include_router(diagnostics.router)
@@ -0,0 +1,167 @@
+from typing import Optional
+
+from fastapi import APIRouter, Body, Depends, Path, Query
+from fastapi.responses import Response
+
+from ordo.api.v1.responses import error_response, unified_response
+from ordo.config import get_session_data
+from ordo.core.orchestrator import orchestrator
+from ordo.core.order_book import order_books
+from ordo.models.api.errors import ApiException
+from ordo.models.api.orchestrator import (
+    BrokerTarget,
+    ModifyOrderRequest,
+    UnifiedResponse,
+)
+from ordo.security.authentication import require_scope
+from ordo.security.tokens import TRADE
+
+# Single-broker routes. The session data comes from the credentials in
+# settings, adapters come from the shared registry, and results are rendered
+# by unified_response, so the per-request work is one parameter validation
+# and one serialization around the broker call.
+router = APIRouter(prefix="/brokers/{broker}", tags=["Brokers"])
+
+ACCOUNT_ID_QUERY = Query(None, description="The account to act on, if any.")
+ORDER_ID_PATH = Path(..., description="The broker's order identifier.")
+SINCE_QUERY = Query(
+    None,
+    ge=0,
+    description=(
+        "Return only the orders changed after this order-book version, as an "
+        "OrderBookDelta. Versions the server no longer has, or given without "
+        "the matching epoch, get the full book."
+    ),
+)
+EPOCH_QUERY = Query(
+    None,
+    description="The X-Order-Book-Epoch that the since version was read under.",
+)
+TRADE_SCOPE = [Depends(require_scope(TRADE))]
+
+
+def _target(broker: str, account_id: Optional[str]) -> BrokerTarget:
+    # Path and query parameters are already validated, so the model is built
+    # without running its validators a second time.
+    return BrokerTarget.model_construct(
+        broker=broker, account_id=account_id, session_data=get_session_data(broker)
+    )
+
+
+async def _read(operation: str, broker: str, account_id: Optional[str]):
+    return unified_response(
+        await orchestrator.fan_out(operation, [_target(broker, account_id)])
+    )
+
+
+@router.get(
+    "/orders",
+    response_model=UnifiedResponse,
+    summary="Order book for a broker account",
+    response_description=(
+        "The unified response, or an OrderBookDelta when since is given. "
+        "X-Order-Book-Version and X-Order-Book-Epoch identify the book's "
+        "current version."
+    ),
+)
+async def get_order_book(
+    broker: str,
+    account_id: Optional[str] = ACCOUNT_ID_QUERY,
+    since: Optional[int] = SINCE_QUERY,
+    epoch: Optional[str] = EPOCH_QUERY,
+):
+    book = order_books.book(broker, account_id)
+    sequence = book.fetch_sequence()
+    response = await orchestrator.fan_out(
+        "get_order_book", [_target(broker, account_id)]
+    )
+    result = response.results[0]
+    if result.status != "success":
+        return unified_response(response)
+
+    changes = book.apply(result.payload, sequence)
+    headers = {
+        "X-Order-Book-Version": str(book.version),
+        "X-Order-Book-Epoch": book.epoch,
+    }
+    if since is None:
+        rendered = unified_response(response)
+        # A poll overtaken by a newer one doesn't match the book's version.
+        if not changes.stale:
+            rendered.headers.update(headers)
+        return rendered
+    return Response(
+        content=book.since(since, epoch).model_dump_json(),
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+@router.get(
+    "/trades",
+    response_model=UnifiedResponse,
+    summary="Trade book for a broker account",
+)
+async def get_trade_book(broker: str, account_id: Optional[str] = ACCOUNT_ID_QUERY):
+    return await _read("get_trade_book", broker, account_id)
+
+
+@router.get(
+    "/holdings",
+    response_model=UnifiedResponse,
+    summary="Holdings for a broker account",
+)
+async def get_holdings(broker: str, account_id: Optional[str] = ACCOUNT_ID_QUERY):
+    return await _read("get_holdings", broker, account_id)
+
+
+@router.get(
+    "/positions",
+    response_model=UnifiedResponse,
+    summary="Open positions for a broker account",
+)
+async def get_positions(broker: str, account_id: Optional[str] = ACCOUNT_ID_QUERY):
+    return await _read("get_positions", broker, account_id)
+
+
+@router.patch(
+    "/orders/{order_id}",
+    response_model=UnifiedResponse,
+    summary="Modify an open order",
+    dependencies=TRADE_SCOPE,
+    response_description="The broker's result; 423 while the kill-switch is active",
+)
+async def modify_order(
+    broker: str,
+    order_id: str = ORDER_ID_PATH,
+    request: ModifyOrderRequest = Body(..., description="Order modification"),
+    account_id: Optional[str] = ACCOUNT_ID_QUERY,
+):
+    try:
+        response = await orchestrator.modify_order(
+            _target(broker, account_id),
+            order_id,
+            request.changes,
+            target_timeout=(
+                request.target_timeout_ms / 1000 if request.target_timeout_ms else None
+            ),
+        )
+    except ApiException as e:
+        return error_response(e)
+    return unified_response(response)
+
+
+@router.delete(
+    "/orders/{order_id}",
+    response_model=UnifiedResponse,
+    summary="Cancel an open order",
+    dependencies=TRADE_SCOPE,
+)
+async def cancel_order(
+    broker: str,
+    order_id: str = ORDER_ID_PATH,
+    account_id: Optional[str] = ACCOUNT_ID_QUERY,
+):
+    return unified_response(
+        await orchestrator.cancel_order(_target(broker, account_id), order_id)
+    )
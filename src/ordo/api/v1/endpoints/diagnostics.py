@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends, Query
+
+from ordo.core.loop_monitor import loop_monitor, slow_callbacks
+from ordo.security.authentication import require_scope
+from ordo.security.tokens import ADMIN
+
+router = APIRouter(
+    prefix="/diagnostics",
+    tags=["Status"],
+    dependencies=[Depends(require_scope(ADMIN))],
+)
+
+
+@router.get("/event-loop", summary="Event-loop lag and the callbacks that block it")
+async def get_event_loop(
+    limit: int = Query(20, ge=1, le=100, description="Hot spots to return."),
+):
+    return {
+        "lag": loop_monitor.stats(),
+        "slow_callbacks": slow_callbacks.stats(),
+        "hot_spots": slow_callbacks.top(limit),
+        "recent": list(reversed(slow_callbacks.events)),
+    }
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Body, Depends
+from pydantic import BaseModel, Field
+
+from ordo.core.kill_switch import kill_switch
+from ordo.security.authentication import require_scope
+from ordo.security.tokens import ADMIN
+
+router = APIRouter(
+    prefix="/killswitch",
+    tags=["Kill-Switch"],
+    dependencies=[Depends(require_scope(ADMIN))],
+)
+
+
+class KillSwitchRequest(BaseModel):
+    active: bool = Field(..., description="True halts all new order placement.")
+
+
+@router.get("", summary="Current kill-switch state")
+async def get_kill_switch():
+    return kill_switch.stats()
+
+
+@router.post("", summary="Enable or disable the global kill-switch")
+async def set_kill_switch(
+    request: KillSwitchRequest = Body(..., description="Kill-switch state"),
+):
+    kill_switch.set(request.active)
+    return kill_switch.stats()
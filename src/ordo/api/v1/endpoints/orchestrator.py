@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Body
+
+from ordo.api.v1.responses import unified_response
+from ordo.core.orchestrator import orchestrator
+from ordo.models.api.orchestrator import FanOutRequest, UnifiedResponse
+
+router = APIRouter(prefix="/fan-out", tags=["Orchestrator"])
+
+
+@router.post(
+    "",
+    response_model=UnifiedResponse,
+    summary="Run a read operation across several brokers concurrently",
+    response_description="Collated per-broker results; partial success returns 207",
+)
+async def fan_out(
+    request: FanOutRequest = Body(..., description="Fan-out request"),
+):
+    response = await orchestrator.fan_out(
+        request.operation,
+        request.targets,
+        target_timeout=(
+            request.target_timeout_ms / 1000 if request.target_timeout_ms else None
+        ),
+        deadline=request.deadline_ms / 1000 if request.deadline_ms else None,
+    )
+    return unified_response(response)
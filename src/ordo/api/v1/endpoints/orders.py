@@ -0,0 +1,133 @@
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import APIRouter, Body, Depends, Header
+from fastapi.responses import JSONResponse
+
+from ordo.api.v1.responses import STATUS_CODES, error_response
+from ordo.core.idempotency import (
+    NOT_SENT_CODES,
+    IdempotentResponse,
+    idempotency,
+    request_hash,
+)
+from ordo.core.kill_switch import kill_switch
+from ordo.core.orchestrator import orchestrator
+from ordo.models.api.errors import ApiException
+from ordo.models.api.orchestrator import (
+    BasketOrderRequest,
+    PlaceOrderRequest,
+    UnifiedResponse,
+)
+from ordo.security.authentication import require_scope
+from ordo.security.tokens import TRADE
+
+router = APIRouter(
+    prefix="/orders", tags=["Orders"], dependencies=[Depends(require_scope(TRADE))]
+)
+
+
+IDEMPOTENCY_KEY_HEADER = Header(
+    None,
+    alias="Idempotency-Key",
+    description="Repeat requests with the same key return the first response.",
+)
+
+
+def _unified(response: UnifiedResponse) -> IdempotentResponse:
+    return IdempotentResponse(
+        STATUS_CODES[response.overall_status],
+        response.model_dump(mode="json"),
+        replayable=any(
+            result.status != "failed" or result.code not in NOT_SENT_CODES
+            for result in response.results
+        ),
+    )
+
+
+async def _run_order_request(
+    idempotency_key: Optional[str],
+    payload: Any,
+    execute: Callable[[], Awaitable[IdempotentResponse]],
+) -> JSONResponse:
+    """
+    Runs an order request behind the kill-switch and, when a key is given,
+    the idempotency store. ``payload`` identifies the request for the key.
+    """
+    try:
+        # The kill-switch comes first, ahead of even idempotent replays.
+        kill_switch.check()
+        if not idempotency_key:
+            result = await execute()
+            return JSONResponse(status_code=result.status_code, content=result.body)
+        result, replayed = await idempotency.run(
+            idempotency_key, request_hash(payload), execute
+        )
+    except ApiException as e:
+        return error_response(e)
+    return JSONResponse(
+        status_code=result.status_code,
+        content=result.body,
+        headers={"Idempotent-Replayed": "true" if replayed else "false"},
+    )
+
+
+# Session data is left out of the idempotency payloads so a refreshed token
+# does not count as a different request.
+
+
+@router.post(
+    "",
+    response_model=UnifiedResponse,
+    summary="Place an order with one or more brokers",
+    response_description="Collated per-broker results; partial success returns 207",
+)
+async def place_order(
+    request: PlaceOrderRequest = Body(..., description="Order placement request"),
+    idempotency_key: Optional[str] = IDEMPOTENCY_KEY_HEADER,
+):
+    async def execute() -> IdempotentResponse:
+        return _unified(
+            await orchestrator.place_order(
+                request.targets,
+                request.order,
+                target_timeout=(
+                    request.target_timeout_ms / 1000
+                    if request.target_timeout_ms
+                    else None
+                ),
+            )
+        )
+
+    payload = {
+        "targets": [[t.broker, t.account_id] for t in request.targets],
+        "order": request.order,
+        "target_timeout_ms": request.target_timeout_ms,
+    }
+    return await _run_order_request(idempotency_key, payload, execute)
+
+
+@router.post(
+    "/basket",
+    response_model=UnifiedResponse,
+    summary="Place a basket of orders across brokers",
+    response_description="One result per leg, in request order",
+)
+async def place_basket(
+    request: BasketOrderRequest = Body(..., description="Basket order request"),
+    idempotency_key: Optional[str] = IDEMPOTENCY_KEY_HEADER,
+):
+    async def execute() -> IdempotentResponse:
+        return _unified(
+            await orchestrator.place_basket(
+                request.legs,
+                all_or_cancel=request.all_or_cancel,
+                deadline=request.deadline_ms / 1000 if request.deadline_ms else None,
+            )
+        )
+
+    payload = {
+        "legs": [[leg.broker, leg.account_id, leg.order] for leg in request.legs],
+        "all_or_cancel": request.all_or_cancel,
+        "deadline_ms": request.deadline_ms,
+    }
+    return await _run_order_request(idempotency_key, payload, execute)
@@ -0,0 +1,44 @@
+from fastapi import APIRouter
+
+from ordo.adapters.http_pool import http_clients
+from ordo.adapters.registry import adapter_registry
+from ordo.core.audit import audit_log
+from ordo.core.concurrency import parse_pool
+from ordo.core.kill_switch import kill_switch
+from ordo.core.loop_monitor import loop_monitor, slow_callbacks
+from ordo.core.order_book import order_books
+from ordo.core.order_stream import order_stream
+from ordo.core.pipeline import (
+    circuit_breakers,
+    rate_limiter,
+    read_cache,
+    retries,
+    single_flight,
+)
+from ordo.core.tracing import tracing
+from ordo.security.edge_limit import edge_limiter
+
+router = APIRouter(prefix="/status", tags=["Status"])
+
+
+@router.get("", summary="Service and broker connectivity status")
+async def get_status():
+    return {
+        "status": "ok",
+        "kill_switch": kill_switch.stats(),
+        "http_pools": http_clients.stats(),
+        "circuit_breakers": circuit_breakers.stats(),
+        "rate_limits": rate_limiter.stats(),
+        "retries": retries.stats(),
+        "read_cache": read_cache.stats(),
+        "session_caches": adapter_registry.session_cache_stats(),
+        "single_flight": single_flight.stats(),
+        "order_streams": order_stream.stats(),
+        "order_books": order_books.stats(),
+        "edge_limits": edge_limiter.stats(),
+        "audit_log": audit_log.stats(),
+        "event_loop": loop_monitor.stats(),
+        "slow_callbacks": slow_callbacks.stats(),
+        "parse_pool": parse_pool.stats(),
+        "tracing": tracing.stats(),
+    }
@@ -0,0 +1,87 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from ordo.api.v1.responses import error_response
+from ordo.config import settings
+from ordo.core.order_stream import Subscription, order_stream
+from ordo.models.api.errors import ApiError, ApiException
+
+router = APIRouter(prefix="/stream/{broker}", tags=["Streaming"])
+
+ACCOUNT_ID_QUERY = Query(None, description="The account to follow, if any.")
+
+
+def sse_event(event: Dict[str, Any]) -> str:
+    """Formats an event as a server-sent event named after its type."""
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+async def _sse(subscription: Subscription) -> AsyncIterator[str]:
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(), settings.STREAM_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                # Comment lines keep proxies from closing an idle stream.
+                yield ": keep-alive\n\n"
+                continue
+            if event is None:
+                return
+            yield sse_event(event)
+    finally:
+        subscription.close()
+
+
+@router.get(
+    "",
+    summary="Order and trade updates as server-sent events",
+    response_description="A text/event-stream of order, trade and error events",
+)
+async def stream_updates(broker: str, account_id: Optional[str] = ACCOUNT_ID_QUERY):
+    try:
+        subscription = order_stream.subscribe(broker, account_id)
+    except ValueError as e:
+        return error_response(
+            ApiException(ApiError(error_code="INVALID_REQUEST", message=str(e)))
+        )
+    return StreamingResponse(
+        _sse(subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def stream_updates_ws(
+    websocket: WebSocket, broker: str, account_id: Optional[str] = None
+):
+    try:
+        subscription = order_stream.subscribe(broker, account_id)
+    except ValueError as e:
+        await websocket.close(code=1008, reason=str(e))
+        return
+    await websocket.accept()
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(), settings.STREAM_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                # Sending fails once the client has gone, which ends the loop.
+                await websocket.send_json({"type": "heartbeat"})
+                continue
+            if event is None:
+                await websocket.close()
+                return
+            await websocket.send_json(event)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        subscription.close()
@@ -0,0 +1,71 @@
+from typing import List, Literal
+
+from fastapi import APIRouter, Body, Depends, Path, status
+from fastapi.responses import Response
+from pydantic import BaseModel, Field
+
+from ordo.api.v1.responses import error_response
+from ordo.models.api.errors import ApiError, ApiException
+from ordo.security.authentication import require_scope
+from ordo.security.tokens import ADMIN, token_index
+
+router = APIRouter(
+    prefix="/tokens",
+    tags=["API Tokens"],
+    dependencies=[Depends(require_scope(ADMIN))],
+)
+
+
+class IssueTokenRequest(BaseModel):
+    client_id: str = Field(
+        ..., min_length=1, max_length=64, description="Name of the API client."
+    )
+    scopes: List[Literal["read", "trade", "admin"]] = Field(
+        ..., min_length=1, description="Granted scopes; trade implies read."
+    )
+
+
+class IssueTokenResponse(BaseModel):
+    client_id: str
+    scopes: List[str]
+    token: str = Field(..., description="Shown once; only its hash is stored.")
+
+
+@router.get("", summary="List API clients and their scopes")
+async def list_tokens():
+    return token_index.clients()
+
+
+@router.post(
+    "",
+    response_model=IssueTokenResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Issue or rotate the API token of a client",
+)
+async def issue_token(
+    request: IssueTokenRequest = Body(..., description="Client and scopes"),
+):
+    try:
+        token = token_index.issue(request.client_id, request.scopes)
+    except ValueError as e:
+        return error_response(
+            ApiException(ApiError(error_code="INVALID_REQUEST", message=str(e)))
+        )
+    return IssueTokenResponse(
+        client_id=request.client_id, scopes=sorted(set(request.scopes)), token=token
+    )
+
+
+@router.delete(
+    "/{client_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Revoke the API token of a client",
+)
+async def revoke_token(client_id: str = Path(..., description="Name of the client")):
+    if not token_index.revoke(client_id):
+        return error_response(
+            ApiException(
+                ApiError(error_code="NOT_FOUND", message=f"No client {client_id}.")
+            )
+        )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, Path, Query
+
+from ordo.core.tracing import span_buffer
+from ordo.models.api.errors import ApiError, ApiException
+from ordo.security.authentication import require_scope
+from ordo.security.tokens import ADMIN
+
+router = APIRouter(
+    prefix="/traces",
+    tags=["Status"],
+    dependencies=[Depends(require_scope(ADMIN))],
+)
+
+
+@router.get("", summary="Recently sampled traces, newest first")
+async def list_traces(
+    limit: int = Query(50, ge=1, le=1000, description="Traces to return."),
+):
+    return span_buffer.traces(limit)
+
+
+@router.get("/{trace_id}", summary="Spans of one trace, in start order")
+async def get_trace(
+    trace_id: str = Path(..., description="The trace (correlation) id."),
+):
+    spans = span_buffer.trace(trace_id)
+    if not spans:
+        raise ApiException(
+            ApiError(
+                error_code="NOT_FOUND",
+                message=f"Trace '{trace_id}' was not sampled or has been evicted.",
+            )
+        )
+    return spans
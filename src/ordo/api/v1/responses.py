@@ -0,0 +1,86 @@
+import math
+
+from fastapi import status
+from fastapi.responses import JSONResponse, Response
+
+from ordo.core.audit import current_correlation_id
+from ordo.core.tracing import tracing
+from ordo.models.api.errors import ApiException
+from ordo.models.api.orchestrator import UnifiedResponse
+
+# HTTP status for each UnifiedResponse.overall_status.
+STATUS_CODES = {
+    "success": status.HTTP_200_OK,
+    "partial_success": status.HTTP_207_MULTI_STATUS,
+    "failure": status.HTTP_503_SERVICE_UNAVAILABLE,
+}
+
+# HTTP status for each ApiError.error_code. Transient and upstream failures
+# get 429/5xx so clients back off and retry instead of fixing their request;
+# other codes are the client's to fix and default to 400.
+ERROR_STATUS_CODES = {
+    "UNAUTHORIZED": status.HTTP_401_UNAUTHORIZED,
+    "FORBIDDEN": status.HTTP_403_FORBIDDEN,
+    "NOT_FOUND": status.HTTP_404_NOT_FOUND,
+    "KILL_SWITCH_ACTIVE": status.HTTP_423_LOCKED,
+    "IDEMPOTENCY_KEY_IN_PROGRESS": status.HTTP_409_CONFLICT,
+    "IDEMPOTENCY_KEY_MISMATCH": 422,
+    "RATE_LIMITED": status.HTTP_429_TOO_MANY_REQUESTS,
+    "CB_OPEN": status.HTTP_503_SERVICE_UNAVAILABLE,
+    "DEADLINE_EXCEEDED": status.HTTP_504_GATEWAY_TIMEOUT,
+}
+# Codes starting with this are failures reported by or on the way to a broker.
+BROKER_ERROR_PREFIX = "BROKER_"
+
+
+def error_status_code(error_code: str) -> int:
+    status_code = ERROR_STATUS_CODES.get(error_code)
+    if status_code is not None:
+        return status_code
+    if error_code.startswith(BROKER_ERROR_PREFIX):
+        return status.HTTP_502_BAD_GATEWAY
+    return status.HTTP_400_BAD_REQUEST
+
+
+def error_response(exc: ApiException) -> JSONResponse:
+    """
+    Renders an ApiException as its ApiError JSON body. An error that was not
+    given a correlation id carries the request's, which is also its trace id.
+    """
+    content = exc.error.model_dump(mode="json")
+    correlation_id = current_correlation_id()
+    if correlation_id and "correlation_id" not in exc.error.model_fields_set:
+        content["correlation_id"] = correlation_id
+    headers = {}
+    details = exc.error.details
+    if isinstance(details, dict) and details.get("retry_after_seconds") is not None:
+        headers["Retry-After"] = str(max(1, math.ceil(details["retry_after_seconds"])))
+    return JSONResponse(
+        status_code=error_status_code(exc.error.error_code),
+        content=content,
+        headers=headers,
+    )
+
+
+def unified_response(response: UnifiedResponse) -> Response:
+    """
+    Renders a UnifiedResponse with its status code for overall_status.
+
+    The model is serialized straight to JSON bytes by pydantic-core, skipping
+    the dict round trip and FastAPI's response_model re-validation. Results
+    served from cache set an ``Age`` header with the oldest entry's age.
+    """
+    with tracing.span("response.serialize"):
+        content = response.model_dump_json()
+    headers = {}
+    cache_ages = [
+        r.cache_age_ms for r in response.results if r.cache_age_ms is not None
+    ]
+    if cache_ages:
+        headers["Age"] = str(max(cache_ages) // 1000)
+    return Response(
+        content=content,
+        status_code=STATUS_CODES[response.overall_status],
+        headers=headers,
+        media_type="application/json",
+    )
@@ -1,7 +1,7 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional
+from typing import Any, Dict, Optional
 from ordo.adapters.base import IBrokerAdapter
-from ordo.adapters.mock import MockAdapter
+from ordo.adapters.registry import adapter_registry
 
 
 class Settings(BaseSettings):
@@ -22,25 +22,173 @@ class Settings(BaseSettings):
     HDFC_PASSWORD: Optional[str] = None
     HDFC_API_SECRET: Optional[str] = None
 
+    # Shared broker HTTP client pool
+    HTTP_MAX_CONNECTIONS: int = 20
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_TIMEOUT_SECONDS: float = 8.0
+    HTTP2_ENABLED: bool = False
+
+    # Session persistence ("memory" or "sqlite")
+    SESSION_STORE: str = "memory"
+    DATABASE_PATH: str = "ordo.db"
+    SESSION_CACHE_SIZE: int = 1024
+    SESSION_ACCESS_TOKEN_TTL_HOURS: float = 24.0
+    SESSION_DECRYPT_CACHE_SIZE: int = 256
+    SESSION_DECRYPT_CACHE_TTL_SECONDS: float = 60.0
+
+    # Request orchestrator
+    ORCHESTRATOR_TARGET_TIMEOUT_SECONDS: float = 8.0
+    ORCHESTRATOR_DEADLINE_SECONDS: float = 12.0
+
+    # Read-through cache TTLs per adapter method; 0 disables caching.
+    CACHE_TTL_SECONDS: Dict[str, float] = {
+        "get_profile": 300.0,
+        "get_portfolio": 2.0,
+        "get_holdings": 2.0,
+        "get_positions": 0.5,
+        "get_order_book": 0.0,
+        "get_trade_book": 0.0,
+    }
+
+    # Read methods whose identical concurrent calls share one broker request.
+    SINGLE_FLIGHT_METHODS: Dict[str, bool] = {
+        "get_profile": True,
+        "get_portfolio": True,
+        "get_holdings": True,
+        "get_positions": True,
+        "get_order_book": True,
+        "get_trade_book": True,
+    }
+
+    # Order/trade update streams: one shared book poller per account
+    STREAM_POLL_INTERVAL_SECONDS: float = 1.0
+    STREAM_QUEUE_SIZE: int = 100
+    STREAM_HEARTBEAT_SECONDS: float = 15.0
+
+    # Change-log entries kept per order book for ?since=<version> deltas
+    ORDER_BOOK_LOG_SIZE: int = 10000
+
+    # Broker rate limits (FR23): token-bucket refill rate (calls per second)
+    # and burst, per broker and api_key. Brokers not listed are unlimited.
+    BROKER_RATE_LIMITS: Dict[str, Dict[str, float]] = {
+        "fyers": {"rate": 10.0, "burst": 10.0},
+        "hdfc": {"rate": 10.0, "burst": 10.0},
+    }
+    RATE_LIMIT_MAX_QUEUE_DEPTH: int = 100
+    RATE_LIMIT_MAX_WAIT_SECONDS: float = 5.0
+
+    # Per-adapter circuit breakers; state is persisted to "memory" or "sqlite"
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_BREAKER_WINDOW_SECONDS: float = 60.0
+    CIRCUIT_BREAKER_RESET_SECONDS: float = 120.0
+    CIRCUIT_BREAKER_STORE: str = "memory"
+
+    # Retries for transient broker errors (exponential backoff, full jitter)
+    RETRY_MAX_ATTEMPTS: int = 3
+    RETRY_BASE_DELAY_SECONDS: float = 0.5
+    RETRY_BACKOFF_MULTIPLIER: float = 2.0
+    RETRY_MAX_DELAY_SECONDS: float = 4.0
+    RETRY_BUDGET_RATIO: float = 0.2
+    RETRY_BUDGET_MAX_TOKENS: float = 10.0
+
+    # Idempotency-Key records ("memory" or "sqlite")
+    IDEMPOTENCY_STORE: str = "memory"
+    IDEMPOTENCY_TTL_HOURS: float = 24.0
+    IDEMPOTENCY_SWEEP_INTERVAL_SECONDS: float = 300.0
+
+    # Global kill-switch ("memory" or "sqlite"); workers poll for toggles
+    KILL_SWITCH_STORE: str = "memory"
+    KILL_SWITCH_POLL_INTERVAL_SECONDS: float = 0.5
+
+    # Hashed per-client API tokens ("memory" or "sqlite"), in addition to
+    # ORDO_API_TOKEN, which acts as the admin client "default".
+    API_TOKEN_STORE: str = "memory"
+    API_TOKEN_POLL_INTERVAL_SECONDS: float = 1.0
+
+    # Per-client quotas at the API edge: requests per second, burst and
+    # concurrent requests, with overrides keyed by API client id.
+    EDGE_RATE_LIMIT_RPS: float = 50.0
+    EDGE_RATE_LIMIT_BURST: float = 100.0
+    EDGE_MAX_IN_FLIGHT: int = 32
+    EDGE_CLIENT_LIMITS: Dict[str, Dict[str, float]] = {}
+
+    # Audit log (FR19, FR22): NDJSON segments in AUDIT_LOG_DIR, written in
+    # batches off the event loop and rotated by size or age. Past the high
+    # water mark of the queue, routine records are sampled; writes are not.
+    AUDIT_LOG_ENABLED: bool = True
+    AUDIT_LOG_DIR: str = "audit"
+    AUDIT_QUEUE_SIZE: int = 10000
+    AUDIT_BATCH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_ROTATE_MAX_BYTES: int = 64 * 1024 * 1024
+    AUDIT_ROTATE_MAX_AGE_SECONDS: float = 86400.0
+    AUDIT_COMPRESS_ROTATED: bool = True
+    AUDIT_SAMPLING_HIGH_WATER: float = 0.8
+    AUDIT_SAMPLE_RATE: float = 0.1
+
+    # Prometheus metrics at /metrics. With a multiprocess directory set, each
+    # worker writes snapshots there and a scrape of any worker reports all.
+    METRICS_MULTIPROC_DIR: Optional[str] = None
+    METRICS_SNAPSHOT_INTERVAL_SECONDS: float = 5.0
+    LOOP_LAG_SAMPLE_INTERVAL_SECONDS: float = 0.5
+
+    # Broker responses of at least PARSE_INLINE_MAX_BYTES are parsed in a
+    # thread pool, and those of at least PARSE_PROCESS_MIN_BYTES in a process
+    # pool when PARSE_PROCESS_WORKERS is above 0.
+    PARSE_INLINE_MAX_BYTES: int = 64 * 1024
+    PARSE_THREAD_WORKERS: int = 4
+    PARSE_PROCESS_MIN_BYTES: int = 4 * 1024 * 1024
+    PARSE_PROCESS_WORKERS: int = 0
+
+    # Slow-callback detection: a watchdog thread samples the loop thread's
+    # stack whenever the loop is held longer than the threshold.
+    SLOW_CALLBACK_DETECTION_ENABLED: bool = True
+    SLOW_CALLBACK_THRESHOLD_SECONDS: float = 0.1
+    SLOW_CALLBACK_HISTORY: int = 100
+
+    # Tracing: the share of requests traced, the spans kept in memory for
+    # /api/v1/traces, and an optional NDJSON file every span is appended to.
+    TRACING_ENABLED: bool = True
+    TRACE_SAMPLE_RATE: float = 0.05
+    TRACE_BUFFER_SPANS: int = 5000
+    TRACE_EXPORT_PATH: Optional[str] = None
+    TRACE_FLUSH_INTERVAL_SECONDS: float = 1.0
+
 
 settings = Settings()
 
 
-def get_adapter(broker: Optional[str] = None) -> IBrokerAdapter:
-    adapter_name = broker or settings.BROKER_ADAPTER
-    if adapter_name == "mock":
-        return MockAdapter()
-    if adapter_name == "fyers":
-        from ordo.adapters.fyers import (
-            FyersAdapter,
-        )  # Local import to break circular dependency
-
-        return FyersAdapter()
-    if adapter_name == "hdfc":
-        from ordo.adapters.hdfc import (
-            HDFCAdapter,
-        )  # Local import to break circular dependency
-
-        return HDFCAdapter()
-    # Add other adapters here as they are implemented
-    raise ValueError(f"Unknown adapter: {adapter_name}")
+def get_adapter(
+    broker: Optional[str] = None, account_id: Optional[str] = None
+) -> IBrokerAdapter:
+    """
+    Returns the shared adapter instance for a broker (and optionally an account).
+
+    Instances come from the process-wide adapter registry, so repeated calls
+    reuse the same adapter and its session state instead of building a new one.
+    """
+    return adapter_registry.get(broker or settings.BROKER_ADAPTER, account_id)
+
+
+def get_session_data(broker: str) -> Dict[str, Any]:
+    """
+    Returns session data carrying the broker credentials configured in
+    settings, for routes whose requests do not supply their own.
+    """
+    if broker == "fyers":
+        credentials = {
+            "app_id": settings.FYERS_APP_ID,
+            "secret_id": settings.FYERS_SECRET_ID,
+            "redirect_uri": settings.FYERS_REDIRECT_URI,
+        }
+    elif broker == "hdfc":
+        credentials = {
+            "api_key": settings.HDFC_API_KEY,
+            "username": settings.HDFC_USERNAME,
+            "password": settings.HDFC_PASSWORD,
+            "apiSecret": settings.HDFC_API_SECRET,
+        }
+    else:
+        credentials = {}
+    return {"credentials": credentials}
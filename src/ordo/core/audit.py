@@ -0,0 +1,398 @@
+"""Append-only audit log of API requests and broker calls (FR19, FR22)."""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import random
+import shutil
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
+
+from pydantic import BaseModel
+
+from ordo.adapters.interceptors import AdapterCall, AdapterInterceptor, Proceed
+from ordo.config import settings
+from ordo.models.api.errors import ApiException
+from ordo.security.tokens import current_client
+
+logger = logging.getLogger(__name__)
+
+MASK = "***"
+
+# Keys whose values are masked wherever they appear, compared lower-cased
+# with "_" and "-" removed: secrets by substring, PII by exact name.
+SECRET_MARKERS = ("token", "secret", "password", "apikey", "otp", "pin", "authcode")
+PII_KEYS = frozenset(
+    {
+        "credentials",
+        "authorization",
+        "cookie",
+        "username",
+        "loginid",
+        "clientid",
+        "email",
+        "mobile",
+        "mobileno",
+        "phone",
+        "pan",
+        "dob",
+        "aadhaar",
+        "answer",
+    }
+)
+
+CORRELATION_HEADER = b"x-correlation-id"
+
+_correlation_id: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
+
+
+@contextmanager
+def correlation_scope(correlation_id: Optional[str]) -> Iterator[None]:
+    """Marks work done within the scope as part of one request."""
+    token = _correlation_id.set(correlation_id)
+    try:
+        yield
+    finally:
+        _correlation_id.reset(token)
+
+
+def current_correlation_id() -> Optional[str]:
+    """Returns the correlation id of the request being handled, if any."""
+    return _correlation_id.get()
+
+
+def request_correlation_id(headers) -> str:
+    """
+    Returns the caller's ``X-Correlation-ID`` if it is a UUID (the type of
+    ``ApiError.correlation_id``), or a new one.
+    """
+    for name, value in headers:
+        if name == CORRELATION_HEADER:
+            try:
+                return str(uuid.UUID(value.decode("latin-1")))
+            except ValueError:
+                break
+    return str(uuid.uuid4())
+
+
+@lru_cache(maxsize=1024)
+def is_sensitive(key: str) -> bool:
+    normalized = key.lower().replace("_", "").replace("-", "")
+    return normalized in PII_KEYS or any(m in normalized for m in SECRET_MARKERS)
+
+
+def mask(value: Any) -> Any:
+    """
+    Returns a copy of ``value`` with the values of sensitive keys replaced by
+    ``***`` at any depth. Models are dumped to JSON-ready dicts first.
+    """
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json")
+    if isinstance(value, dict):
+        return {
+            key: MASK if is_sensitive(str(key)) else mask(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [mask(item) for item in value]
+    return value
+
+
+class AuditLog:
+    """
+    Audit records go through a bounded queue to a background writer, so
+    recording one is a dict build and a ``put_nowait`` and never waits on
+    disk.
+
+    The writer takes up to ``batch_size`` records at a time, at most once
+    per ``flush_interval`` seconds unless batches are full, and appends each
+    batch to ``audit-<pid>.ndjson`` in ``directory`` from a worker thread,
+    one JSON object per line. A segment is rotated to a timestamped name
+    (gzipped if ``compress``) once it reaches ``max_bytes`` or is
+    ``max_age`` seconds old.
+
+    Once the queue is ``high_water`` full, routine records are sampled at
+    ``sample_rate``; critical ones (writes) are always kept while there is
+    room. A full queue drops the record and counts it rather than blocking
+    the caller.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_age: float = 86400.0,
+        compress: bool = True,
+        high_water: float = 0.8,
+        sample_rate: float = 0.1,
+        enabled: bool = True,
+    ):
+        self.directory = directory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.compress = compress
+        self.sample_rate = sample_rate
+        self.enabled = enabled
+        self._queue: asyncio.Queue = asyncio.Queue(queue_size)
+        self._high_water = int(queue_size * high_water)
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+        self._opened_at = 0.0
+        self.accepted = 0
+        self.sampled_out = 0
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+        self.rotations = 0
+        self.write_errors = 0
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, f"audit-{os.getpid()}.ndjson")
+
+    def record(
+        self,
+        component: str,
+        action: str,
+        outcome: Any = None,
+        payload: Optional[Dict[str, Any]] = None,
+        critical: bool = False,
+        client_id: Optional[str] = None,
+    ) -> bool:
+        """
+        Queues one record, masked; returns False if it was not kept. The
+        client defaults to the one of the request being handled.
+        """
+        if not self.enabled:
+            return False
+        if (
+            not critical
+            and self._queue.qsize() >= self._high_water
+            and random.random() >= self.sample_rate
+        ):
+            self.sampled_out += 1
+            return False
+        if client_id is None:
+            client = current_client()
+            client_id = client.client_id if client else None
+        entry = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "correlation_id": current_correlation_id(),
+            "client_id": client_id,
+            "component": component,
+            "action": action,
+            "outcome": outcome,
+            "payload": mask(payload) if payload else None,
+        }
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            if not self.dropped:
+                logger.warning("Audit queue is full; dropping audit records")
+            self.dropped += 1
+            return False
+        self.accepted += 1
+        return True
+
+    async def run(self):
+        """Writes queued records in batches until cancelled."""
+        # A queue is bound to the first loop that waits on it, so each writer
+        # starts on a fresh one, carrying over anything recorded before it.
+        queue: asyncio.Queue = asyncio.Queue(self._queue.maxsize)
+        while not self._queue.empty():
+            queue.put_nowait(self._queue.get_nowait())
+        self._queue = queue
+        while True:
+            self._pending.append(await self._queue.get())
+            self._drain()
+            await self._write_pending()
+            if self._queue.qsize() < self.batch_size:
+                # Let the next batch build up instead of writing one by one.
+                await asyncio.sleep(self.flush_interval)
+
+    async def flush(self):
+        """Writes everything queued so far, e.g. on shutdown."""
+        while not self._queue.empty():
+            self._drain()
+            await self._write_pending()
+
+    def _drain(self):
+        while len(self._pending) < self.batch_size and not self._queue.empty():
+            self._pending.append(self._queue.get_nowait())
+
+    async def _write_pending(self):
+        batch, self._pending = self._pending, []
+        if batch:
+            await asyncio.to_thread(self._write, batch)
+
+    def _write(self, batch: List[Dict[str, Any]]):
+        data = "".join(
+            json.dumps(entry, default=str, separators=(",", ":")) + "\n"
+            for entry in batch
+        ).encode()
+        with self._lock:
+            try:
+                self._rotate_if_due()
+                with open(self.path, "ab") as f:
+                    f.write(data)
+            except OSError:
+                self.write_errors += 1
+                logger.exception("Failed to write %d audit records", len(batch))
+                return
+            self._size += len(data)
+            self.written += len(batch)
+            self.batches += 1
+
+    def _rotate_if_due(self):
+        now = time.time()
+        if self._size is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+            self._opened_at = now
+        if not self._size or (
+            self._size < self.max_bytes and now - self._opened_at < self.max_age
+        ):
+            return
+
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        rotated = os.path.join(self.directory, f"audit-{os.getpid()}-{stamp}.ndjson")
+        os.replace(self.path, rotated)
+        self._size = 0
+        self._opened_at = now
+        self.rotations += 1
+        if self.compress:
+            with open(rotated, "rb") as src, gzip.open(rotated + ".gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(rotated)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "queued": self._queue.qsize(),
+            "capacity": self._queue.maxsize,
+            "accepted": self.accepted,
+            "sampled_out": self.sampled_out,
+            "dropped": self.dropped,
+            "written": self.written,
+            "batches": self.batches,
+            "rotations": self.rotations,
+            "write_errors": self.write_errors,
+        }
+
+
+class AuditInterceptor(AdapterInterceptor):
+    """
+    Records every adapter call that gets past the read cache and
+    single-flight, i.e. each logical broker request, with its outcome and
+    masked arguments. Writes are critical and never sampled.
+    """
+
+    def __init__(self, log: AuditLog):
+        self._log = log
+
+    async def __call__(self, call: AdapterCall, proceed: Proceed) -> Any:
+        start = time.perf_counter()
+        outcome = "cancelled"
+        try:
+            result = await proceed()
+            outcome = "success"
+            return result
+        except ApiException as e:
+            outcome = e.error.error_code
+            raise
+        except Exception as e:
+            outcome = type(e).__name__
+            raise
+        finally:
+            self._log.record(
+                "adapter",
+                call.method,
+                outcome,
+                {
+                    "broker_id": call.broker_id,
+                    "account_id": call.account_id,
+                    "elapsed_ms": int((time.perf_counter() - start) * 1000),
+                    "session_data": call.session_data,
+                    "args": call.args[1:],
+                    "kwargs": {
+                        k: v for k, v in call.kwargs.items() if k != "session_data"
+                    },
+                },
+                critical=call.is_write,
+            )
+
+
+class AuditMiddleware:
+    """
+    Pure ASGI middleware that records every HTTP request with its status,
+    client and duration. It runs outermost, so rejected requests are
+    recorded too, and puts the request's correlation id (see
+    :func:`request_correlation_id`) in scope for everything the request
+    does, whether or not auditing is enabled. Bodies are not read; requests
+    other than GET and HEAD are critical.
+    """
+
+    def __init__(self, app, log: Optional[AuditLog] = None):
+        self.app = app
+        self._log = log or audit_log
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        correlation_id = request_correlation_id(scope["headers"])
+        if not self._log.enabled:
+            with correlation_scope(correlation_id):
+                await self.app(scope, receive, send)
+            return
+
+        status = None
+        start = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        with correlation_scope(correlation_id):
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                client = scope.get("state", {}).get("client")
+                self._log.record(
+                    "api",
+                    f"{scope['method']} {scope['path']}",
+                    status,
+                    {"elapsed_ms": int((time.perf_counter() - start) * 1000)},
+                    critical=scope["method"] not in ("GET", "HEAD"),
+                    client_id=client.client_id if client else None,
+                )
+
+
+audit_log = AuditLog(
+    directory=settings.AUDIT_LOG_DIR,
+    queue_size=settings.AUDIT_QUEUE_SIZE,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+    max_bytes=settings.AUDIT_ROTATE_MAX_BYTES,
+    max_age=settings.AUDIT_ROTATE_MAX_AGE_SECONDS,
+    compress=settings.AUDIT_COMPRESS_ROTATED,
+    high_water=settings.AUDIT_SAMPLING_HIGH_WATER,
+    sample_rate=settings.AUDIT_SAMPLE_RATE,
+    enabled=settings.AUDIT_LOG_ENABLED,
+)
@@ -0,0 +1,134 @@
+"""Read-through TTL cache for broker read calls."""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from ordo.adapters.interceptors import AdapterCall, AdapterInterceptor, Proceed
+
+
+class CacheAge:
+    """
+    Collects the age of cached data served within a scope.
+
+    A scope is a mutable holder placed in a context variable, so the age
+    recorded by calls running in child tasks is visible to the code that
+    opened the scope (e.g. a route handler setting the ``Age`` header).
+    """
+
+    def __init__(self):
+        self.max_age: Optional[float] = None
+
+    def record(self, age: float):
+        if self.max_age is None or age > self.max_age:
+            self.max_age = age
+
+
+_cache_age: ContextVar[Optional[CacheAge]] = ContextVar("cache_age", default=None)
+
+
+@contextmanager
+def cache_age_scope() -> Iterator[CacheAge]:
+    """Opens a scope that records the oldest cached value served within it."""
+    scope = CacheAge()
+    token = _cache_age.set(scope)
+    try:
+        yield scope
+    finally:
+        _cache_age.reset(token)
+
+
+def _record_age(age: float):
+    scope = _cache_age.get()
+    if scope is not None:
+        scope.record(age)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    stored_at: float
+    expires_at: float
+
+
+CacheKey = Tuple[str, str, Optional[str], str]
+
+
+class ReadThroughCache(AdapterInterceptor):
+    """
+    Caches adapter read results per (broker, account, method) for a
+    configurable TTL.
+
+    Any write (place, modify, cancel) on an account invalidates that
+    account's entries, and a read that was in flight across a write is not
+    stored. Concurrent misses are left to the single-flight interceptor
+    behind the cache to coalesce. Cached values are shared between callers
+    and must be treated as read-only.
+    """
+
+    def __init__(self, ttls: Dict[str, float]):
+        self._ttls = dict(ttls)
+        self._entries: Dict[CacheKey, _Entry] = {}
+        self._generations: Dict[Tuple[str, str, Optional[str]], int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def ttl_for(self, method: str) -> float:
+        return self._ttls.get(method, 0.0)
+
+    def invalidate(
+        self, broker_id: str, account_key: str, account_id: Optional[str] = None
+    ):
+        """Drops every cached read for an account."""
+        account = (broker_id, account_key, account_id)
+        self._generations[account] = self._generations.get(account, 0) + 1
+        for key in [k for k in self._entries if k[:3] == account]:
+            del self._entries[key]
+        self.invalidations += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    async def __call__(self, call: AdapterCall, proceed: Proceed) -> Any:
+        if call.is_write:
+            try:
+                return await proceed()
+            finally:
+                # Invalidate even on failure: the order may have reached the
+                # broker before the error.
+                self.invalidate(call.broker_id, call.account_key, call.account_id)
+
+        ttl = self.ttl_for(call.method)
+        if ttl <= 0:
+            return await proceed()
+
+        account = (call.broker_id, call.account_key, call.account_id)
+        key = account + (call.method,)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and now < entry.expires_at:
+            self.hits += 1
+            _record_age(now - entry.stored_at)
+            return entry.value
+
+        self.misses += 1
+        generation = self._generations.get(account, 0)
+        value = await proceed()
+        if self._generations.get(account, 0) == generation:
+            now = time.monotonic()
+            self._entries[key] = _Entry(value, now, now + ttl)
+        _record_age(0.0)
+        return value
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,249 @@
+"""Per-adapter circuit breakers for broker calls."""
+
+import asyncio
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Optional
+
+import httpx
+
+from ordo.adapters.interceptors import AdapterCall, AdapterInterceptor, Proceed
+from ordo.core.concurrency import deadline_expired
+from ordo.models.api.errors import ApiError, ApiException
+from ordo.persistence.circuit_breaker_store import (
+    CircuitBreakerRecord,
+    ICircuitBreakerStore,
+    get_circuit_breaker_store,
+)
+
+CLOSED = "CLOSED"
+OPEN = "OPEN"
+HALF_OPEN = "HALF_OPEN"
+
+
+def broker_status_code(exc: BaseException) -> Optional[int]:
+    """Returns the broker's HTTP status code carried by an adapter error."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code
+    if isinstance(exc, ApiException) and isinstance(exc.error.details, dict):
+        status_code = exc.error.details.get("status_code")
+        if isinstance(status_code, int):
+            return status_code
+    return None
+
+
+def is_broker_failure(exc: BaseException) -> bool:
+    """
+    Tells whether an error means the broker itself is unhealthy: timeouts,
+    transport errors and 5xx responses. Client-side errors (4xx, validation,
+    unsupported operations) say nothing about broker health.
+    """
+    if isinstance(exc, (asyncio.TimeoutError, httpx.TransportError)):
+        return True
+    status_code = broker_status_code(exc)
+    if status_code is not None:
+        return status_code >= 500
+    if isinstance(exc, ApiException):
+        # Adapters wrap transport errors and timeouts as BROKER_REQUEST_FAILED.
+        return exc.error.error_code == "BROKER_REQUEST_FAILED"
+    return False
+
+
+class CircuitBreaker:
+    """
+    A CLOSED / OPEN / HALF_OPEN circuit breaker for one adapter.
+
+    The breaker opens once ``failure_threshold`` failures fall within a
+    sliding ``window`` of seconds. After ``reset_timeout`` seconds it lets a
+    single probe call through (HALF_OPEN): success closes the circuit, failure
+    re-opens it, and any other error leaves it HALF_OPEN for the next probe. State transitions are persisted to ``store``, and the last
+    persisted state is restored on creation so a restart does not reset an
+    open circuit.
+    """
+
+    def __init__(
+        self,
+        adapter_id: str,
+        failure_threshold: int = 5,
+        window: float = 60.0,
+        reset_timeout: float = 120.0,
+        store: Optional[ICircuitBreakerStore] = None,
+    ):
+        self.adapter_id = adapter_id
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.rejected = 0
+        self._store = store
+        self._failures: Deque[float] = deque()
+        self._opened_at = 0.0
+        self._last_failure_at: Optional[datetime] = None
+        self._probe_in_flight = False
+        if store is not None:
+            self._restore(store.load(adapter_id))
+
+    def _restore(self, record: Optional[CircuitBreakerRecord]):
+        if record is None or record.state == CLOSED:
+            return
+        # An interrupted probe is treated like an open circuit; the reset
+        # timeout is measured from the last recorded failure.
+        self.state = OPEN
+        self._last_failure_at = record.last_failure_at
+        elapsed = 0.0
+        if record.last_failure_at is not None:
+            elapsed = (
+                datetime.now(timezone.utc) - record.last_failure_at
+            ).total_seconds()
+        self._opened_at = time.monotonic() - max(0.0, elapsed)
+
+    def _persist(self):
+        if self._store is not None:
+            self._store.save(
+                CircuitBreakerRecord(
+                    adapter_id=self.adapter_id,
+                    state=self.state,
+                    failure_count=len(self._failures),
+                    last_failure_at=self._last_failure_at,
+                )
+            )
+
+    def _transition(self, state: str):
+        self.state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        elif state == CLOSED:
+            self._failures.clear()
+        self._persist()
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit admits a probe."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """
+        Tells whether a call may proceed. In HALF_OPEN only the first caller
+        is admitted; it must report back via ``record_*`` or ``release``.
+        """
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and self.retry_after() == 0.0:
+            self._transition(HALF_OPEN)
+        if self.state == HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        self._probe_in_flight = False
+        if self.state == HALF_OPEN:
+            self._transition(CLOSED)
+
+    def record_failure(self):
+        now = time.monotonic()
+        self._last_failure_at = datetime.now(timezone.utc)
+        self._probe_in_flight = False
+        if self.state == HALF_OPEN:
+            self._transition(OPEN)
+            return
+        self._failures.append(now)
+        while self._failures and self._failures[0] <= now - self.window:
+            self._failures.popleft()
+        if self.state == CLOSED and len(self._failures) >= self.failure_threshold:
+            self._transition(OPEN)
+
+    def release(self):
+        """Gives up an admitted call without an outcome (e.g. it was cancelled)."""
+        self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "failure_count": len(self._failures),
+            "last_failure_at": (
+                self._last_failure_at.isoformat() if self._last_failure_at else None
+            ),
+            "retry_after_seconds": round(self.retry_after(), 3),
+            "rejected": self.rejected,
+        }
+
+
+class BrokerCircuitBreaker(AdapterInterceptor):
+    """
+    Wraps every adapter call in the circuit breaker for its broker. While a
+    circuit is open, calls fail fast with CB_OPEN instead of waiting on a
+    degraded broker.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        window: float = 60.0,
+        reset_timeout: float = 120.0,
+        store: Optional[ICircuitBreakerStore] = None,
+    ):
+        self._failure_threshold = failure_threshold
+        self._window = window
+        self._reset_timeout = reset_timeout
+        self._store = store
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def breaker_for(self, adapter_id: str) -> CircuitBreaker:
+        breaker = self._breakers.get(adapter_id)
+        if breaker is None:
+            if self._store is None:
+                self._store = get_circuit_breaker_store()
+            breaker = CircuitBreaker(
+                adapter_id,
+                failure_threshold=self._failure_threshold,
+                window=self._window,
+                reset_timeout=self._reset_timeout,
+                store=self._store,
+            )
+            self._breakers[adapter_id] = breaker
+        return breaker
+
+    async def __call__(self, call: AdapterCall, proceed: Proceed) -> Any:
+        breaker = self.breaker_for(call.broker_id)
+        if not breaker.allow():
+            raise ApiException(
+                ApiError(
+                    error_code="CB_OPEN",
+                    message=f"Circuit breaker for {call.broker_id} is open.",
+                    details={
+                        "broker_id": call.broker_id,
+                        "retry_after_seconds": round(breaker.retry_after(), 3),
+                    },
+                )
+            )
+        try:
+            result = await proceed()
+        except asyncio.CancelledError:
+            # Cut off by a timeout, the broker failed to answer in time; only
+            # a caller that went away leaves the call without an outcome.
+            if deadline_expired():
+                breaker.record_failure()
+            else:
+                breaker.release()
+            raise
+        except Exception as e:
+            if is_broker_failure(e):
+                breaker.record_failure()
+            else:
+                # Rejected locally (rate limits, validation) or a client-side
+                # error: neither proves the broker healthy, so a probe gives
+                # up its slot and the circuit stays HALF_OPEN.
+                breaker.release()
+            raise
+        breaker.record_success()
+        return result
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            adapter_id: breaker.stats()
+            for adapter_id, breaker in self._breakers.items()
+        }
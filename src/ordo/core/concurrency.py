@@ -0,0 +1,176 @@
+"""Structured-concurrency helpers shared by adapters and services."""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from ordo.config import settings
+
+T = TypeVar("T")
+
+# Loop time at which the current call will be cancelled for taking too long.
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+# Timer callbacks may run up to a clock tick early.
+_DEADLINE_SLACK = 0.001
+
+
+@contextmanager
+def deadline_scope(timeout: float) -> Iterator[None]:
+    """
+    Records that work started within the scope is cancelled ``timeout``
+    seconds from now, unless an enclosing scope cuts it off sooner. Set it
+    around whatever enforces the timeout, such as ``asyncio.wait_for``.
+    """
+    deadline = asyncio.get_running_loop().time() + timeout
+    enclosing = _deadline.get()
+    if enclosing is not None:
+        deadline = min(deadline, enclosing)
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def deadline_expired() -> bool:
+    """
+    Tells whether the current call's deadline has passed, i.e. whether a
+    cancellation is a timeout rather than the caller going away.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return False
+    return asyncio.get_running_loop().time() >= deadline - _DEADLINE_SLACK
+
+
+async def gather_or_cancel(*aws: Awaitable[Any]) -> List[Any]:
+    """
+    Runs awaitables concurrently and returns their results in argument order.
+
+    As soon as one fails, the siblings still in flight are cancelled and
+    awaited, and the failure is re-raised unchanged (not wrapped in an
+    ExceptionGroup), so callers keep their existing ``except`` clauses. If
+    several fail before cancellation lands, the earliest argument wins.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()
+    return [task.result() for task in tasks]
+
+
+class ParsePool:
+    """
+    Runs CPU-heavy parsing of broker responses off the event loop.
+
+    Bodies under ``inline_max_bytes`` are parsed inline, where a thread hop
+    would cost more than it saves. Larger ones go to a pool of
+    ``thread_workers`` threads, and those of ``process_min_bytes`` or more
+    to a pool of ``process_workers`` processes, when there is one; parsing
+    in a thread still holds the GIL, so only a process keeps a very large
+    body from slowing the loop. A process-pool parser must be a module-level
+    function, and what it returns must pickle. The pools start on first use.
+    """
+
+    def __init__(
+        self,
+        inline_max_bytes: int = 64 * 1024,
+        thread_workers: int = 4,
+        process_min_bytes: int = 4 * 1024 * 1024,
+        process_workers: int = 0,
+    ):
+        self.inline_max_bytes = inline_max_bytes
+        self.process_min_bytes = process_min_bytes
+        self.workers = {"thread": thread_workers, "process": process_workers}
+        self.calls = {"inline": 0, "thread": 0, "process": 0}
+        # Parses submitted to each pool and not yet finished, queued or not.
+        self.in_flight = {"thread": 0, "process": 0}
+        self._executors: Dict[str, Optional[Executor]] = {
+            "thread": None,
+            "process": None,
+        }
+
+    def mode(self, size: int) -> str:
+        """Where a body of ``size`` bytes is parsed."""
+        if size < self.inline_max_bytes or not self.workers["thread"]:
+            return "inline"
+        if size >= self.process_min_bytes and self.workers["process"]:
+            return "process"
+        return "thread"
+
+    async def parse(self, body: bytes, parser: Callable[[bytes], T]) -> T:
+        """Returns ``parser(body)``, run where the size of ``body`` calls for."""
+        mode = self.mode(len(body))
+        self.calls[mode] += 1
+        if mode == "inline":
+            return parser(body)
+        self.in_flight[mode] += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor(mode), parser, body
+            )
+        finally:
+            self.in_flight[mode] -= 1
+
+    def _executor(self, mode: str) -> Executor:
+        executor = self._executors[mode]
+        if executor is None:
+            if mode == "thread":
+                executor = ThreadPoolExecutor(
+                    self.workers["thread"], thread_name_prefix="ordo-parse"
+                )
+            else:
+                # Forking a process that runs threads (the loop watchdog,
+                # executor workers) can copy a held lock into the child.
+                executor = ProcessPoolExecutor(
+                    self.workers["process"],
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            self._executors[mode] = executor
+        return executor
+
+    def shutdown(self):
+        """Stops the pools; they start again on the next parse."""
+        for mode, executor in self._executors.items():
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._executors[mode] = None
+
+    def stats(self) -> Dict[str, Any]:
+        pools = {}
+        for mode, workers in self.workers.items():
+            in_flight = self.in_flight[mode]
+            pools[mode] = {
+                "workers": workers,
+                "in_flight": in_flight,
+                "queued": max(0, in_flight - workers),
+                "utilisation": (
+                    round(min(in_flight, workers) / workers, 3) if workers else 0.0
+                ),
+            }
+        return {
+            "inline_max_bytes": self.inline_max_bytes,
+            "process_min_bytes": self.process_min_bytes,
+            "calls": dict(self.calls),
+            "pools": pools,
+        }
+
+
+parse_pool = ParsePool(
+    inline_max_bytes=settings.PARSE_INLINE_MAX_BYTES,
+    thread_workers=settings.PARSE_THREAD_WORKERS,
+    process_min_bytes=settings.PARSE_PROCESS_MIN_BYTES,
+    process_workers=settings.PARSE_PROCESS_WORKERS,
+)
@@ -0,0 +1,244 @@
+"""Idempotency-Key handling for order placement."""
+
+import asyncio
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from ordo.config import settings
+from ordo.core.retry import idempotency_key_scope
+from ordo.models.api.errors import ApiError, ApiException
+from ordo.persistence.idempotency_store import (
+    IdempotencyRecord,
+    IIdempotencyStore,
+    get_idempotency_store,
+)
+
+IN_PROGRESS = "in_progress"
+COMPLETED = "completed"
+# Failures raised before any broker was called. A response made up only of
+# these says nothing about the order, so it is not kept for the key.
+NOT_SENT_CODES = frozenset(
+    {"CB_OPEN", "RATE_LIMITED", "KILL_SWITCH_ACTIVE", "UNAUTHORIZED"}
+)
+
+
+@dataclass(frozen=True)
+class IdempotentResponse:
+    """The HTTP status and JSON body returned for an idempotent request."""
+
+    status_code: int
+    body: Any
+    # False when the request never reached a broker and may simply be retried.
+    replayable: bool = True
+
+
+@dataclass(frozen=True)
+class _IndexEntry:
+    request_hash: str
+    response: IdempotentResponse
+    expires_at: float
+
+
+def request_hash(payload: Any) -> str:
+    """Hashes a JSON-compatible request payload, independent of key order."""
+    canonical = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), default=str
+    ).encode()
+    return hashlib.sha256(canonical).hexdigest()
+
+
+class IdempotencyManager:
+    """
+    Runs requests at most once per Idempotency-Key (FR16).
+
+    Completed responses are kept in an in-memory index in front of the
+    DbIdempotencyRecord store, so replays are a dict lookup. A duplicate that
+    arrives while the first request is still running awaits the first
+    request's future instead of calling the broker again. Across workers,
+    the store's atomic reservation ensures only one executes; the others get
+    IDEMPOTENCY_KEY_IN_PROGRESS until it completes.
+
+    A key reused with a different request body is rejected with
+    IDEMPOTENCY_KEY_MISMATCH. If the request raises, or returns a response
+    that is not ``replayable``, the reservation is released and the key may
+    be retried; if it is cancelled, the reservation is held until it expires.
+    """
+
+    def __init__(
+        self,
+        store: Optional[IIdempotencyStore] = None,
+        ttl: timedelta = timedelta(hours=24),
+        reservation_ttl: timedelta = timedelta(seconds=60),
+    ):
+        self._store = store
+        self.ttl = ttl
+        self.reservation_ttl = reservation_ttl
+        self._index: Dict[str, _IndexEntry] = {}
+        self._inflight: Dict[str, Tuple[str, asyncio.Future]] = {}
+        self.executed = 0
+        self.replayed = 0
+        self.coalesced = 0
+        self.swept = 0
+
+    @property
+    def store(self) -> IIdempotencyStore:
+        if self._store is None:
+            self._store = get_idempotency_store()
+        return self._store
+
+    @staticmethod
+    def _check_hash(key: str, expected: str, actual: str):
+        if expected != actual:
+            raise ApiException(
+                ApiError(
+                    error_code="IDEMPOTENCY_KEY_MISMATCH",
+                    message="Idempotency-Key was already used with a different request.",
+                    details={"idempotency_key": key},
+                )
+            )
+
+    def _remember(
+        self,
+        key: str,
+        request_hash: str,
+        response: IdempotentResponse,
+        expires_at: datetime,
+    ):
+        remaining = (expires_at - datetime.now(timezone.utc)).total_seconds()
+        self._index[key] = _IndexEntry(
+            request_hash, response, time.monotonic() + remaining
+        )
+
+    def _replay_from_store(
+        self, key: str, request_hash: str, record: IdempotencyRecord
+    ) -> IdempotentResponse:
+        snapshot = json.loads(record.response_snapshot_json)
+        self._check_hash(key, snapshot["request_hash"], request_hash)
+        if snapshot["state"] == IN_PROGRESS:
+            raise ApiException(
+                ApiError(
+                    error_code="IDEMPOTENCY_KEY_IN_PROGRESS",
+                    message="A request with this Idempotency-Key is still running.",
+                    details={"idempotency_key": key},
+                )
+            )
+        response = IdempotentResponse(snapshot["status_code"], snapshot["body"])
+        self._remember(key, request_hash, response, record.expires_at)
+        return response
+
+    async def run(
+        self,
+        key: str,
+        request_hash: str,
+        execute: Callable[[], Awaitable[IdempotentResponse]],
+    ) -> Tuple[IdempotentResponse, bool]:
+        """
+        Returns the response for ``key`` and whether it was replayed rather
+        than produced by calling ``execute``.
+        """
+        entry = self._index.get(key)
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                self._check_hash(key, entry.request_hash, request_hash)
+                self.replayed += 1
+                return entry.response, True
+            del self._index[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._check_hash(key, inflight[0], request_hash)
+            self.coalesced += 1
+            return await asyncio.shield(inflight[1]), True
+
+        future = asyncio.get_running_loop().create_future()
+        # Consume the exception if no duplicate ever waited on it.
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = (request_hash, future)
+        reserved = False
+        try:
+            now = datetime.now(timezone.utc)
+            existing = self.store.reserve(
+                IdempotencyRecord(
+                    key=key,
+                    response_snapshot_json=json.dumps(
+                        {"state": IN_PROGRESS, "request_hash": request_hash}
+                    ),
+                    expires_at=now + self.reservation_ttl,
+                )
+            )
+            if existing is not None:
+                response = self._replay_from_store(key, request_hash, existing)
+                self.replayed += 1
+                future.set_result(response)
+                return response, True
+
+            reserved = True
+            with idempotency_key_scope(key):
+                response = await execute()
+            if not response.replayable:
+                self.store.delete(key)
+                reserved = False
+                self.executed += 1
+                future.set_result(response)
+                return response, False
+            expires_at = datetime.now(timezone.utc) + self.ttl
+            self.store.update(
+                IdempotencyRecord(
+                    key=key,
+                    response_snapshot_json=json.dumps(
+                        {
+                            "state": COMPLETED,
+                            "request_hash": request_hash,
+                            "status_code": response.status_code,
+                            "body": response.body,
+                        }
+                    ),
+                    expires_at=expires_at,
+                )
+            )
+            reserved = False
+            self._remember(key, request_hash, response, expires_at)
+            self.executed += 1
+            future.set_result(response)
+            return response, False
+        except asyncio.CancelledError:
+            # The order may already be with the broker, so the reservation is
+            # kept until it expires rather than released for a retry.
+            future.cancel()
+            raise
+        except Exception as e:
+            if reserved:
+                self.store.delete(key)
+            future.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def sweep(self) -> int:
+        """
+        Drops expired keys from the index and deletes them from the store in
+        one bulk statement. Returns the number of stored records removed.
+        """
+        now = time.monotonic()
+        for key in [k for k, e in self._index.items() if e.expires_at <= now]:
+            del self._index[key]
+        removed = self.store.delete_expired()
+        self.swept += removed
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "executed": self.executed,
+            "replayed": self.replayed,
+            "coalesced": self.coalesced,
+            "swept": self.swept,
+            "indexed": len(self._index),
+            "in_flight": len(self._inflight),
+        }
+
+
+idempotency = IdempotencyManager(ttl=timedelta(hours=settings.IDEMPOTENCY_TTL_HOURS))
@@ -0,0 +1,76 @@
+"""Global kill-switch that halts new order placement (FR17)."""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from ordo.models.api.errors import ApiError, ApiException
+from ordo.persistence.kill_switch_store import IKillSwitchStore, get_kill_switch_store
+
+logger = logging.getLogger(__name__)
+
+
+class KillSwitch:
+    """
+    Holds the kill-switch state in memory so checking it on the order path is
+    a single attribute read (``kill_switch.active``).
+
+    Toggles are written through to the store. Other workers pick them up by
+    running :meth:`watch`, which polls the store's cheap change marker off
+    the request path and reloads the state when it moves. Orders already
+    past the check are allowed to finish.
+    """
+
+    def __init__(self, store: Optional[IKillSwitchStore] = None):
+        self._store = store
+        self.active = False
+        self.updated_at: Optional[datetime] = None
+
+    @property
+    def store(self) -> IKillSwitchStore:
+        if self._store is None:
+            self._store = get_kill_switch_store()
+        return self._store
+
+    def load(self):
+        """Reads the persisted state, e.g. on startup."""
+        active = self.store.load()
+        if active != self.active:
+            self.active = active
+            self.updated_at = datetime.now(timezone.utc)
+
+    def set(self, active: bool):
+        self.store.save(active)
+        self.active = active
+        self.updated_at = datetime.now(timezone.utc)
+        logger.warning("Kill-switch %s", "ENABLED" if active else "disabled")
+
+    def check(self):
+        """Raises KILL_SWITCH_ACTIVE if new orders are halted."""
+        if self.active:
+            raise ApiException(
+                ApiError(
+                    error_code="KILL_SWITCH_ACTIVE",
+                    message="Trading is halted: the kill-switch is active.",
+                )
+            )
+
+    async def watch(self, interval: float):
+        """Reloads the state whenever another worker changes it."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if self.store.changed():
+                    self.load()
+            except Exception:
+                logger.exception("Kill-switch refresh failed")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active": self.active,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+kill_switch = KillSwitch()
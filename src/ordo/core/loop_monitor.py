@@ -0,0 +1,201 @@
+"""Event-loop lag monitoring and slow-callback detection."""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from ordo.config import settings
+from ordo.core.metrics import metrics
+
+# Frames kept from the loop thread's stack when a stall is caught.
+STACK_DEPTH = 30
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOOP_LAG_SECONDS = metrics.histogram(
+    "ordo_event_loop_lag_seconds",
+    "How late the event loop ran a timer, sampled periodically.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+SLOW_CALLBACKS = metrics.counter(
+    "ordo_event_loop_slow_callbacks_total",
+    "Callbacks that held the event loop past the slow-callback threshold.",
+    ("hot_spot",),
+)
+BLOCKED_SECONDS = metrics.histogram(
+    "ordo_event_loop_blocked_seconds",
+    "How long each slow callback held the event loop.",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+
+class LoopLagMonitor:
+    """
+    Measures event-loop lag as how much later than asked a sleep of
+    ``interval`` seconds wakes up. Anything that holds the loop (a slow
+    callback, CPU-bound parsing, a blocking call) shows up as lag for every
+    request in flight at the time.
+    """
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.samples = 0
+
+    async def run(self):
+        """Samples the lag until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - start - self.interval)
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            self.samples += 1
+            LOOP_LAG_SECONDS.observe(lag)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "interval_seconds": self.interval,
+            "last_lag_ms": round(self.last_lag * 1000, 3),
+            "max_lag_ms": round(self.max_lag * 1000, 3),
+            "samples": self.samples,
+        }
+
+
+def hot_spot(stack: List[traceback.FrameSummary]) -> str:
+    """
+    Names the innermost frame of Ordo's own code in ``stack``: the line
+    that made the blocking call. Falls back to the innermost frame.
+    """
+    for frame in reversed(stack):
+        if frame.filename.startswith(_PACKAGE_DIR):
+            break
+    else:
+        if not stack:
+            return "unknown"
+        frame = stack[-1]
+    return f"{os.path.basename(frame.filename)}:{frame.lineno} in {frame.name}"
+
+
+class SlowCallbackDetector:
+    """
+    Catches a callback holding the event loop for more than ``threshold``
+    seconds, and records where it was while it did.
+
+    A heartbeat rescheduled on the loop every ``threshold / 4`` seconds
+    stamps the time, and a watchdog thread checks the stamp. When it goes
+    stale the watchdog samples the loop thread's stack with
+    ``sys._current_frames()``, so the stack is that of the blocking code
+    itself, not of whatever runs after it. Once the loop beats again, the
+    heartbeat records the stall, its duration and its hot spot, so all the
+    bookkeeping happens on the loop. The cost while nothing blocks is one
+    timer callback per interval and a thread that wakes to compare two
+    floats.
+    """
+
+    def __init__(self, threshold: float = 0.1, history: int = 100):
+        self.threshold = threshold
+        self.interval = threshold / 4
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self.hot_spots: Dict[str, Dict[str, Any]] = {}
+        self.detected = 0
+        self._beat = time.monotonic()
+        # Stalls the watchdog saw end, waiting for the loop to record them.
+        self._ended: Deque[Tuple[float, datetime, list]] = deque()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._loop_thread_id: Optional[int] = None
+
+    def start(self):
+        """Starts watching the running loop."""
+        loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop.clear()
+        self._heartbeat(loop)
+        self._thread = threading.Thread(
+            target=self._watch, name="ordo-loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self._record_ended()
+
+    def _heartbeat(self, loop: asyncio.AbstractEventLoop):
+        self._beat = time.monotonic()
+        self._record_ended()
+        self._handle = loop.call_later(self.interval, self._heartbeat, loop)
+
+    def _watch(self):
+        stall = None
+        while not self._stop.wait(self.interval):
+            beat = self._beat
+            if stall is not None and beat != stall[0]:
+                # The gap between beats, less the one interval it should be.
+                blocked = beat - stall[0] - self.interval
+                self._ended.append((blocked, stall[1], stall[2]))
+                stall = None
+            if stall is None and time.monotonic() - beat > self.interval + (
+                self.threshold
+            ):
+                frame = sys._current_frames().get(self._loop_thread_id)
+                stack = traceback.extract_stack(frame, STACK_DEPTH) if frame else []
+                stall = (beat, datetime.now(timezone.utc), stack)
+
+    def _record_ended(self):
+        while self._ended:
+            blocked, detected_at, stack = self._ended.popleft()
+            spot = hot_spot(stack)
+            self.detected += 1
+            self.events.append(
+                {
+                    "detected_at": detected_at.isoformat(),
+                    "blocked_ms": round(blocked * 1000, 3),
+                    "hot_spot": spot,
+                    "stack": [f"{f.filename}:{f.lineno} in {f.name}" for f in stack],
+                }
+            )
+            totals = self.hot_spots.setdefault(
+                spot, {"count": 0, "blocked_ms": 0.0, "max_blocked_ms": 0.0}
+            )
+            totals["count"] += 1
+            totals["blocked_ms"] = round(totals["blocked_ms"] + blocked * 1000, 3)
+            totals["max_blocked_ms"] = max(
+                totals["max_blocked_ms"], round(blocked * 1000, 3)
+            )
+            SLOW_CALLBACKS.inc(spot)
+            BLOCKED_SECONDS.observe(blocked)
+
+    def top(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """The hot spots that blocked the loop longest in total."""
+        ranked = sorted(self.hot_spots.items(), key=lambda item: -item[1]["blocked_ms"])
+        return [{"hot_spot": spot, **totals} for spot, totals in ranked[:limit]]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "threshold_ms": self.threshold * 1000,
+            "watching": self._thread is not None,
+            "detected": self.detected,
+            "hot_spots": len(self.hot_spots),
+        }
+
+
+loop_monitor = LoopLagMonitor(settings.LOOP_LAG_SAMPLE_INTERVAL_SECONDS)
+slow_callbacks = SlowCallbackDetector(
+    threshold=settings.SLOW_CALLBACK_THRESHOLD_SECONDS,
+    history=settings.SLOW_CALLBACK_HISTORY,
+)
@@ -0,0 +1,325 @@
+"""In-process Prometheus metrics, aggregated across workers through a directory."""
+
+import asyncio
+import glob
+import json
+import logging
+import os
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ordo.adapters.interceptors import AdapterCall, AdapterInterceptor, Proceed
+from ordo.config import settings
+from ordo.models.api.errors import ApiException
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; spans a cache hit to a broker call at the HTTP timeout.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[str, ...]
+
+
+class Metric:
+    """
+    One metric family: a value per label tuple. Labels are passed
+    positionally in ``labelnames`` order, so recording is a dict update.
+
+    ``merge`` decides how a gauge combines across workers: ``sum``, ``max``,
+    or ``all`` (one series per worker, labelled with its ``pid``). Counters
+    and histograms always sum.
+    """
+
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        merge: str = "sum",
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.merge = merge
+        self._values: Dict[Labels, Any] = {}
+
+    def set(self, value: float, *labels: str):
+        self._values[labels] = value
+
+    def clear(self):
+        self._values.clear()
+
+    def family(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "help": self.documentation,
+            "labelnames": list(self.labelnames),
+            "merge": self.merge,
+            "samples": [[list(k), v] for k, v in self._values.items()],
+        }
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, *labels: str):
+        # Per-bucket (not cumulative) counts, the last one for +Inf, and a sum.
+        state = self._values.get(labels)
+        if state is None:
+            state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        state[0][bisect_left(self.buckets, value)] += 1
+        state[1] += value
+
+    def family(self) -> Dict[str, Any]:
+        family = super().family()
+        family["buckets"] = list(self.buckets)
+        return family
+
+
+def _merge(snapshots: Iterable[Dict[str, Any]], per_process: bool, stale_after: float):
+    """
+    Combines worker snapshots. Gauges of a worker whose snapshot is older
+    than ``stale_after`` (it has most likely exited) are left out; its
+    counters and histograms still count.
+    """
+    now = time.time()
+    families: Dict[str, Dict[str, Any]] = {}
+    for snapshot in snapshots:
+        live = now - snapshot["written_at"] <= stale_after
+        for name, family in snapshot["metrics"].items():
+            merged = families.get(name)
+            if merged is None:
+                merged = families[name] = dict(family, samples={})
+                if per_process and family["kind"] == "gauge":
+                    if family["merge"] == "all":
+                        merged["labelnames"] = family["labelnames"] + ["pid"]
+            if family["kind"] == "gauge" and not live:
+                continue
+            samples = merged["samples"]
+            for labels, value in family["samples"]:
+                key = tuple(labels)
+                if family["kind"] == "histogram":
+                    counts, total = samples.get(key, ([0] * len(value[0]), 0.0))
+                    samples[key] = (
+                        [a + b for a, b in zip(counts, value[0])],
+                        total + value[1],
+                    )
+                elif family["kind"] == "counter" or family["merge"] == "sum":
+                    samples[key] = samples.get(key, 0.0) + value
+                elif family["merge"] == "max":
+                    samples[key] = max(samples.get(key, value), value)
+                elif per_process:
+                    samples[key + (str(snapshot["pid"]),)] = value
+                else:
+                    samples[key] = value
+    return families
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _label_text(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render(families: Dict[str, Dict[str, Any]]) -> str:
+    """Renders merged families in the Prometheus text exposition format."""
+    lines: List[str] = []
+    for name in sorted(families):
+        family = families[name]
+        names = family["labelnames"]
+        lines.append(f"# HELP {name} {family['help']}")
+        lines.append(f"# TYPE {name} {family['kind']}")
+        for labels, value in sorted(family["samples"].items()):
+            if family["kind"] != "histogram":
+                lines.append(f"{name}{_label_text(names, labels)} {_format(value)}")
+                continue
+            counts, total = value
+            cumulative = 0
+            for bound, count in zip(family["buckets"] + [float("inf")], counts):
+                cumulative += count
+                le = f'le="{_format(bound)}"'
+                lines.append(
+                    f"{name}_bucket{_label_text(names, labels, le)} {cumulative}"
+                )
+            lines.append(f"{name}_sum{_label_text(names, labels)} {_format(total)}")
+            lines.append(f"{name}_count{_label_text(names, labels)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+def _write_snapshot(directory: str, snapshot: Dict[str, Any]):
+    path = os.path.join(directory, f"metrics-{snapshot['pid']}.json")
+    with open(path + ".tmp", "w") as f:
+        json.dump(snapshot, f)
+    # Readers never see a half-written snapshot.
+    os.replace(path + ".tmp", path)
+
+
+def _read_snapshots(directory: str) -> List[Dict[str, Any]]:
+    snapshots = []
+    for path in glob.glob(os.path.join(directory, "metrics-*.json")):
+        try:
+            with open(path) as f:
+                snapshots.append(json.load(f))
+        except (OSError, ValueError):
+            logger.warning("Skipping unreadable metrics snapshot %s", path)
+    return snapshots
+
+
+class MetricsRegistry:
+    """
+    Holds every metric of the process.
+
+    Recording is a dict update on the event loop with no locks. Values kept
+    elsewhere (the ``stats()`` of pools, caches and limiters) are copied in
+    by collectors when a scrape takes a snapshot, so they cost nothing
+    between scrapes.
+
+    With ``directory`` set, :meth:`run` writes this worker's snapshot there
+    every ``interval`` seconds, and a scrape of any worker merges every
+    worker's snapshot, so a multi-worker uvicorn reports one set of totals.
+    """
+
+    def __init__(self, directory: Optional[str] = None, interval: float = 5.0):
+        self.directory = directory
+        self.interval = interval
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def _register(self, metric: Metric) -> Any:
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames=(), merge: str = "sum"
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames, merge))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames=(),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], None]):
+        """Runs ``collector`` before every snapshot to refresh its metrics."""
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def snapshot(self) -> Dict[str, Any]:
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception:
+                logger.exception("Metrics collector %r failed", collector)
+        return {
+            "pid": os.getpid(),
+            "written_at": time.time(),
+            "metrics": {name: m.family() for name, m in self._metrics.items()},
+        }
+
+    async def scrape(self) -> str:
+        """Returns the exposition text for this worker, or for all of them."""
+        snapshot = self.snapshot()
+        if not self.directory:
+            return render(_merge([snapshot], False, float("inf")))
+        await asyncio.to_thread(_write_snapshot, self.directory, snapshot)
+        snapshots = await asyncio.to_thread(_read_snapshots, self.directory)
+        return render(_merge(snapshots, True, self.interval * 3))
+
+    async def run(self):
+        """Writes this worker's snapshot to the directory until cancelled."""
+        await asyncio.to_thread(os.makedirs, self.directory, exist_ok=True)
+        while True:
+            try:
+                # Taken on the loop, which owns the values; written off it.
+                await asyncio.to_thread(
+                    _write_snapshot, self.directory, self.snapshot()
+                )
+            except Exception:
+                logger.exception("Failed to write the metrics snapshot")
+            await asyncio.sleep(self.interval)
+
+
+metrics = MetricsRegistry(
+    directory=settings.METRICS_MULTIPROC_DIR,
+    interval=settings.METRICS_SNAPSHOT_INTERVAL_SECONDS,
+)
+
+ADAPTER_CALL_SECONDS = metrics.histogram(
+    "ordo_adapter_call_seconds",
+    "Latency of broker adapter calls, including retries and rate-limit waits.",
+    ("broker", "method", "outcome"),
+)
+BROKER_HTTP_RESPONSES = metrics.counter(
+    "ordo_broker_http_responses_total",
+    "HTTP responses received from brokers, by status code.",
+    ("broker", "status"),
+)
+
+
+class MetricsInterceptor(AdapterInterceptor):
+    """
+    Times every adapter call that gets past the read cache and
+    single-flight, by broker, method and outcome (``success``, the
+    ApiError code, or ``error``).
+    """
+
+    async def __call__(self, call: AdapterCall, proceed: Proceed) -> Any:
+        start = time.perf_counter()
+        outcome = "cancelled"
+        try:
+            result = await proceed()
+            outcome = "success"
+            return result
+        except ApiException as e:
+            outcome = e.error.error_code
+            raise
+        except Exception:
+            outcome = "error"
+            raise
+        finally:
+            ADAPTER_CALL_SECONDS.observe(
+                time.perf_counter() - start, call.broker_id, call.method, outcome
+            )
@@ -0,0 +1,463 @@
+"""Request orchestrator: concurrent fan-out of adapter calls across brokers."""
+
+import asyncio
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from ordo.adapters.interceptors import READ_METHODS
+from ordo.adapters.registry import AdapterRegistry, adapter_registry
+from ordo.config import settings
+from ordo.core.audit import current_correlation_id
+from ordo.core.cache import cache_age_scope
+from ordo.core.concurrency import deadline_scope
+from ordo.core.kill_switch import kill_switch
+from ordo.core.tracing import tracing
+from ordo.models.api.errors import ApiError, ApiException
+from ordo.models.api.orchestrator import (
+    BasketLeg,
+    BrokerResult,
+    BrokerTarget,
+    UnifiedResponse,
+)
+
+READ_OPERATIONS = READ_METHODS
+
+
+def _elapsed_ms(start: float) -> int:
+    return int((time.perf_counter() - start) * 1000)
+
+
+def _correlation_id(correlation_id: Optional[str]) -> str:
+    return correlation_id or current_correlation_id() or str(uuid.uuid4())
+
+
+def _to_payload(result: Any) -> Any:
+    if isinstance(result, BaseModel):
+        return result.model_dump(mode="json")
+    if isinstance(result, list):
+        return [_to_payload(item) for item in result]
+    return result
+
+
+def _failed(target: BrokerTarget, code: str, message: str, start: float):
+    return BrokerResult(
+        broker_id=target.broker,
+        account_id=target.account_id,
+        status="failed",
+        code=code,
+        message=message,
+        latency_ms=_elapsed_ms(start),
+    )
+
+
+def _failure(
+    target: BrokerTarget,
+    operation: str,
+    exc: BaseException,
+    timeout: float,
+    start: float,
+) -> BrokerResult:
+    """Maps an adapter error onto a failed BrokerResult with a standard code."""
+    if isinstance(exc, asyncio.TimeoutError):
+        return _failed(target, "TIMEOUT", f"No response within {timeout:.3f}s.", start)
+    if isinstance(exc, ApiException):
+        return _failed(target, exc.error.error_code, exc.error.message, start)
+    if isinstance(exc, NotImplementedError):
+        return _failed(
+            target,
+            "NOT_SUPPORTED",
+            f"{target.broker} does not support {operation}.",
+            start,
+        )
+    if isinstance(exc, ValueError):
+        return _failed(target, "INVALID_REQUEST", str(exc), start)
+    return _failed(target, "BROKER_REQUEST_FAILED", str(exc), start)
+
+
+class RequestOrchestrator:
+    """
+    Runs one adapter operation against many broker/account targets at once.
+
+    Every target runs as its own task with a per-target timeout, and the whole
+    fan-out is bounded by an overall deadline. Targets still running when the
+    deadline passes are cancelled explicitly and reported as failed, so the
+    caller always gets a complete, collated envelope in roughly the time of
+    the slowest broker rather than the sum of all of them.
+    """
+
+    def __init__(
+        self,
+        registry: AdapterRegistry = adapter_registry,
+        target_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ):
+        self._registry = registry
+        self._target_timeout = target_timeout
+        self._deadline = deadline
+
+    async def _run_target(
+        self,
+        operation: str,
+        target: BrokerTarget,
+        timeout: float,
+        args: Tuple[Any, ...] = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+    ) -> BrokerResult:
+        start = time.perf_counter()
+        try:
+            adapter = self._registry.get(target.broker, target.account_id)
+            method = getattr(adapter, operation, None)
+            if method is None:
+                raise NotImplementedError(operation)
+            with (
+                tracing.span(
+                    f"orchestrator.{operation}",
+                    broker=target.broker,
+                    account_id=target.account_id,
+                ),
+                cache_age_scope() as cache_age,
+                deadline_scope(timeout),
+            ):
+                result = await asyncio.wait_for(
+                    method(target.session_data, *args, **(kwargs or {})), timeout
+                )
+        except Exception as e:
+            return _failure(target, operation, e, timeout, start)
+
+        return BrokerResult(
+            broker_id=target.broker,
+            account_id=target.account_id,
+            status="success",
+            payload=_to_payload(result),
+            latency_ms=_elapsed_ms(start),
+            cache_age_ms=(
+                int(cache_age.max_age * 1000) if cache_age.max_age is not None else None
+            ),
+        )
+
+    async def fan_out(
+        self,
+        operation: str,
+        targets: List[BrokerTarget],
+        target_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        correlation_id: Optional[str] = None,
+    ) -> UnifiedResponse:
+        """
+        Runs ``operation`` concurrently against every target and collates the
+        per-broker results, allowing partial success.
+        """
+        if operation not in READ_OPERATIONS:
+            raise ValueError(f"Unsupported fan-out operation: {operation}")
+        return await self._dispatch(
+            operation, targets, (), target_timeout, deadline, correlation_id
+        )
+
+    async def place_order(
+        self,
+        targets: List[BrokerTarget],
+        order_details: Dict[str, Any],
+        target_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        correlation_id: Optional[str] = None,
+    ) -> UnifiedResponse:
+        """
+        Places the same order with every target concurrently. Raises
+        KILL_SWITCH_ACTIVE, before any broker is called, while trading is
+        halted.
+        """
+        kill_switch.check()
+        return await self._dispatch(
+            "place_order",
+            targets,
+            (order_details,),
+            target_timeout,
+            deadline,
+            correlation_id,
+        )
+
+    async def modify_order(
+        self,
+        target: BrokerTarget,
+        order_id: str,
+        changes: Dict[str, Any],
+        target_timeout: Optional[float] = None,
+        correlation_id: Optional[str] = None,
+    ) -> UnifiedResponse:
+        """
+        Modifies an open order with one broker. A modification can add
+        exposure, so it is refused while the kill-switch is active.
+        """
+        kill_switch.check()
+        return await self._dispatch(
+            "modify_order",
+            [target],
+            (order_id,),
+            target_timeout,
+            None,
+            correlation_id,
+            kwargs=changes,
+        )
+
+    async def cancel_order(
+        self,
+        target: BrokerTarget,
+        order_id: str,
+        target_timeout: Optional[float] = None,
+        correlation_id: Optional[str] = None,
+    ) -> UnifiedResponse:
+        """
+        Cancels an open order with one broker. Cancels only reduce exposure
+        and stay allowed while the kill-switch is active.
+        """
+        return await self._dispatch(
+            "cancel_order",
+            [target],
+            (order_id,),
+            target_timeout,
+            None,
+            correlation_id,
+        )
+
+    async def place_basket(
+        self,
+        legs: List[BasketLeg],
+        all_or_cancel: bool = False,
+        deadline: Optional[float] = None,
+        correlation_id: Optional[str] = None,
+    ) -> UnifiedResponse:
+        """
+        Places a basket of orders and returns one result per leg, in input
+        order.
+
+        Every leg is validated before anything is sent; one invalid leg
+        rejects the whole basket with INVALID_BASKET. Legs are then grouped by
+        broker account and each group goes out through the adapter's
+        ``place_orders`` concurrently, each leg still passing that broker's
+        rate limiter. With ``all_or_cancel``, if any leg fails every placed
+        leg is cancelled and reported as ROLLED_BACK (or ROLLBACK_FAILED).
+        Legs cut off by the deadline have no order id to cancel, so they are
+        reported as UNRESOLVED: they may be live at the broker.
+        """
+        kill_switch.check()
+        start = time.perf_counter()
+        deadline = deadline or self._deadline or settings.ORCHESTRATOR_DEADLINE_SECONDS
+        groups = self._validate_basket(legs)
+        results: List[Optional[BrokerResult]] = [None] * len(legs)
+
+        async def place_group(indices: List[int]):
+            first = legs[indices[0]]
+            adapter = self._registry.get(first.broker, first.account_id)
+            outcomes = await adapter.place_orders(
+                first.session_data, [legs[i].order for i in indices]
+            )
+            for index, outcome in zip(indices, outcomes):
+                if isinstance(outcome, BaseException):
+                    results[index] = _failure(
+                        legs[index], "place_order", outcome, deadline, start
+                    )
+                else:
+                    results[index] = BrokerResult(
+                        broker_id=first.broker,
+                        account_id=first.account_id,
+                        status="success",
+                        payload=_to_payload(outcome),
+                        latency_ms=_elapsed_ms(start),
+                    )
+
+        with deadline_scope(deadline):
+            tasks = [asyncio.create_task(place_group(indices)) for indices in groups]
+        try:
+            await asyncio.wait(tasks, timeout=deadline)
+        finally:
+            stragglers = [task for task in tasks if not task.done()]
+            for task in stragglers:
+                task.cancel()
+            if stragglers:
+                await asyncio.gather(*stragglers, return_exceptions=True)
+
+        for task, indices in zip(tasks, groups):
+            for index in indices:
+                if results[index] is not None:
+                    continue
+                if task.cancelled():
+                    # The order may or may not have reached the broker.
+                    results[index] = _failed(
+                        legs[index],
+                        "DEADLINE_EXCEEDED",
+                        f"No confirmation within the {deadline:.3f}s deadline.",
+                        start,
+                    )
+                else:
+                    results[index] = _failure(
+                        legs[index], "place_order", task.exception(), deadline, start
+                    )
+
+        if all_or_cancel and any(r.status == "failed" for r in results):
+            await self._roll_back(legs, groups, results)
+        return self._collate(results, _correlation_id(correlation_id), start)
+
+    def _validate_basket(self, legs: List[BasketLeg]) -> List[List[int]]:
+        """Validates every leg and groups leg indices by broker account."""
+        errors = []
+        groups: Dict[Tuple[str, Optional[str]], List[int]] = {}
+        for index, leg in enumerate(legs):
+            try:
+                self._registry.get(leg.broker, leg.account_id).validate_order(leg.order)
+            except ValueError as e:
+                errors.append({"leg": index, "broker": leg.broker, "message": str(e)})
+                continue
+            groups.setdefault((leg.broker, leg.account_id), []).append(index)
+        if errors:
+            raise ApiException(
+                ApiError(
+                    error_code="INVALID_BASKET",
+                    message=f"{len(errors)} of {len(legs)} legs failed validation; "
+                    "no orders were placed.",
+                    details={"legs": errors},
+                )
+            )
+        return list(groups.values())
+
+    async def _roll_back(
+        self,
+        legs: List[BasketLeg],
+        groups: List[List[int]],
+        results: List[BrokerResult],
+    ):
+        timeout = self._target_timeout or settings.ORCHESTRATOR_TARGET_TIMEOUT_SECONDS
+        sessions = {
+            index: legs[group[0]].session_data for group in groups for index in group
+        }
+
+        async def cancel(index: int):
+            leg, result = legs[index], results[index]
+            order_id = (
+                result.payload.get("order_id")
+                if isinstance(result.payload, dict)
+                else None
+            )
+            try:
+                if not order_id:
+                    raise ValueError("the broker returned no order_id")
+                adapter = self._registry.get(leg.broker, leg.account_id)
+                with deadline_scope(timeout):
+                    await asyncio.wait_for(
+                        adapter.cancel_order(sessions[index], order_id), timeout
+                    )
+            except Exception as e:
+                results[index] = result.model_copy(
+                    update={
+                        "code": "ROLLBACK_FAILED",
+                        "message": f"Placed, but could not be cancelled: {e!r}",
+                    }
+                )
+            else:
+                results[index] = result.model_copy(
+                    update={
+                        "status": "failed",
+                        "code": "ROLLED_BACK",
+                        "message": "Cancelled because another leg failed.",
+                    }
+                )
+
+        await asyncio.gather(
+            *(cancel(i) for i, r in enumerate(results) if r.status == "success")
+        )
+        for index, result in enumerate(results):
+            if result.code == "DEADLINE_EXCEEDED":
+                # Nothing identifies the order at the broker, so it can't be
+                # found in the order book to cancel; never report it undone.
+                results[index] = result.model_copy(
+                    update={
+                        "code": "UNRESOLVED",
+                        "message": f"{result.message} The order may be live at "
+                        "the broker and was not cancelled; check the order book.",
+                    }
+                )
+
+    async def _dispatch(
+        self,
+        operation: str,
+        targets: List[BrokerTarget],
+        args: Tuple[Any, ...],
+        target_timeout: Optional[float],
+        deadline: Optional[float],
+        correlation_id: Optional[str],
+        kwargs: Optional[Dict[str, Any]] = None,
+    ) -> UnifiedResponse:
+        start = time.perf_counter()
+        target_timeout = (
+            target_timeout
+            or self._target_timeout
+            or settings.ORCHESTRATOR_TARGET_TIMEOUT_SECONDS
+        )
+        deadline = deadline or self._deadline or settings.ORCHESTRATOR_DEADLINE_SECONDS
+
+        # Tasks copy the context, so each target also sees the overall deadline.
+        with deadline_scope(deadline):
+            tasks = [
+                asyncio.create_task(
+                    self._run_target(operation, target, target_timeout, args, kwargs)
+                )
+                for target in targets
+            ]
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=deadline)
+        finally:
+            # Stragglers (and everything, if we were cancelled) are cancelled
+            # explicitly rather than left running in the background.
+            stragglers = [task for task in tasks if not task.done()]
+            for task in stragglers:
+                task.cancel()
+            if stragglers:
+                await asyncio.gather(*stragglers, return_exceptions=True)
+
+        results = [
+            (
+                task.result()
+                if task in done
+                else _failed(
+                    target,
+                    "DEADLINE_EXCEEDED",
+                    f"Cancelled at the {deadline:.3f}s overall deadline.",
+                    start,
+                )
+            )
+            for task, target in zip(tasks, targets)
+        ]
+        return self._collate(results, _correlation_id(correlation_id), start)
+
+    def _collate(
+        self, results: List[BrokerResult], correlation_id: str, start: float
+    ) -> UnifiedResponse:
+        failures = [r for r in results if r.status == "failed"]
+        if not failures:
+            overall_status = "success"
+        elif len(failures) == len(results):
+            overall_status = "failure"
+        else:
+            overall_status = "partial_success"
+
+        errors = [
+            ApiError(
+                error_code=r.code or "BROKER_REQUEST_FAILED",
+                message=r.message or "Broker call failed.",
+                details={"broker_id": r.broker_id, "account_id": r.account_id},
+                correlation_id=correlation_id,
+            )
+            for r in failures
+        ]
+        return UnifiedResponse(
+            overall_status=overall_status,
+            results=results,
+            correlation_id=correlation_id,
+            elapsed_ms=_elapsed_ms(start),
+            errors=errors or None,
+        )
+
+
+orchestrator = RequestOrchestrator()
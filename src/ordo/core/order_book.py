@@ -0,0 +1,207 @@
+"""Versioned, incrementally diffed order books keyed by order_id."""
+
+import threading
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from ordo.config import settings
+from ordo.models.api.order import OrderBookDelta
+
+
+def order_dict(order: Any) -> Dict[str, Any]:
+    """Converts one adapter order, model or mapping, to a JSON-ready dict."""
+    return (
+        order.model_dump(mode="json") if isinstance(order, BaseModel) else dict(order)
+    )
+
+
+def order_dicts(orders: Any) -> List[Dict[str, Any]]:
+    """Normalizes an adapter's order book to a list of JSON-ready dicts."""
+    return [order_dict(order) for order in orders or []]
+
+
+def _order_id(order: Any) -> str:
+    return order.order_id if isinstance(order, BaseModel) else order["order_id"]
+
+
+@dataclass
+class BookChanges:
+    """What one :meth:`VersionedOrderBook.apply` changed."""
+
+    inserted: List[Dict[str, Any]] = field(default_factory=list)
+    # (previous, current) pairs.
+    updated: List[Tuple[Dict[str, Any], Dict[str, Any]]] = field(default_factory=list)
+    removed: List[Dict[str, Any]] = field(default_factory=list)
+    # True if the poll was dropped because a later-fetched one was applied.
+    stale: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.inserted or self.updated or self.removed)
+
+
+class VersionedOrderBook:
+    """
+    The last known order book of one account, indexed by order_id.
+
+    Each :meth:`apply` that changes anything bumps ``version`` and appends
+    the changed order ids to a bounded change log, so :meth:`since` returns
+    just the orders touched after a version by walking the log backwards
+    instead of re-sending the whole book. Asking for a version older than
+    the log reaches falls back to a full snapshot.
+
+    Versions count from 0 in every process, so each book also has a random
+    ``epoch``. A version is only meaningful together with the epoch it was
+    read under; one from another worker, or from before a restart, gets a
+    full snapshot.
+
+    Orders are kept as the adapter returned them and compared as is; only
+    the orders a change or a delta touches are converted to dicts. Polls
+    can finish out of order, so callers take a :meth:`fetch_sequence`
+    before fetching and pass it to :meth:`apply`, which drops any poll
+    fetched before the one last applied.
+    """
+
+    def __init__(self, max_log: int = 10000):
+        self.epoch = uuid.uuid4().hex[:16]
+        self.version = 0
+        self._orders: Dict[str, Any] = {}
+        self._log: Deque[Tuple[int, str]] = deque(maxlen=max_log)
+        self._lock = threading.Lock()
+        self._fetched = 0
+        self._applied = 0
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    @property
+    def oldest_version(self) -> int:
+        """The oldest version :meth:`since` can answer incrementally."""
+        if len(self._log) < (self._log.maxlen or 0):
+            return 0
+        return self._log[0][0]
+
+    def fetch_sequence(self) -> int:
+        """Numbers a poll about to be fetched, for :meth:`apply`."""
+        with self._lock:
+            self._fetched += 1
+            return self._fetched
+
+    def apply(self, orders: Any, sequence: Optional[int] = None) -> BookChanges:
+        """
+        Replaces the book with a fresh poll and records what changed.
+
+        ``orders`` are adapter models or dicts keyed by ``order_id``. A poll
+        whose ``sequence`` is older than the last one applied is dropped and
+        reported as ``stale``; without a sequence the poll always applies.
+        """
+        with self._lock:
+            if sequence is not None:
+                if sequence < self._applied:
+                    return BookChanges(stale=True)
+                self._applied = sequence
+            return self._apply(orders or [])
+
+    def _apply(self, orders: Any) -> BookChanges:
+        changes = BookChanges()
+        current = {_order_id(order): order for order in orders}
+        touched = []
+        for order_id, order in current.items():
+            previous = self._orders.get(order_id)
+            if previous is None:
+                changes.inserted.append(order_dict(order))
+                touched.append(order_id)
+            elif previous != order:
+                changes.updated.append((order_dict(previous), order_dict(order)))
+                touched.append(order_id)
+        for order_id, order in self._orders.items():
+            if order_id not in current:
+                changes.removed.append(order_dict(order))
+                touched.append(order_id)
+        if not changes:
+            return changes
+
+        self.version += 1
+        self._log.extend((self.version, order_id) for order_id in touched)
+        self._orders = current
+        return changes
+
+    def snapshot(self) -> OrderBookDelta:
+        with self._lock:
+            return self._snapshot()
+
+    def _snapshot(self) -> OrderBookDelta:
+        # Built without validation: every field comes from the book itself.
+        return OrderBookDelta.model_construct(
+            epoch=self.epoch,
+            version=self.version,
+            since=None,
+            full=True,
+            orders=[order_dict(order) for order in self._orders.values()],
+            removed=[],
+        )
+
+    def since(self, version: Optional[int], epoch: Optional[str]) -> OrderBookDelta:
+        """
+        Returns what changed after ``version`` of ``epoch``, or a full
+        snapshot.
+        """
+        with self._lock:
+            return self._since(version, epoch)
+
+    def _since(self, version: Optional[int], epoch: Optional[str]) -> OrderBookDelta:
+        if (
+            version is None
+            or epoch != self.epoch
+            or version > self.version
+            or version < self.oldest_version
+        ):
+            return self._snapshot()
+
+        touched = []
+        seen = set()
+        for logged_version, order_id in reversed(self._log):
+            if logged_version <= version:
+                break
+            if order_id not in seen:
+                seen.add(order_id)
+                touched.append(order_id)
+        orders = [
+            order_dict(self._orders[i]) for i in reversed(touched) if i in self._orders
+        ]
+        removed = [i for i in reversed(touched) if i not in self._orders]
+        return OrderBookDelta.model_construct(
+            epoch=self.epoch,
+            version=self.version,
+            since=version,
+            full=False,
+            orders=orders,
+            removed=removed,
+        )
+
+
+class OrderBookTracker:
+    """Holds the :class:`VersionedOrderBook` of every account polled."""
+
+    def __init__(self, max_log: int = 10000):
+        self.max_log = max_log
+        self._books: Dict[Tuple[str, Optional[str]], VersionedOrderBook] = {}
+
+    def book(self, broker: str, account_id: Optional[str] = None) -> VersionedOrderBook:
+        key = (broker, account_id)
+        book = self._books.get(key)
+        if book is None:
+            book = self._books[key] = VersionedOrderBook(self.max_log)
+        return book
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            f"{broker}:{account_id or ''}": {"version": b.version, "orders": len(b)}
+            for (broker, account_id), b in self._books.items()
+        }
+
+
+order_books = OrderBookTracker(max_log=settings.ORDER_BOOK_LOG_SIZE)
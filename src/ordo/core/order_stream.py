@@ -0,0 +1,275 @@
+"""Order and trade update feeds, fed by one shared book poller per account."""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set, Tuple
+
+from ordo.adapters.registry import AdapterRegistry, adapter_registry
+from ordo.config import get_session_data, settings
+from ordo.core.order_book import (
+    BookChanges,
+    OrderBookTracker,
+    order_books,
+    order_dicts,
+)
+from ordo.models.api.errors import ApiException
+
+logger = logging.getLogger(__name__)
+
+# Sent, as the last event, to a subscriber that fell too far behind.
+OVERFLOW_EVENT = {
+    "type": "overflow",
+    "message": "Subscriber fell behind; reconnect and re-read the book.",
+}
+
+
+class Subscription:
+    """One subscriber's bounded queue of events."""
+
+    def __init__(self, feed: "BookFeed", max_size: int):
+        self.feed = feed
+        self._queue: asyncio.Queue = asyncio.Queue(max_size)
+        self.closed = False
+
+    def push(self, event: Dict[str, Any]) -> bool:
+        """Queues an event; returns False once the queue has overflowed."""
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            pass
+        # Make room for the terminal event; the subscriber must resync.
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(OVERFLOW_EVENT)
+        self.closed = True
+        return False
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """Returns the next event, or None after the terminal one."""
+        if self.closed and self._queue.empty():
+            return None
+        return await self._queue.get()
+
+    def close(self):
+        self.feed.unsubscribe(self)
+
+
+class BookFeed:
+    """
+    Polls one account's order and trade books while anyone is subscribed,
+    and fans out what changed between successive polls.
+
+    Every subscriber of the account shares the one poller, so ten
+    subscribers cost the broker one poll per interval rather than ten.
+    Polls are applied to the account's shared
+    :class:`~ordo.core.order_book.VersionedOrderBook`, so they also advance
+    the versions served to ``?since=`` readers. Since REST polls apply to
+    the same book, the feed keeps its own version cursor and last-seen
+    orders, and publishes everything changed since its cursor, whoever
+    polled it in. The first poll only records the books. After that an order seen for the first time is
+    ``new``, a changed order is an ``update`` carrying its previous status,
+    an order gone from the book is ``removed``, and every trade not seen
+    before is published once.
+    """
+
+    def __init__(
+        self,
+        broker: str,
+        account_id: Optional[str],
+        interval: float,
+        queue_size: int,
+        registry: AdapterRegistry,
+        books: OrderBookTracker,
+    ):
+        self.broker = broker
+        self.account_id = account_id
+        self.interval = interval
+        self.queue_size = queue_size
+        self._registry = registry
+        self.subscribers: Set[Subscription] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._book = books.book(broker, account_id)
+        self._baseline = False
+        self._version = 0
+        self._orders: Dict[str, Dict[str, Any]] = {}
+        self._trade_ids: Set[str] = set()
+        self._failing = False
+        self.polls = 0
+        self.events = 0
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self, self.queue_size)
+        self.subscribers.add(subscription)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self.subscribers.discard(subscription)
+        if not self.subscribers and self._task is not None:
+            # Don't cancel the poller from inside its own poll, e.g. when
+            # publish() drops the last subscriber; it stops after the poll.
+            if self._task is not asyncio.current_task():
+                self._task.cancel()
+            self._task = None
+
+    def publish(self, event: Dict[str, Any]):
+        self.events += 1
+        for subscription in list(self.subscribers):
+            if not subscription.push(event):
+                logger.warning(
+                    "Dropped a lagging %s order-stream subscriber", self.broker
+                )
+                self.unsubscribe(subscription)
+
+    async def _run(self):
+        try:
+            while self.subscribers:
+                try:
+                    await self.poll()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    if not self._failing:
+                        self._failing = True
+                        code = (
+                            e.error.error_code
+                            if isinstance(e, ApiException)
+                            else "BROKER_REQUEST_FAILED"
+                        )
+                        self.publish({"type": "error", "code": code, "message": str(e)})
+                    logger.warning(
+                        "Order-stream poll for %s failed: %s", self.broker, e
+                    )
+                if self.subscribers:
+                    await asyncio.sleep(self.interval)
+        finally:
+            # Reset only once the poll has unwound, so a later subscriber
+            # starts from a fresh baseline. A poller started meanwhile hasn't
+            # run yet: its first step was scheduled after this one.
+            if self._task is asyncio.current_task():
+                self._task = None
+            self._baseline = False
+            self._orders = {}
+            self._trade_ids = set()
+
+    async def poll(self):
+        """Fetches both books once and publishes the differences."""
+        adapter = self._registry.get(self.broker, self.account_id)
+        session_data = get_session_data(self.broker)
+        sequence = self._book.fetch_sequence()
+        orders, trades = await asyncio.gather(
+            adapter.get_order_book(session_data),
+            adapter.get_trade_book(session_data),
+        )
+        self.polls += 1
+        self._failing = False
+        self._book.apply(orders, sequence)
+        changes = self._changes()
+        trades = order_dicts(trades)
+
+        if not self._baseline:
+            self._baseline = True
+            self._trade_ids = {trade["trade_id"] for trade in trades}
+            return
+
+        for previous, order in changes.updated:
+            self.publish(
+                {
+                    "type": "order",
+                    "event": "update",
+                    "previous_status": previous.get("status"),
+                    "order": order,
+                }
+            )
+        for order in changes.inserted:
+            self.publish({"type": "order", "event": "new", "order": order})
+        for order in changes.removed:
+            self.publish({"type": "order", "event": "removed", "order": order})
+
+        for trade in trades:
+            if trade["trade_id"] not in self._trade_ids:
+                self._trade_ids.add(trade["trade_id"])
+                self.publish({"type": "trade", "trade": trade})
+
+    def _changes(self) -> BookChanges:
+        """Moves the feed's cursor to the book's version and returns the changes."""
+        delta = self._book.since(self._version, self._book.epoch)
+        self._version = delta.version
+        changes = BookChanges()
+        if delta.full:
+            current = {order["order_id"]: order for order in delta.orders}
+            removed = [i for i in self._orders if i not in current]
+        else:
+            current = dict(self._orders)
+            current.update((order["order_id"], order) for order in delta.orders)
+            removed = delta.removed
+        for order in delta.orders:
+            previous = self._orders.get(order["order_id"])
+            if previous is None:
+                changes.inserted.append(order)
+            elif previous != order:
+                changes.updated.append((previous, order))
+        for order_id in removed:
+            current.pop(order_id, None)
+            if order_id in self._orders:
+                changes.removed.append(self._orders[order_id])
+        self._orders = current
+        return changes
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "subscribers": len(self.subscribers),
+            "polls": self.polls,
+            "events": self.events,
+        }
+
+
+class OrderStreamHub:
+    """Hands out subscriptions to the one :class:`BookFeed` per account."""
+
+    def __init__(
+        self,
+        interval: float,
+        queue_size: int = 100,
+        registry: AdapterRegistry = adapter_registry,
+        books: OrderBookTracker = order_books,
+    ):
+        self.interval = interval
+        self.queue_size = queue_size
+        self._registry = registry
+        self._books = books
+        self._feeds: Dict[Tuple[str, Optional[str]], BookFeed] = {}
+
+    def subscribe(self, broker: str, account_id: Optional[str] = None) -> Subscription:
+        """
+        Subscribes to an account's updates. Raises ValueError for an unknown
+        broker before any poller starts.
+        """
+        self._registry.get(broker, account_id)
+        key = (broker, account_id)
+        feed = self._feeds.get(key)
+        if feed is None:
+            feed = BookFeed(
+                broker,
+                account_id,
+                self.interval,
+                self.queue_size,
+                self._registry,
+                self._books,
+            )
+            self._feeds[key] = feed
+        return feed.subscribe()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            f"{broker}:{account_id or ''}": feed.stats()
+            for (broker, account_id), feed in self._feeds.items()
+        }
+
+
+order_stream = OrderStreamHub(
+    interval=settings.STREAM_POLL_INTERVAL_SECONDS,
+    queue_size=settings.STREAM_QUEUE_SIZE,
+)
@@ -0,0 +1,64 @@
+"""Composition of the interceptor chain around broker adapter calls."""
+
+from ordo.adapters.registry import AdapterRegistry, adapter_registry
+from ordo.config import settings
+from ordo.core.audit import AuditInterceptor, audit_log
+from ordo.core.cache import ReadThroughCache
+from ordo.core.circuit_breaker import BrokerCircuitBreaker
+from ordo.core.metrics import MetricsInterceptor
+from ordo.core.rate_limit import BrokerRateLimiter
+from ordo.core.retry import RetryingInterceptor
+from ordo.core.single_flight import SingleFlight
+from ordo.core.tracing import TracingInterceptor, tracing
+
+traced = TracingInterceptor(tracing)
+read_cache = ReadThroughCache(settings.CACHE_TTL_SECONDS)
+single_flight = SingleFlight(settings.SINGLE_FLIGHT_METHODS)
+circuit_breakers = BrokerCircuitBreaker(
+    failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    window=settings.CIRCUIT_BREAKER_WINDOW_SECONDS,
+    reset_timeout=settings.CIRCUIT_BREAKER_RESET_SECONDS,
+)
+retries = RetryingInterceptor(
+    max_attempts=settings.RETRY_MAX_ATTEMPTS,
+    base_delay=settings.RETRY_BASE_DELAY_SECONDS,
+    multiplier=settings.RETRY_BACKOFF_MULTIPLIER,
+    max_delay=settings.RETRY_MAX_DELAY_SECONDS,
+    budget_ratio=settings.RETRY_BUDGET_RATIO,
+    budget_max_tokens=settings.RETRY_BUDGET_MAX_TOKENS,
+)
+adapter_metrics = MetricsInterceptor()
+audit = AuditInterceptor(audit_log)
+rate_limiter = BrokerRateLimiter(
+    settings.BROKER_RATE_LIMITS,
+    max_queue_depth=settings.RATE_LIMIT_MAX_QUEUE_DEPTH,
+    max_wait=settings.RATE_LIMIT_MAX_WAIT_SECONDS,
+)
+
+
+def install_adapter_pipeline(registry: AdapterRegistry = adapter_registry):
+    """
+    Installs Ordo's interceptors on the registry, outermost first. Safe to
+    call more than once.
+
+    Tracing is outermost so an adapter span covers the whole call. Cache
+    hits skip every later stage, and single-flight then collapses
+    concurrent identical reads into one call, so the metrics and the audit log
+    see each logical broker request once. The circuit breaker sits outside the
+    retries, so one logical call counts once towards tripping it, and fails
+    fast before a call waits for a rate-limit token. The rate limiter is
+    innermost so that every attempt that goes to the broker spends a token.
+    """
+    installed = registry.interceptors
+    for interceptor in (
+        traced,
+        read_cache,
+        single_flight,
+        adapter_metrics,
+        audit,
+        circuit_breakers,
+        retries,
+        rate_limiter,
+    ):
+        if interceptor not in installed:
+            registry.use(interceptor)
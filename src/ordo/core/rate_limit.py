@@ -0,0 +1,214 @@
+"""Per-broker, per-account token-bucket rate limiting for adapter calls."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from ordo.adapters.interceptors import AdapterCall, AdapterInterceptor, Proceed
+from ordo.models.api.errors import ApiError, ApiException
+
+# Lower value = higher priority. Order writes always go ahead of read polling.
+WRITE_PRIORITY = 0
+READ_PRIORITY = 1
+
+
+def _rate_limited(message: str, retry_after: float) -> ApiException:
+    return ApiException(
+        ApiError(
+            error_code="RATE_LIMITED",
+            message=message,
+            details={"retry_after_seconds": round(retry_after, 3)},
+        )
+    )
+
+
+class TokenBucket:
+    """
+    An async token bucket with a bounded, priority-ordered wait queue.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``. When no
+    token is free, callers queue; a single timer hands tokens to the highest
+    priority waiter (FIFO within a priority) as they refill. Raises
+    ValueError unless ``rate`` is positive and ``burst`` at least one token;
+    either would make callers wait forever.
+    """
+
+    def __init__(self, rate: float, burst: float, max_queue_depth: int = 100):
+        if not rate > 0:
+            raise ValueError(f"Token bucket rate must be positive, got {rate!r}")
+        if not burst >= 1:
+            raise ValueError(f"Token bucket burst must be at least 1, got {burst!r}")
+        self.rate = rate
+        self.burst = burst
+        self.max_queue_depth = max_queue_depth
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.acquired = 0
+        self.queued = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def _record_wait(self, waited: float):
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def _prune(self, loop: asyncio.AbstractEventLoop):
+        """Drops finished waiters and any left behind on another event loop."""
+        self._waiters = [
+            w for w in self._waiters if not w[2].done() and w[2].get_loop() is loop
+        ]
+        heapq.heapify(self._waiters)
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        loop = asyncio.get_running_loop()
+        self._prune(loop)
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+        self._prune(loop)
+        if self._waiters:
+            delay = max(0.0, (1 - self._tokens) / self.rate)
+            self._timer_loop = loop
+            self._timer = loop.call_later(delay, self._dispatch)
+
+    def _make_room(self, priority: int) -> bool:
+        """Evicts the newest lower-priority waiter to admit ``priority``."""
+        candidates = [w for w in self._waiters if not w[2].done() and w[0] > priority]
+        if not candidates:
+            return False
+        victim = max(candidates, key=lambda w: (w[0], w[1]))
+        victim[2].set_exception(
+            _rate_limited(
+                "Rate limit queue full; displaced by a higher priority call.",
+                self.retry_after(),
+            )
+        )
+        self.rejected += 1
+        return True
+
+    async def acquire(self, priority: int = READ_PRIORITY, timeout: float = None):
+        """
+        Waits for a token. Raises ApiException(RATE_LIMITED) if the queue is
+        full or the token does not arrive within ``timeout`` seconds.
+        """
+        start = time.monotonic()
+        self._refill()
+        if self._tokens >= 1 and not self.queue_depth:
+            self._tokens -= 1
+            self._record_wait(0.0)
+            return
+
+        if self.queue_depth >= self.max_queue_depth and not self._make_room(priority):
+            self.rejected += 1
+            raise _rate_limited("Rate limit queue full.", self.retry_after())
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self.queued += 1
+        # A timer left behind on another (closed) loop never fires.
+        if self._timer is None or self._timer_loop is not loop:
+            self._dispatch()
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise _rate_limited(
+                f"Rate limit wait exceeded {timeout:.3f}s.", self.retry_after()
+            )
+        self._record_wait(time.monotonic() - start)
+
+    def retry_after(self) -> float:
+        """Seconds until a call queued now would get its token."""
+        return max(0.0, (self.queue_depth + 1 - self._tokens) / self.rate)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": self._tokens,
+            "queue_depth": self.queue_depth,
+            "acquired": self.acquired,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "avg_wait_ms": (
+                self.total_wait / self.acquired * 1000 if self.acquired else 0.0
+            ),
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+
+class BrokerRateLimiter(AdapterInterceptor):
+    """
+    Enforces broker rate limits (FR23) with one token bucket per broker and
+    account (api_key). Brokers missing from ``limits`` are not limited.
+    Invalid limits raise ValueError here rather than on a broker's first call.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, Mapping[str, float]],
+        max_queue_depth: int = 100,
+        max_wait: Optional[float] = None,
+    ):
+        self._limits = {broker: dict(limit) for broker, limit in limits.items()}
+        self._max_queue_depth = max_queue_depth
+        self._max_wait = max_wait
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        for limit in self._limits.values():
+            if limit:
+                TokenBucket(limit["rate"], limit.get("burst", limit["rate"]))
+
+    def bucket_for(self, broker_id: str, account_key: str) -> Optional[TokenBucket]:
+        limit = self._limits.get(broker_id)
+        if not limit:
+            return None
+        key = (broker_id, account_key)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(
+                limit["rate"],
+                limit.get("burst", limit["rate"]),
+                self._max_queue_depth,
+            )
+            self._buckets[key] = bucket
+        return bucket
+
+    async def __call__(self, call: AdapterCall, proceed: Proceed) -> Any:
+        bucket = self.bucket_for(call.broker_id, call.account_key)
+        if bucket is not None:
+            priority = WRITE_PRIORITY if call.is_write else READ_PRIORITY
+            await bucket.acquire(priority, self._max_wait)
+        return await proceed()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {
+            f"{broker_id}:{account_key}": bucket.stats()
+            for (broker_id, account_key), bucket in self._buckets.items()
+        }
@@ -0,0 +1,221 @@
+"""Retries for transient broker failures."""
+
+import asyncio
+import random
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import httpx
+
+from ordo.adapters.interceptors import AdapterCall, AdapterInterceptor, Proceed
+from ordo.core.circuit_breaker import broker_status_code
+from ordo.models.api.errors import ApiException
+
+_idempotency_key: ContextVar[Optional[str]] = ContextVar(
+    "idempotency_key", default=None
+)
+
+
+@contextmanager
+def idempotency_key_scope(key: Optional[str]) -> Iterator[None]:
+    """Marks adapter calls made within the scope as covered by ``key``."""
+    token = _idempotency_key.set(key)
+    try:
+        yield
+    finally:
+        _idempotency_key.reset(token)
+
+
+def current_idempotency_key() -> Optional[str]:
+    return _idempotency_key.get()
+
+
+def _transport_error(exc: BaseException) -> Optional[httpx.TransportError]:
+    """Finds an httpx transport error, following the wrapped-exception chain."""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        if isinstance(exc, httpx.TransportError):
+            return exc
+        seen.add(id(exc))
+        exc = exc.__cause__ or exc.__context__
+    return None
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Parses a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return parse_retry_after(exc.response.headers.get("Retry-After"))
+    if isinstance(exc, ApiException) and isinstance(exc.error.details, dict):
+        return parse_retry_after(exc.error.details.get("retry_after"))
+    return None
+
+
+@dataclass(frozen=True)
+class RetryDecision:
+    """Why an error may be retried, and whether the request reached the broker."""
+
+    reason: str
+    request_sent: bool = True
+    retry_after: Optional[float] = None
+
+
+def classify(exc: BaseException) -> Optional[RetryDecision]:
+    """
+    Returns a RetryDecision for transient errors (connect errors, timeouts,
+    429 and 5xx responses), or None when retrying cannot help.
+    """
+    status_code = broker_status_code(exc)
+    if status_code == 429:
+        return RetryDecision("rate_limited", retry_after=_retry_after(exc))
+    if status_code is not None and status_code >= 500:
+        return RetryDecision("server_error", retry_after=_retry_after(exc))
+    if status_code is not None:
+        return None
+    transport_error = _transport_error(exc)
+    if isinstance(transport_error, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return RetryDecision("connect_error", request_sent=False)
+    if transport_error is not None:
+        return RetryDecision("transport_error")
+    return None
+
+
+class RetryBudget:
+    """
+    Caps retries for one broker at a fraction of its traffic.
+
+    Every first attempt deposits ``ratio`` tokens (up to ``max_tokens``) and
+    every retry spends one, so a broker that is down for everyone cannot
+    multiply our load on it.
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+
+    def deposit(self):
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+
+class RetryingInterceptor(AdapterInterceptor):
+    """
+    Retries transient adapter failures with exponential backoff and full
+    jitter, within a per-broker retry budget.
+
+    Writes are only retried when the request never reached the broker
+    (connect errors). An Idempotency-Key deduplicates a client's retries at
+    Ordo, not Ordo's retries at the broker, so it does not make a write that
+    may have been received safe to send again.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        multiplier: float = 2.0,
+        max_delay: float = 4.0,
+        budget_ratio: float = 0.2,
+        budget_max_tokens: float = 10.0,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self._budget_ratio = budget_ratio
+        self._budget_max_tokens = budget_max_tokens
+        self._budgets: Dict[str, RetryBudget] = {}
+        self.attempts: Counter = Counter()
+        self.outcomes: Counter = Counter()
+
+    def budget_for(self, broker_id: str) -> RetryBudget:
+        budget = self._budgets.get(broker_id)
+        if budget is None:
+            budget = RetryBudget(self._budget_ratio, self._budget_max_tokens)
+            self._budgets[broker_id] = budget
+        return budget
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number ``attempt`` (1-based)."""
+        ceiling = self.base_delay * self.multiplier ** (attempt - 1)
+        return random.uniform(0, min(self.max_delay, ceiling))
+
+    def _delay(
+        self, call: AdapterCall, exc: BaseException, attempt: int
+    ) -> Tuple[Optional[float], str]:
+        decision = classify(exc)
+        if decision is None:
+            return None, "not_retryable"
+        if attempt >= self.max_attempts:
+            return None, "exhausted"
+        if call.is_write and decision.request_sent:
+            return None, "unsafe_write"
+        delay = self.backoff(attempt)
+        if decision.retry_after is not None:
+            if decision.retry_after > self.max_delay:
+                return None, "retry_after_too_long"
+            delay = max(delay, decision.retry_after)
+        if not self.budget_for(call.broker_id).try_spend():
+            return None, "budget_exhausted"
+        return delay, decision.reason
+
+    async def __call__(self, call: AdapterCall, proceed: Proceed) -> Any:
+        self.budget_for(call.broker_id).deposit()
+        attempt = 1
+        while True:
+            self.attempts[(call.broker_id, call.method, "attempt")] += 1
+            try:
+                return await proceed()
+            except Exception as e:
+                delay, reason = self._delay(call, e, attempt)
+                if delay is None:
+                    if attempt > 1:
+                        self.outcomes[(call.broker_id, call.method, reason)] += 1
+                    raise
+                self.attempts[(call.broker_id, call.method, reason)] += 1
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def stats(self) -> Dict[str, Any]:
+        retries: Dict[str, Dict[str, int]] = {}
+        for (broker_id, method, reason), count in self.attempts.items():
+            retries.setdefault(f"{broker_id}:{method}", {})[reason] = count
+        for (broker_id, method, reason), count in self.outcomes.items():
+            retries.setdefault(f"{broker_id}:{method}", {})[f"gave_up_{reason}"] = count
+        return {
+            "retries": retries,
+            "budgets": {
+                broker_id: round(budget.tokens, 3)
+                for broker_id, budget in self._budgets.items()
+            },
+        }
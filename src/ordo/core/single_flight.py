@@ -0,0 +1,78 @@
+"""Single-flight coalescing of identical concurrent broker reads."""
+
+import asyncio
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from ordo.adapters.interceptors import AdapterCall, AdapterInterceptor, Proceed
+
+FlightKey = Tuple[str, str, Optional[str], str]
+
+
+class SingleFlight(AdapterInterceptor):
+    """
+    Shares one in-flight broker call between concurrent identical reads.
+
+    Reads are keyed on (broker, account, method). The first caller starts the
+    call and everyone arriving before it finishes awaits the same result (or
+    exception), so a burst of polls for one account costs one broker request
+    and one rate-limit token. Nothing is kept once the call completes; that
+    is the read cache's job.
+
+    ``methods`` maps a read method to whether it is coalesced. A write on an
+    account detaches that account's in-flight reads, so callers arriving
+    after the write start a fresh call instead of joining one that may have
+    read the book before it. Shared results must be treated as read-only.
+    """
+
+    def __init__(self, methods: Mapping[str, bool]):
+        self._methods = dict(methods)
+        self._inflight: Dict[FlightKey, asyncio.Future] = {}
+        self.calls: Dict[str, int] = {}
+        self.coalesced: Dict[str, int] = {}
+
+    def enabled_for(self, method: str) -> bool:
+        return self._methods.get(method, False)
+
+    def forget(self, broker_id: str, account_key: str, account_id: Optional[str]):
+        """Stops new callers from joining an account's in-flight reads."""
+        account = (broker_id, account_key, account_id)
+        for key in [k for k in self._inflight if k[:3] == account]:
+            del self._inflight[key]
+
+    async def __call__(self, call: AdapterCall, proceed: Proceed) -> Any:
+        if call.is_write:
+            self.forget(call.broker_id, call.account_key, call.account_id)
+            return await proceed()
+        if not self.enabled_for(call.method):
+            return await proceed()
+
+        key = (call.broker_id, call.account_key, call.account_id, call.method)
+        flight = self._inflight.get(key)
+        if flight is not None:
+            self.coalesced[call.method] = self.coalesced.get(call.method, 0) + 1
+        else:
+            self.calls[call.method] = self.calls.get(call.method, 0) + 1
+            flight = asyncio.ensure_future(proceed())
+            self._inflight[key] = flight
+            flight.add_done_callback(lambda f: self._landed(key, f))
+        # Shield so one caller's cancellation does not cancel the shared call.
+        return await asyncio.shield(flight)
+
+    def _landed(self, key: FlightKey, flight: asyncio.Future):
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        # Consume the exception if every waiter has gone away.
+        if not flight.cancelled():
+            flight.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": len(self._inflight),
+            "methods": {
+                method: {
+                    "calls": self.calls.get(method, 0),
+                    "coalesced": self.coalesced.get(method, 0),
+                }
+                for method in sorted(set(self.calls) | set(self.coalesced))
+            },
+        }
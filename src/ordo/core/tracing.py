@@ -0,0 +1,327 @@
+"""Lightweight tracing spans with an in-process exporter."""
+
+import asyncio
+import json
+import logging
+import random
+import time
+import uuid
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from contextlib import nullcontext
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+import httpx
+
+from ordo.adapters.interceptors import AdapterCall, AdapterInterceptor, Proceed
+from ordo.config import settings
+from ordo.core.audit import current_correlation_id
+
+logger = logging.getLogger(__name__)
+
+# Marks the context of a trace that head sampling left out, so that nothing
+# below its root records a span.
+_UNSAMPLED = object()
+_current_span: ContextVar[Any] = ContextVar("current_span", default=None)
+_NOT_RECORDING = nullcontext()
+
+
+class Span:
+    """One timed operation within a trace."""
+
+    __slots__ = (
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "name",
+        "attributes",
+        "status",
+        "start_time",
+        "_start",
+        "duration",
+    )
+
+    def __init__(
+        self,
+        trace_id: str,
+        parent_id: Optional[str],
+        name: str,
+        attributes: Dict[str, Any],
+    ):
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = attributes
+        self.status = "ok"
+        self.start_time = time.time()
+        self._start = time.perf_counter()
+        self.duration: Optional[float] = None
+
+    def set(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def end(self):
+        self.duration = time.perf_counter() - self._start
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_time": self.start_time,
+            "duration_ms": round(self.duration * 1000, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class RingBufferExporter:
+    """Keeps the most recent ``max_spans`` finished spans in memory."""
+
+    def __init__(self, max_spans: int = 5000):
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, span: Span):
+        self._spans.append(span)
+
+    def trace(self, trace_id: str) -> List[Dict[str, Any]]:
+        """Returns a trace's spans in the order they started."""
+        spans = [s for s in self._spans if s.trace_id == trace_id]
+        return [s.to_dict() for s in sorted(spans, key=lambda s: s.start_time)]
+
+    def traces(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Summarizes the most recent traces, newest first."""
+        traces: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        for span in reversed(self._spans):
+            summary = traces.get(span.trace_id)
+            if summary is None:
+                if len(traces) == limit:
+                    continue
+                summary = traces[span.trace_id] = {
+                    "trace_id": span.trace_id,
+                    "root": None,
+                    "duration_ms": None,
+                    "spans": 0,
+                }
+            summary["spans"] += 1
+            if span.parent_id is None:
+                summary["root"] = span.name
+                summary["duration_ms"] = round(span.duration * 1000, 3)
+        return list(traces.values())
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+
+class FileExporter:
+    """
+    Appends finished spans to ``path`` as line-delimited JSON. Spans are
+    buffered and written from a worker thread by :meth:`run`, never on the
+    request path.
+    """
+
+    def __init__(self, path: str, interval: float = 1.0):
+        self.path = path
+        self.interval = interval
+        self._pending: List[Span] = []
+        self.written = 0
+
+    def export(self, span: Span):
+        self._pending.append(span)
+
+    async def run(self):
+        """Writes buffered spans every ``interval`` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    async def flush(self):
+        spans, self._pending = self._pending, []
+        if spans:
+            lines = [span.to_dict() for span in spans]
+            try:
+                await asyncio.to_thread(self._write, lines)
+            except OSError:
+                logger.exception("Failed to write %d spans", len(lines))
+
+    def _write(self, lines: List[Dict[str, Any]]):
+        with open(self.path, "a") as f:
+            f.writelines(json.dumps(line, default=str) + "\n" for line in lines)
+        self.written += len(lines)
+
+
+class _SpanScope:
+    __slots__ = ("_tracer", "_span", "_token")
+
+    def __init__(self, tracer: "Tracer", span: Span):
+        self._tracer = tracer
+        self._span = span
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self._span.status = exc_type.__name__
+        self._tracer.end_span(self._span)
+
+
+class _UnsampledScope:
+    __slots__ = ("_token",)
+
+    def __enter__(self) -> None:
+        self._token = _current_span.set(_UNSAMPLED)
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_span.reset(self._token)
+
+
+class Tracer:
+    """
+    Records spans of sampled traces and hands finished ones to exporters.
+
+    Sampling is decided once, at a trace's root, with probability
+    ``sample_rate``; every span under an unsampled root is a shared no-op
+    context, so tracing costs one context-variable read per span on most
+    requests. A trace's id is the request's correlation id, so a slow
+    response's ``correlation_id`` finds its trace directly.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.05,
+        exporters: Sequence[Any] = (),
+        enabled: bool = True,
+    ):
+        self.sample_rate = sample_rate
+        self.exporters = list(exporters)
+        self.enabled = enabled
+        self.started = 0
+        self.sampled = 0
+
+    def span(self, name: str, **attributes: Any):
+        """
+        Returns a context manager timing ``name`` as a child of the current
+        span, or as the root of a new trace. It yields the span, or None when
+        the trace is not being recorded.
+        """
+        parent = _current_span.get()
+        if parent is _UNSAMPLED or not self.enabled:
+            return _NOT_RECORDING
+        if parent is None:
+            self.started += 1
+            if random.random() >= self.sample_rate:
+                return _UnsampledScope()
+            self.sampled += 1
+            trace_id = current_correlation_id() or str(uuid.uuid4())
+            return _SpanScope(self, Span(trace_id, None, name, attributes))
+        return _SpanScope(self, Span(parent.trace_id, parent.span_id, name, attributes))
+
+    def start_span(self, name: str, **attributes: Any) -> Optional[Span]:
+        """
+        Starts a child of the current span without making it current, for
+        work that starts and ends in different callbacks. Only recorded
+        inside a sampled trace; pass the result to :meth:`end_span`.
+        """
+        parent = _current_span.get()
+        if not isinstance(parent, Span):
+            return None
+        return Span(parent.trace_id, parent.span_id, name, attributes)
+
+    def end_span(self, span: Span):
+        span.end()
+        for exporter in self.exporters:
+            exporter.export(span)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "traces_started": self.started,
+            "traces_sampled": self.sampled,
+        }
+
+
+class TracingInterceptor(AdapterInterceptor):
+    """Wraps every adapter call in an ``adapter.<method>`` span."""
+
+    def __init__(self, tracer: Tracer):
+        self._tracer = tracer
+
+    async def __call__(self, call: AdapterCall, proceed: Proceed) -> Any:
+        with self._tracer.span(
+            f"adapter.{call.method}",
+            broker=call.broker_id,
+            account_id=call.account_id,
+        ):
+            return await proceed()
+
+
+class TracingMiddleware:
+    """
+    Pure ASGI middleware that makes every HTTP request the root span of its
+    trace, ``<METHOD> <path>``, with the response status as an attribute.
+    """
+
+    def __init__(self, app, tracer: Optional[Tracer] = None):
+        self.app = app
+        self._tracer = tracer or tracing
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with self._tracer.span(f"{scope['method']} {scope['path']}") as span:
+            if span is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_with_status(message):
+                if message["type"] == "http.response.start":
+                    span.set("http.status_code", message["status"])
+                await send(message)
+
+            await self.app(scope, receive, send_with_status)
+
+
+def httpx_event_hooks(tracer: Tracer, broker_id: str) -> Dict[str, List[Any]]:
+    """
+    Returns httpx event hooks that record each broker HTTP request as an
+    ``http <METHOD>`` span. The span ends when the response headers arrive;
+    requests that fail before that are not recorded.
+    """
+
+    async def on_request(request: httpx.Request):
+        span = tracer.start_span(
+            f"http {request.method}",
+            broker=broker_id,
+            url=str(request.url.copy_with(query=None)),
+        )
+        if span is not None:
+            request.extensions["ordo_span"] = span
+
+    async def on_response(response: httpx.Response):
+        span = response.request.extensions.get("ordo_span")
+        if span is not None:
+            span.set("http.status_code", response.status_code)
+            tracer.end_span(span)
+
+    return {"request": [on_request], "response": [on_response]}
+
+
+span_buffer = RingBufferExporter(settings.TRACE_BUFFER_SPANS)
+span_file = (
+    FileExporter(settings.TRACE_EXPORT_PATH, settings.TRACE_FLUSH_INTERVAL_SECONDS)
+    if settings.TRACE_EXPORT_PATH
+    else None
+)
+tracing = Tracer(
+    sample_rate=settings.TRACE_SAMPLE_RATE,
+    exporters=[e for e in (span_buffer, span_file) if e is not None],
+    enabled=settings.TRACING_ENABLED,
+)
@@ -0,0 +1,24 @@
+"""Background job that prunes expired idempotency keys."""
+
+import asyncio
+import logging
+
+from ordo.core.idempotency import IdempotencyManager
+
+logger = logging.getLogger(__name__)
+
+
+async def idempotency_cleanup(manager: IdempotencyManager, interval: float):
+    """
+    Sweeps expired idempotency keys every ``interval`` seconds until
+    cancelled. A failed sweep is logged and retried on the next tick.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            removed = manager.sweep()
+        except Exception:
+            logger.exception("Idempotency cleanup failed")
+            continue
+        if removed:
+            logger.info("Removed %d expired idempotency keys", removed)
@@ -1,17 +1,91 @@
-from fastapi import FastAPI, APIRouter, HTTPException, status, Body
-from ordo.security.authentication import authentication_middleware
-from ordo.config import get_adapter
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, APIRouter, HTTPException, Request, status, Body
+from ordo.adapters.http_pool import http_clients
+from ordo.core.audit import AuditMiddleware, audit_log
+from ordo.api.metrics import router as metrics_router
+from ordo.api.v1 import api_router
+from ordo.api.v1.responses import error_response
+from ordo.security.authentication import AuthenticationMiddleware
+from ordo.security.edge_limit import EdgeRateLimitMiddleware
+from ordo.security.tokens import token_index
+from ordo.config import get_adapter, settings
+from ordo.core.idempotency import idempotency
+from ordo.core.kill_switch import kill_switch
+from ordo.core.concurrency import parse_pool
+from ordo.core.loop_monitor import loop_monitor, slow_callbacks
+from ordo.core.metrics import metrics
+from ordo.core.tracing import TracingMiddleware, span_file
+from ordo.core.pipeline import install_adapter_pipeline
+from ordo.jobs.idempotency_cleanup import idempotency_cleanup
 from ordo.models.api.login import (
     LoginInitiateRequest,
     LoginInitiateResponse,
     LoginCompleteRequest,
     LoginCompleteResponse,
 )
-from ordo.models.api.errors import ApiError
-
-app = FastAPI()
-
-app.middleware("http")(authentication_middleware)
+from ordo.models.api.errors import ApiError, ApiException
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    kill_switch.load()
+    token_index.reload()
+    # The shared broker HTTP clients live for the lifetime of the app.
+    async with http_clients:
+        background = [
+            asyncio.create_task(
+                idempotency_cleanup(
+                    idempotency, settings.IDEMPOTENCY_SWEEP_INTERVAL_SECONDS
+                )
+            ),
+            asyncio.create_task(
+                kill_switch.watch(settings.KILL_SWITCH_POLL_INTERVAL_SECONDS)
+            ),
+            asyncio.create_task(
+                token_index.watch(settings.API_TOKEN_POLL_INTERVAL_SECONDS)
+            ),
+            asyncio.create_task(audit_log.run()),
+            asyncio.create_task(loop_monitor.run()),
+        ]
+        if metrics.directory:
+            background.append(asyncio.create_task(metrics.run()))
+        if span_file is not None:
+            background.append(asyncio.create_task(span_file.run()))
+        if settings.SLOW_CALLBACK_DETECTION_ENABLED:
+            slow_callbacks.start()
+        try:
+            yield
+        finally:
+            slow_callbacks.stop()
+            parse_pool.shutdown()
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
+            # Whatever the writer had not reached yet.
+            await audit_log.flush()
+            if span_file is not None:
+                await span_file.flush()
+
+
+install_adapter_pipeline()
+
+app = FastAPI(lifespan=lifespan)
+
+# The last middleware added runs first: the audit log sees every request,
+# rejected or not, and sets the correlation id the trace is keyed on, and
+# authentication identifies the client before the edge limiter applies that
+# client's quota.
+app.add_middleware(EdgeRateLimitMiddleware)
+app.add_middleware(AuthenticationMiddleware)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(AuditMiddleware)
+
+
+@app.exception_handler(ApiException)
+async def api_exception_handler(request: Request, exc: ApiException):
+    return error_response(exc)
 
 
 @app.get("/health")
@@ -102,3 +176,5 @@ async def complete_login(
 
 
 app.include_router(auth_router)
+app.include_router(api_router)
+app.include_router(metrics_router)
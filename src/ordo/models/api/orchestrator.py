@@ -0,0 +1,118 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional
+
+from ordo.models.api.errors import ApiError
+
+ReadOperation = Literal[
+    "get_portfolio",
+    "get_order_book",
+    "get_trade_book",
+    "get_profile",
+    "get_holdings",
+    "get_positions",
+]
+
+
+class BrokerTarget(BaseModel):
+    broker: str = Field(..., description="The broker adapter to call.")
+    account_id: Optional[str] = Field(
+        None, description="Optional account the adapter instance is bound to."
+    )
+    session_data: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Session data for the broker, as returned by the login flow.",
+    )
+
+
+class FanOutRequest(BaseModel):
+    operation: ReadOperation = Field(
+        ..., description="The adapter read operation to run against every target."
+    )
+    targets: List[BrokerTarget] = Field(
+        ..., min_length=1, description="The broker/account targets to query."
+    )
+    target_timeout_ms: Optional[int] = Field(
+        None, gt=0, description="Per-target timeout; defaults to server config."
+    )
+    deadline_ms: Optional[int] = Field(
+        None, gt=0, description="Overall deadline; defaults to server config."
+    )
+
+
+class PlaceOrderRequest(BaseModel):
+    targets: List[BrokerTarget] = Field(
+        ..., min_length=1, description="The broker/account targets to place with."
+    )
+    order: Dict[str, Any] = Field(
+        ..., description="The order, in the broker adapter's order format."
+    )
+    target_timeout_ms: Optional[int] = Field(
+        None, gt=0, description="Per-target timeout; defaults to server config."
+    )
+
+
+class ModifyOrderRequest(BaseModel):
+    changes: Dict[str, Any] = Field(
+        ...,
+        min_length=1,
+        description="The order fields to change, in the broker adapter's format.",
+    )
+    target_timeout_ms: Optional[int] = Field(
+        None, gt=0, description="Broker call timeout; defaults to server config."
+    )
+
+
+class BasketLeg(BrokerTarget):
+    order: Dict[str, Any] = Field(
+        ..., description="The order, in the broker adapter's order format."
+    )
+
+
+class BasketOrderRequest(BaseModel):
+    legs: List[BasketLeg] = Field(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="The orders to place. Legs for the same broker account "
+        "share the session data of the first such leg.",
+    )
+    all_or_cancel: bool = Field(
+        False,
+        description="If any leg fails, cancel every leg that was placed.",
+    )
+    deadline_ms: Optional[int] = Field(
+        None, gt=0, description="Overall deadline; defaults to server config."
+    )
+
+
+class BrokerResult(BaseModel):
+    broker_id: str = Field(..., description="The broker this result belongs to.")
+    account_id: Optional[str] = Field(None, description="The targeted account.")
+    status: Literal["success", "failed", "pending"] = Field(
+        ..., description="Outcome of the call to this broker."
+    )
+    code: Optional[str] = Field(
+        None, description="Standardized error code, e.g. TIMEOUT or CB_OPEN."
+    )
+    message: Optional[str] = Field(None, description="Human-readable detail.")
+    payload: Optional[Any] = Field(
+        None, description="The normalized broker response on success."
+    )
+    latency_ms: Optional[int] = Field(None, description="Latency of the call.")
+    cache_age_ms: Optional[int] = Field(
+        None, description="Age of the cached data served, if it came from cache."
+    )
+
+
+class UnifiedResponse(BaseModel):
+    overall_status: Literal["success", "partial_success", "failure"] = Field(
+        ..., description="Collated status across all targets."
+    )
+    results: List[BrokerResult] = Field(
+        ..., description="One entry per targeted broker, in request order."
+    )
+    correlation_id: str = Field(..., description="A unique ID for tracing.")
+    elapsed_ms: int = Field(..., description="Wall-clock time for the request.")
+    errors: Optional[List[ApiError]] = Field(
+        None, description="Aggregated errors, if any."
+    )
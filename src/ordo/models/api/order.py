@@ -1,6 +1,7 @@
 from datetime import datetime
 from pydantic import BaseModel, Field
 from enum import Enum
+from typing import Any, Dict, List, Optional
 
 
 class ExchangeType(str, Enum):
@@ -115,3 +116,22 @@ class Position(BaseModel):
 class OrderResponse(BaseModel):
     order_id: str
     status: str
+
+
+class OrderBookDelta(BaseModel):
+    epoch: str = Field(
+        ..., description="Identifies the book the version numbers belong to."
+    )
+    version: int = Field(..., description="Version of the book this reflects.")
+    since: Optional[int] = Field(
+        None, description="The version the delta starts after; null if full."
+    )
+    full: bool = Field(
+        ..., description="True if orders is the whole book rather than a delta."
+    )
+    orders: List[Dict[str, Any]] = Field(
+        ..., description="Orders added or changed after since (all if full)."
+    )
+    removed: List[str] = Field(
+        ..., description="IDs of orders that left the book after since."
+    )
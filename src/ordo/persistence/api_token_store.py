@@ -0,0 +1,136 @@
+"""Storage backends for hashed API tokens."""
+
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional
+
+from ordo.config import settings
+from ordo.persistence.database import connect
+
+
+@dataclass(frozen=True)
+class ApiTokenRecord:
+    """One API client: the SHA-256 hex digest of its token and its scopes."""
+
+    client_id: str
+    token_hash: str
+    scopes: FrozenSet[str]
+
+
+class IApiTokenStore(ABC):
+    """Interface for persisting API tokens. Plaintext tokens are never stored."""
+
+    @abstractmethod
+    def load_all(self) -> List[ApiTokenRecord]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, record: ApiTokenRecord):
+        """Adds a client, or replaces the token and scopes of an existing one."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, client_id: str) -> bool:
+        """Removes a client; returns whether it existed."""
+        raise NotImplementedError
+
+    def changed(self) -> bool:
+        """
+        Tells cheaply whether another process may have written since the last
+        call. Stores that are not shared between processes never change.
+        """
+        return False
+
+
+class InMemoryApiTokenStore(IApiTokenStore):
+    """Process-local store; issued tokens are lost on restart."""
+
+    def __init__(self):
+        self._records: Dict[str, ApiTokenRecord] = {}
+
+    def load_all(self) -> List[ApiTokenRecord]:
+        return list(self._records.values())
+
+    def save(self, record: ApiTokenRecord):
+        self._records[record.client_id] = record
+
+    def delete(self, client_id: str) -> bool:
+        return self._records.pop(client_id, None) is not None
+
+
+class SQLiteApiTokenStore(IApiTokenStore):
+    """
+    DbApiToken-backed store. Like the kill-switch store, it uses
+    ``PRAGMA data_version`` so every worker notices issued and revoked
+    tokens without re-reading the table.
+    """
+
+    def __init__(self, path: str):
+        self._conn = connect(path)
+        self._lock = threading.Lock()
+        self._data_version = self._read_data_version()
+
+    def _read_data_version(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def load_all(self) -> List[ApiTokenRecord]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT client_id, token_hash, scopes FROM DbApiToken"
+            ).fetchall()
+        return [
+            ApiTokenRecord(
+                client_id=row["client_id"],
+                token_hash=row["token_hash"],
+                scopes=frozenset(row["scopes"].split()),
+            )
+            for row in rows
+        ]
+
+    def save(self, record: ApiTokenRecord):
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO DbApiToken (client_id, token_hash, scopes)
+                VALUES (?, ?, ?)
+                ON CONFLICT (client_id) DO UPDATE SET
+                    token_hash = excluded.token_hash,
+                    scopes = excluded.scopes
+                """,
+                (record.client_id, record.token_hash, " ".join(sorted(record.scopes))),
+            )
+
+    def delete(self, client_id: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM DbApiToken WHERE client_id = ?", (client_id,)
+            )
+        return cursor.rowcount > 0
+
+    def changed(self) -> bool:
+        with self._lock:
+            data_version = self._read_data_version()
+            changed = data_version != self._data_version
+            self._data_version = data_version
+        return changed
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_api_token_store: Optional[IApiTokenStore] = None
+
+
+def get_api_token_store() -> IApiTokenStore:
+    """Returns the process-wide API token store configured in settings."""
+    global _api_token_store
+    if _api_token_store is None:
+        if settings.API_TOKEN_STORE == "sqlite":
+            _api_token_store = SQLiteApiTokenStore(settings.DATABASE_PATH)
+        elif settings.API_TOKEN_STORE == "memory":
+            _api_token_store = InMemoryApiTokenStore()
+        else:
+            raise ValueError(f"Unknown API token store: {settings.API_TOKEN_STORE}")
+    return _api_token_store
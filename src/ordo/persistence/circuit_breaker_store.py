@@ -0,0 +1,113 @@
+"""Storage backends for circuit breaker state."""
+
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+from ordo.config import settings
+from ordo.persistence.database import connect, from_db_datetime, to_db_datetime
+
+
+@dataclass(frozen=True)
+class CircuitBreakerRecord:
+    """A persisted circuit breaker snapshot (one DbCircuitBreakerState row)."""
+
+    adapter_id: str
+    state: str
+    failure_count: int = 0
+    last_failure_at: Optional[datetime] = None
+
+
+class ICircuitBreakerStore(ABC):
+    """Interface for persisting circuit breaker state across restarts."""
+
+    @abstractmethod
+    def load(self, adapter_id: str) -> Optional[CircuitBreakerRecord]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, record: CircuitBreakerRecord):
+        raise NotImplementedError
+
+
+class InMemoryCircuitBreakerStore(ICircuitBreakerStore):
+    """Process-local store; breakers start CLOSED after a restart."""
+
+    def __init__(self):
+        self._records: Dict[str, CircuitBreakerRecord] = {}
+
+    def load(self, adapter_id: str) -> Optional[CircuitBreakerRecord]:
+        return self._records.get(adapter_id)
+
+    def save(self, record: CircuitBreakerRecord):
+        self._records[record.adapter_id] = record
+
+
+class SQLiteCircuitBreakerStore(ICircuitBreakerStore):
+    """DbCircuitBreakerState-backed store."""
+
+    def __init__(self, path: str):
+        self._conn = connect(path)
+        self._lock = threading.Lock()
+
+    def load(self, adapter_id: str) -> Optional[CircuitBreakerRecord]:
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT state, failure_count, last_failure_at
+                FROM DbCircuitBreakerState WHERE adapter_id = ?
+                """,
+                (adapter_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CircuitBreakerRecord(
+            adapter_id=adapter_id,
+            state=row["state"],
+            failure_count=row["failure_count"],
+            last_failure_at=from_db_datetime(row["last_failure_at"]),
+        )
+
+    def save(self, record: CircuitBreakerRecord):
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO DbCircuitBreakerState (
+                    adapter_id, state, failure_count, last_failure_at
+                ) VALUES (?, ?, ?, ?)
+                ON CONFLICT (adapter_id) DO UPDATE SET
+                    state = excluded.state,
+                    failure_count = excluded.failure_count,
+                    last_failure_at = excluded.last_failure_at
+                """,
+                (
+                    record.adapter_id,
+                    record.state,
+                    record.failure_count,
+                    to_db_datetime(record.last_failure_at),
+                ),
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_circuit_breaker_store: Optional[ICircuitBreakerStore] = None
+
+
+def get_circuit_breaker_store() -> ICircuitBreakerStore:
+    """Returns the process-wide circuit breaker store configured in settings."""
+    global _circuit_breaker_store
+    if _circuit_breaker_store is None:
+        if settings.CIRCUIT_BREAKER_STORE == "sqlite":
+            _circuit_breaker_store = SQLiteCircuitBreakerStore(settings.DATABASE_PATH)
+        elif settings.CIRCUIT_BREAKER_STORE == "memory":
+            _circuit_breaker_store = InMemoryCircuitBreakerStore()
+        else:
+            raise ValueError(
+                f"Unknown circuit breaker store: {settings.CIRCUIT_BREAKER_STORE}"
+            )
+    return _circuit_breaker_store
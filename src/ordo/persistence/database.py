@@ -0,0 +1,139 @@
+"""SQLite connection handling and schema for Ordo's local database."""
+
+import sqlite3
+from datetime import datetime, timezone
+from typing import Optional
+
+# DDL from docs/architecture/8-database-schema.md.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS DbSession (
+    broker_id TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    access_token_encrypted TEXT NOT NULL,
+    refresh_token_encrypted TEXT,
+    access_expires_at DATETIME NOT NULL,
+    refresh_expires_at DATETIME,
+    metadata_json TEXT,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (broker_id, account_id)
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_session_updated
+AFTER UPDATE ON DbSession
+FOR EACH ROW
+BEGIN
+    UPDATE DbSession SET updated_at = CURRENT_TIMESTAMP
+    WHERE broker_id = OLD.broker_id AND account_id = OLD.account_id;
+END;
+
+CREATE TABLE IF NOT EXISTS DbIdempotencyRecord (
+    key TEXT PRIMARY KEY,
+    response_snapshot_json TEXT NOT NULL,
+    expires_at DATETIME NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS DbKillSwitch (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    is_active BOOLEAN NOT NULL DEFAULT 0,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_killswitch_updated
+AFTER UPDATE ON DbKillSwitch
+FOR EACH ROW
+BEGIN
+    UPDATE DbKillSwitch SET updated_at = CURRENT_TIMESTAMP WHERE id = 1;
+END;
+
+CREATE TABLE IF NOT EXISTS DbCircuitBreakerState (
+    adapter_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL CHECK(state IN ('CLOSED', 'OPEN', 'HALF_OPEN')),
+    failure_count INTEGER NOT NULL DEFAULT 0,
+    last_failure_at DATETIME,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_circuitbreaker_updated
+AFTER UPDATE ON DbCircuitBreakerState
+FOR EACH ROW
+BEGIN
+    UPDATE DbCircuitBreakerState SET updated_at = CURRENT_TIMESTAMP
+    WHERE adapter_id = OLD.adapter_id;
+END;
+
+CREATE TABLE IF NOT EXISTS DbApiToken (
+    client_id TEXT PRIMARY KEY,
+    token_hash TEXT NOT NULL UNIQUE,
+    scopes TEXT NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS DbAuditLogEntry (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    correlation_id TEXT NOT NULL,
+    timestamp DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    component TEXT NOT NULL,
+    action TEXT NOT NULL,
+    outcome TEXT,
+    payload_json TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_idempotency_expires_at
+ON DbIdempotencyRecord(expires_at);
+
+CREATE INDEX IF NOT EXISTS idx_session_account
+ON DbSession(account_id);
+
+CREATE INDEX IF NOT EXISTS idx_audit_log_timestamp
+ON DbAuditLogEntry(timestamp);
+
+CREATE INDEX IF NOT EXISTS idx_audit_log_correlation_id
+ON DbAuditLogEntry(correlation_id);
+
+CREATE INDEX IF NOT EXISTS idx_circuitbreaker_updated
+ON DbCircuitBreakerState(updated_at);
+"""
+
+
+def connect(path: str, busy_timeout_ms: int = 5000) -> sqlite3.Connection:
+    """
+    Opens a connection to the Ordo database in WAL mode and ensures the schema.
+
+    WAL lets several uvicorn workers read concurrently while one writes. The
+    connection runs in autocommit mode; callers open explicit transactions
+    (``BEGIN IMMEDIATE``) for read-modify-write sequences.
+    """
+    conn = sqlite3.connect(
+        path,
+        timeout=busy_timeout_ms / 1000,
+        isolation_level=None,
+        check_same_thread=False,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+    if path != ":memory:":
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def to_db_datetime(value: Optional[datetime]) -> Optional[str]:
+    """Serializes a datetime as an ISO-8601 UTC string."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def from_db_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parses a datetime written by :func:`to_db_datetime`."""
+    if value is None:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
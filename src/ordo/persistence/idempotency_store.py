@@ -0,0 +1,203 @@
+"""Storage backends for idempotency records."""
+
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from ordo.config import settings
+from ordo.persistence.database import connect, from_db_datetime, to_db_datetime
+
+
+@dataclass(frozen=True)
+class IdempotencyRecord:
+    """One DbIdempotencyRecord row: a key and its serialized snapshot."""
+
+    key: str
+    response_snapshot_json: str
+    expires_at: datetime
+
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        return self.expires_at <= (now or datetime.now(timezone.utc))
+
+
+class IIdempotencyStore(ABC):
+    """
+    Interface for persisting idempotency records.
+
+    ``reserve`` must be atomic: of several concurrent reservations for a key,
+    exactly one succeeds.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[IdempotencyRecord]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def reserve(self, record: IdempotencyRecord) -> Optional[IdempotencyRecord]:
+        """
+        Inserts ``record`` unless a live record exists for its key. Returns
+        None on success, or the existing record.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self, record: IdempotencyRecord):
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_expired(self, now: Optional[datetime] = None) -> int:
+        """Deletes every expired record and returns how many were removed."""
+        raise NotImplementedError
+
+
+class InMemoryIdempotencyStore(IIdempotencyStore):
+    """Process-local store; records do not survive restarts."""
+
+    def __init__(self):
+        self._records: Dict[str, IdempotencyRecord] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[IdempotencyRecord]:
+        return self._records.get(key)
+
+    def reserve(self, record: IdempotencyRecord) -> Optional[IdempotencyRecord]:
+        with self._lock:
+            existing = self._records.get(record.key)
+            if existing is not None and not existing.is_expired():
+                return existing
+            self._records[record.key] = record
+            return None
+
+    def update(self, record: IdempotencyRecord):
+        self._records[record.key] = record
+
+    def delete(self, key: str):
+        self._records.pop(key, None)
+
+    def delete_expired(self, now: Optional[datetime] = None) -> int:
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            expired = [k for k, r in self._records.items() if r.is_expired(now)]
+            for key in expired:
+                del self._records[key]
+        return len(expired)
+
+
+class SQLiteIdempotencyStore(IIdempotencyStore):
+    """
+    DbIdempotencyRecord-backed store. Reservations rely on the primary key,
+    so they are atomic across uvicorn workers sharing the database.
+    """
+
+    def __init__(self, path: str):
+        self._conn = connect(path)
+        self._lock = threading.Lock()
+
+    def _row_to_record(self, key: str, row) -> IdempotencyRecord:
+        return IdempotencyRecord(
+            key=key,
+            response_snapshot_json=row["response_snapshot_json"],
+            expires_at=from_db_datetime(row["expires_at"]),
+        )
+
+    def get(self, key: str) -> Optional[IdempotencyRecord]:
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT response_snapshot_json, expires_at
+                FROM DbIdempotencyRecord WHERE key = ?
+                """,
+                (key,),
+            ).fetchone()
+        return self._row_to_record(key, row) if row is not None else None
+
+    def reserve(self, record: IdempotencyRecord) -> Optional[IdempotencyRecord]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # An expired record is treated as absent.
+                self._conn.execute(
+                    "DELETE FROM DbIdempotencyRecord WHERE key = ? AND expires_at <= ?",
+                    (record.key, to_db_datetime(datetime.now(timezone.utc))),
+                )
+                inserted = self._conn.execute(
+                    """
+                    INSERT OR IGNORE INTO DbIdempotencyRecord (
+                        key, response_snapshot_json, expires_at
+                    ) VALUES (?, ?, ?)
+                    """,
+                    (
+                        record.key,
+                        record.response_snapshot_json,
+                        to_db_datetime(record.expires_at),
+                    ),
+                ).rowcount
+                row = None
+                if not inserted:
+                    row = self._conn.execute(
+                        """
+                        SELECT response_snapshot_json, expires_at
+                        FROM DbIdempotencyRecord WHERE key = ?
+                        """,
+                        (record.key,),
+                    ).fetchone()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return self._row_to_record(record.key, row) if row is not None else None
+
+    def update(self, record: IdempotencyRecord):
+        with self._lock:
+            self._conn.execute(
+                """
+                UPDATE DbIdempotencyRecord
+                SET response_snapshot_json = ?, expires_at = ?
+                WHERE key = ?
+                """,
+                (
+                    record.response_snapshot_json,
+                    to_db_datetime(record.expires_at),
+                    record.key,
+                ),
+            )
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM DbIdempotencyRecord WHERE key = ?", (key,))
+
+    def delete_expired(self, now: Optional[datetime] = None) -> int:
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            # Uses idx_idempotency_expires_at; ISO-8601 UTC strings sort in
+            # time order.
+            return self._conn.execute(
+                "DELETE FROM DbIdempotencyRecord WHERE expires_at <= ?",
+                (to_db_datetime(now),),
+            ).rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_idempotency_store: Optional[IIdempotencyStore] = None
+
+
+def get_idempotency_store() -> IIdempotencyStore:
+    """Returns the process-wide idempotency store configured in settings."""
+    global _idempotency_store
+    if _idempotency_store is None:
+        if settings.IDEMPOTENCY_STORE == "sqlite":
+            _idempotency_store = SQLiteIdempotencyStore(settings.DATABASE_PATH)
+        elif settings.IDEMPOTENCY_STORE == "memory":
+            _idempotency_store = InMemoryIdempotencyStore()
+        else:
+            raise ValueError(f"Unknown idempotency store: {settings.IDEMPOTENCY_STORE}")
+    return _idempotency_store
@@ -0,0 +1,100 @@
+"""Storage backends for the global kill-switch."""
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from ordo.config import settings
+from ordo.persistence.database import connect
+
+
+class IKillSwitchStore(ABC):
+    """Interface for persisting the kill-switch state."""
+
+    @abstractmethod
+    def load(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, active: bool):
+        raise NotImplementedError
+
+    def changed(self) -> bool:
+        """
+        Tells cheaply whether another process may have written since the last
+        call. Stores that are not shared between processes never change.
+        """
+        return False
+
+
+class InMemoryKillSwitchStore(IKillSwitchStore):
+    """Process-local store; the kill-switch resets on restart."""
+
+    def __init__(self):
+        self._active = False
+
+    def load(self) -> bool:
+        return self._active
+
+    def save(self, active: bool):
+        self._active = active
+
+
+class SQLiteKillSwitchStore(IKillSwitchStore):
+    """
+    DbKillSwitch-backed store. ``PRAGMA data_version`` changes whenever
+    another connection commits to the database, which lets every worker
+    notice a toggle without re-reading the row.
+    """
+
+    def __init__(self, path: str):
+        self._conn = connect(path)
+        self._lock = threading.Lock()
+        self._data_version = self._read_data_version()
+
+    def _read_data_version(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def load(self) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT is_active FROM DbKillSwitch WHERE id = 1"
+            ).fetchone()
+        return bool(row["is_active"]) if row is not None else False
+
+    def save(self, active: bool):
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO DbKillSwitch (id, is_active) VALUES (1, ?)
+                ON CONFLICT (id) DO UPDATE SET is_active = excluded.is_active
+                """,
+                (int(active),),
+            )
+
+    def changed(self) -> bool:
+        with self._lock:
+            data_version = self._read_data_version()
+            changed = data_version != self._data_version
+            self._data_version = data_version
+        return changed
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_kill_switch_store: Optional[IKillSwitchStore] = None
+
+
+def get_kill_switch_store() -> IKillSwitchStore:
+    """Returns the process-wide kill-switch store configured in settings."""
+    global _kill_switch_store
+    if _kill_switch_store is None:
+        if settings.KILL_SWITCH_STORE == "sqlite":
+            _kill_switch_store = SQLiteKillSwitchStore(settings.DATABASE_PATH)
+        elif settings.KILL_SWITCH_STORE == "memory":
+            _kill_switch_store = InMemoryKillSwitchStore()
+        else:
+            raise ValueError(f"Unknown kill-switch store: {settings.KILL_SWITCH_STORE}")
+    return _kill_switch_store
@@ -0,0 +1,268 @@
+"""Pluggable storage backends for encrypted broker session values."""
+
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+from ordo.config import settings
+from ordo.persistence.database import connect, from_db_datetime, to_db_datetime
+
+# Session keys that map onto dedicated DbSession columns; every other key is
+# kept in metadata_json.
+_TOKEN_COLUMNS = {
+    "access_token": ("access_token_encrypted", "access_expires_at"),
+    "refresh_token": ("refresh_token_encrypted", "refresh_expires_at"),
+}
+
+
+@dataclass(frozen=True)
+class StoredSessionValue:
+    """An encrypted session value and its optional expiry."""
+
+    value: bytes
+    expires_at: Optional[datetime] = None
+
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        if self.expires_at is None:
+            return False
+        return self.expires_at <= (now or datetime.now(timezone.utc))
+
+
+class ISessionStore(ABC):
+    """
+    Interface for storing encrypted session values.
+
+    Values passed to a store are always already encrypted; encryption and
+    decryption happen in the SessionManager.
+    """
+
+    @abstractmethod
+    def get(
+        self, broker_id: str, account_id: str, key: str
+    ) -> Optional[StoredSessionValue]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(
+        self,
+        broker_id: str,
+        account_id: str,
+        key: str,
+        value: bytes,
+        expires_at: Optional[datetime] = None,
+    ):
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, broker_id: str, account_id: str, key: Optional[str] = None):
+        """Deletes one session value, or the whole session when key is None."""
+        raise NotImplementedError
+
+
+class InMemorySessionStore(ISessionStore):
+    """Process-local store; sessions do not survive restarts."""
+
+    def __init__(self):
+        self._values: Dict[Tuple[str, str, str], StoredSessionValue] = {}
+
+    def get(
+        self, broker_id: str, account_id: str, key: str
+    ) -> Optional[StoredSessionValue]:
+        return self._values.get((broker_id, account_id, key))
+
+    def set(
+        self,
+        broker_id: str,
+        account_id: str,
+        key: str,
+        value: bytes,
+        expires_at: Optional[datetime] = None,
+    ):
+        self._values[(broker_id, account_id, key)] = StoredSessionValue(
+            value, expires_at
+        )
+
+    def delete(self, broker_id: str, account_id: str, key: Optional[str] = None):
+        if key is not None:
+            self._values.pop((broker_id, account_id, key), None)
+            return
+        for stored_key in [
+            k for k in self._values if k[0] == broker_id and k[1] == account_id
+        ]:
+            del self._values[stored_key]
+
+
+SessionRecord = Dict[str, StoredSessionValue]
+
+
+class SQLiteSessionStore(ISessionStore):
+    """
+    DbSession-backed store with an in-memory LRU cache in front of it.
+
+    The database runs in WAL mode so it can be shared by several uvicorn
+    workers. Reads are served from the cache; ``PRAGMA data_version`` tells us
+    cheaply when another connection has written, at which point the cache is
+    dropped and refilled from the database.
+    """
+
+    def __init__(self, path: str, cache_size: int = 1024):
+        self._conn = connect(path)
+        self._cache: "OrderedDict[Tuple[str, str], SessionRecord]" = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self._data_version = self._read_data_version()
+
+    def _read_data_version(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _cache_put(self, cache_key: Tuple[str, str], record: SessionRecord):
+        self._cache[cache_key] = record
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _load_record(self, broker_id: str, account_id: str) -> SessionRecord:
+        row = self._conn.execute(
+            "SELECT * FROM DbSession WHERE broker_id = ? AND account_id = ?",
+            (broker_id, account_id),
+        ).fetchone()
+        record: SessionRecord = {}
+        if row is None:
+            return record
+        for key, (value_column, expiry_column) in _TOKEN_COLUMNS.items():
+            if row[value_column]:
+                record[key] = StoredSessionValue(
+                    row[value_column].encode(), from_db_datetime(row[expiry_column])
+                )
+        for key, item in json.loads(row["metadata_json"] or "{}").items():
+            record[key] = StoredSessionValue(
+                item["value"].encode(), from_db_datetime(item.get("expires_at"))
+            )
+        return record
+
+    def _save_record(self, broker_id: str, account_id: str, record: SessionRecord):
+        access = record.get("access_token")
+        refresh = record.get("refresh_token")
+        metadata = {
+            key: {
+                "value": stored.value.decode(),
+                "expires_at": to_db_datetime(stored.expires_at),
+            }
+            for key, stored in record.items()
+            if key not in _TOKEN_COLUMNS
+        }
+        self._conn.execute(
+            """
+            INSERT INTO DbSession (
+                broker_id, account_id, access_token_encrypted,
+                refresh_token_encrypted, access_expires_at, refresh_expires_at,
+                metadata_json
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (broker_id, account_id) DO UPDATE SET
+                access_token_encrypted = excluded.access_token_encrypted,
+                refresh_token_encrypted = excluded.refresh_token_encrypted,
+                access_expires_at = excluded.access_expires_at,
+                refresh_expires_at = excluded.refresh_expires_at,
+                metadata_json = excluded.metadata_json
+            """,
+            (
+                broker_id,
+                account_id,
+                access.value.decode() if access else "",
+                refresh.value.decode() if refresh else None,
+                # access_expires_at is NOT NULL; a row without an access token
+                # is stored as already expired.
+                to_db_datetime(
+                    access.expires_at
+                    if access and access.expires_at
+                    else datetime.now(timezone.utc)
+                ),
+                to_db_datetime(refresh.expires_at) if refresh else None,
+                json.dumps(metadata),
+            ),
+        )
+
+    def _get_record(self, broker_id: str, account_id: str) -> SessionRecord:
+        data_version = self._read_data_version()
+        if data_version != self._data_version:
+            # Another worker wrote to the database since our last look.
+            self._cache.clear()
+            self._data_version = data_version
+
+        cache_key = (broker_id, account_id)
+        record = self._cache.get(cache_key)
+        if record is None:
+            record = self._load_record(broker_id, account_id)
+            self._cache_put(cache_key, record)
+        else:
+            self._cache.move_to_end(cache_key)
+        return record
+
+    def _update(self, broker_id: str, account_id: str, update):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                record = self._load_record(broker_id, account_id)
+                update(record)
+                if record:
+                    self._save_record(broker_id, account_id, record)
+                else:
+                    self._conn.execute(
+                        "DELETE FROM DbSession WHERE broker_id = ? AND account_id = ?",
+                        (broker_id, account_id),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._cache_put((broker_id, account_id), record)
+
+    def get(
+        self, broker_id: str, account_id: str, key: str
+    ) -> Optional[StoredSessionValue]:
+        with self._lock:
+            return self._get_record(broker_id, account_id).get(key)
+
+    def set(
+        self,
+        broker_id: str,
+        account_id: str,
+        key: str,
+        value: bytes,
+        expires_at: Optional[datetime] = None,
+    ):
+        stored = StoredSessionValue(value, expires_at)
+        self._update(broker_id, account_id, lambda record: record.update({key: stored}))
+
+    def delete(self, broker_id: str, account_id: str, key: Optional[str] = None):
+        if key is None:
+            self._update(broker_id, account_id, lambda record: record.clear())
+        else:
+            self._update(broker_id, account_id, lambda record: record.pop(key, None))
+
+    def close(self):
+        with self._lock:
+            self._cache.clear()
+            self._conn.close()
+
+
+_session_store: Optional[ISessionStore] = None
+
+
+def get_session_store() -> ISessionStore:
+    """Returns the process-wide session store configured in settings."""
+    global _session_store
+    if _session_store is None:
+        if settings.SESSION_STORE == "sqlite":
+            _session_store = SQLiteSessionStore(
+                settings.DATABASE_PATH, cache_size=settings.SESSION_CACHE_SIZE
+            )
+        elif settings.SESSION_STORE == "memory":
+            _session_store = InMemorySessionStore()
+        else:
+            raise ValueError(f"Unknown session store: {settings.SESSION_STORE}")
+    return _session_store
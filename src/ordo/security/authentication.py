@@ -1,50 +1,105 @@
-from fastapi import Request, status
-from fastapi.responses import JSONResponse
-from fastapi.security import HTTPBearer
-from fastapi.security.http import HTTPAuthorizationCredentials
+from typing import Iterable, Optional
 
-from ordo.config import settings
-from ordo.models.api.errors import ApiError
+from ordo.models.api.errors import ApiError, ApiException
+from ordo.security.tokens import (
+    TokenIndex,
+    client_scope,
+    current_client,
+    token_index,
+)
 
-bearer_scheme = HTTPBearer(auto_error=False)
+# Paths served without a token.
+EXEMPT_PATHS = frozenset(
+    {
+        "/docs",
+        "/openapi.json",
+        "/login/initiate",
+        "/login/complete",
+    }
+)
 
+# Serialized once at import. The correlation_id is left out because a fixed
+# ID would not identify any particular request.
+UNAUTHORIZED_BODY = (
+    ApiError(error_code="UNAUTHORIZED", message="Invalid or missing API token.")
+    .model_dump_json(exclude={"correlation_id"})
+    .encode()
+)
 
-async def verify_api_token(request: Request):
-    """
-    Dependency that verifies the API token from the Authorization header.
+_UNAUTHORIZED_START = {
+    "type": "http.response.start",
+    "status": 401,
+    "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(UNAUTHORIZED_BODY)).encode()),
+        (b"www-authenticate", b"Bearer"),
+    ],
+}
+_UNAUTHORIZED_BODY = {"type": "http.response.body", "body": UNAUTHORIZED_BODY}
+
+# Policy-violation close code for a WebSocket handshake without a valid token.
+_WS_POLICY_VIOLATION = 1008
 
-    Returns HTTP 401 Unauthorized if the token is missing or invalid.
+
+def bearer_token(headers: Iterable[tuple]) -> Optional[bytes]:
+    """Returns the bearer token from raw ASGI headers, if there is one."""
+    for name, value in headers:
+        if name == b"authorization":
+            scheme, _, token = value.partition(b" ")
+            return token if scheme == b"Bearer" and token else None
+    return None
+
+
+def require_scope(scope: str):
     """
-    credentials: HTTPAuthorizationCredentials | None = await bearer_scheme(request)
-    if (
-        not credentials
-        or credentials.scheme != "Bearer"
-        or credentials.credentials != settings.ORDO_API_TOKEN
-    ):
-        return JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content=ApiError(
-                error_code="UNAUTHORIZED", message="Invalid or missing API token."
-            ).model_dump(mode="json"),
-        )
-    return None  # Indicates success, request proceeds
-
-
-async def authentication_middleware(request: Request, call_next):
+    Returns a route dependency that rejects clients without ``scope`` with
+    FORBIDDEN, e.g. ``dependencies=[Depends(require_scope(ADMIN))]``.
     """
-    A FastAPI middleware that checks for a static bearer token in the Authorization header
-    for all routes except the documentation.
+
+    async def dependency():
+        client = current_client()
+        if client is None or not client.allows(scope):
+            raise ApiException(
+                ApiError(
+                    error_code="FORBIDDEN",
+                    message=f"This API token lacks the '{scope}' scope.",
+                )
+            )
+
+    return dependency
+
+
+class AuthenticationMiddleware:
     """
-    if request.url.path in [
-        "/docs",
-        "/openapi.json",
-        "/login/initiate",
-        "/login/complete",
-    ]:
-        return await call_next(request)
+    Pure ASGI middleware that requires a valid API token on every HTTP and
+    WebSocket request except the exempt paths.
+
+    Requests are passed straight through to the app, so bodies are never
+    buffered and responses are not wrapped. Tokens are resolved through the
+    token index's hash lookup and rejections reuse a pre-serialized 401
+    body. The authenticated client is available to the rest of the request
+    as ``request.state.client`` and through :func:`current_client`.
+    """
+
+    def __init__(self, app, tokens: Optional[TokenIndex] = None):
+        self.app = app
+        self._tokens = tokens or token_index
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket") or scope["path"] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
 
-    response = await verify_api_token(request)
-    if response:
-        return response
+        token = bearer_token(scope["headers"])
+        client = self._tokens.authenticate(token) if token is not None else None
+        if client is not None:
+            scope.setdefault("state", {})["client"] = client
+            with client_scope(client):
+                await self.app(scope, receive, send)
+            return
 
-    return await call_next(request)
+        if scope["type"] == "websocket":
+            await send({"type": "websocket.close", "code": _WS_POLICY_VIOLATION})
+            return
+        await send(_UNAUTHORIZED_START)
+        await send(_UNAUTHORIZED_BODY)
@@ -0,0 +1,213 @@
+"""Per-client request quotas enforced at the API edge."""
+
+import math
+import time
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from ordo.config import settings
+from ordo.models.api.errors import ApiError
+
+RATE_LIMITED_BODY = (
+    ApiError(error_code="RATE_LIMITED", message="Too many requests for this client.")
+    .model_dump_json(exclude={"correlation_id"})
+    .encode()
+)
+_RATE_LIMITED_BODY = {"type": "http.response.body", "body": RATE_LIMITED_BODY}
+
+# Long-lived order and trade update streams; see EdgeRateLimitMiddleware.
+STREAM_PATH_PREFIXES = ("/api/v1/stream/",)
+
+
+class ClientQuota:
+    """
+    A token bucket (``rate`` per second up to ``burst``) plus a cap on
+    concurrent requests, for one client. Raises ValueError for a ``rate``
+    that never refills or a ``burst`` that never admits a request.
+    """
+
+    __slots__ = (
+        "rate",
+        "burst",
+        "max_in_flight",
+        "tokens",
+        "updated_at",
+        "in_flight",
+        "admitted",
+        "rejected",
+    )
+
+    def __init__(self, rate: float, burst: float, max_in_flight: int, now: float):
+        if not rate > 0:
+            raise ValueError(f"Edge rate limit must be positive, got {rate!r}")
+        if not burst >= 1:
+            raise ValueError(f"Edge burst must be at least 1, got {burst!r}")
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.tokens = burst
+        self.updated_at = now
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+
+    def try_acquire(self, now: float, hold: bool = True) -> Optional[float]:
+        """
+        Admits a request, or returns the seconds until one would be. With
+        ``hold``, the request also takes an in-flight slot until released.
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if hold and self.in_flight >= self.max_in_flight:
+            self.rejected += 1
+            # There is no telling when a slot frees up; a second is a fair guess.
+            return 1.0
+        if self.tokens < 1:
+            self.rejected += 1
+            return (1 - self.tokens) / self.rate
+        self.tokens -= 1
+        if hold:
+            self.in_flight += 1
+        self.admitted += 1
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "tokens": round(self.tokens, 3),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+
+class EdgeRateLimiter:
+    """
+    Per-client quotas keyed by API client id, so one noisy strategy runs out
+    of its own allowance instead of everyone's.
+
+    Everything runs synchronously on the event loop, so admitting a request
+    is one dict lookup and a little arithmetic, with no locks or awaits.
+    ``overrides`` maps a client id to its own ``rate``, ``burst`` and
+    ``max_in_flight``; the defaults apply to everyone else. Limits are
+    checked when set, so a bad override fails at startup rather than on
+    that client's first request.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        max_in_flight: int,
+        overrides: Optional[Mapping[str, Mapping[str, float]]] = None,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.overrides = dict(overrides or {})
+        self._quotas: Dict[str, ClientQuota] = {}
+        self._new_quota(None, 0.0)
+        for client_id in self.overrides:
+            self._new_quota(client_id, 0.0)
+
+    def _new_quota(self, client_id: Optional[str], now: float) -> ClientQuota:
+        limits = self.overrides.get(client_id, {})
+        return ClientQuota(
+            rate=limits.get("rate", self.rate),
+            burst=limits.get("burst", self.burst),
+            max_in_flight=int(limits.get("max_in_flight", self.max_in_flight)),
+            now=now,
+        )
+
+    def quota_for(self, client_id: str) -> ClientQuota:
+        quota = self._quotas.get(client_id)
+        if quota is None:
+            quota = self._new_quota(client_id, time.monotonic())
+            self._quotas[client_id] = quota
+        return quota
+
+    def configure(self, client_id: str, **limits: float):
+        """
+        Sets the limits of one client, replacing its current quota. Raises
+        ValueError, leaving the old limits in place, if they are invalid.
+        """
+        previous = self.overrides.get(client_id)
+        self.overrides[client_id] = limits
+        try:
+            self._new_quota(client_id, 0.0)
+        except ValueError:
+            if previous is None:
+                del self.overrides[client_id]
+            else:
+                self.overrides[client_id] = previous
+            raise
+        self._quotas.pop(client_id, None)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {client_id: q.stats() for client_id, q in self._quotas.items()}
+
+
+class EdgeRateLimitMiddleware:
+    """
+    Pure ASGI middleware that applies the edge quotas to authenticated HTTP
+    requests. It runs inside the authentication middleware, which puts the
+    client on the scope; rejections are a pre-serialized 429 with a
+    ``Retry-After`` header, sent without touching the app.
+
+    Requests under ``stream_prefixes`` (server-sent event streams, open for
+    as long as the client listens) still spend a token but don't hold an
+    in-flight slot, so a few open streams can't lock a client out.
+    WebSocket connections aren't HTTP requests and pass through untouched.
+    """
+
+    def __init__(
+        self,
+        app,
+        limiter: Optional[EdgeRateLimiter] = None,
+        stream_prefixes: Tuple[str, ...] = STREAM_PATH_PREFIXES,
+    ):
+        self.app = app
+        self._limiter = limiter or edge_limiter
+        self._stream_prefixes = stream_prefixes
+
+    async def __call__(self, scope, receive, send):
+        client = (
+            scope.get("state", {}).get("client") if scope["type"] == "http" else None
+        )
+        if client is None:
+            await self.app(scope, receive, send)
+            return
+
+        quota = self._limiter.quota_for(client.client_id)
+        hold = not scope["path"].startswith(self._stream_prefixes)
+        retry_after = quota.try_acquire(time.monotonic(), hold)
+        if retry_after is not None:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 429,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(RATE_LIMITED_BODY)).encode()),
+                        (b"retry-after", str(math.ceil(retry_after)).encode()),
+                    ],
+                }
+            )
+            await send(_RATE_LIMITED_BODY)
+            return
+        if not hold:
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            quota.in_flight -= 1
+
+
+edge_limiter = EdgeRateLimiter(
+    rate=settings.EDGE_RATE_LIMIT_RPS,
+    burst=settings.EDGE_RATE_LIMIT_BURST,
+    max_in_flight=settings.EDGE_MAX_IN_FLIGHT,
+    overrides=settings.EDGE_CLIENT_LIMITS,
+)
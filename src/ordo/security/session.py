@@ -1,36 +1,168 @@
 """Session management for broker adapters."""
 
-from cryptography.fernet import Fernet
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from ordo.core.tracing import tracing
+from ordo.persistence.session_store import ISessionStore, InMemorySessionStore
+
+
+class DecryptedValueCache:
+    """
+    Bounded, time-limited cache of decrypted session values.
+
+    Entries are keyed on the ciphertext they were decrypted from, so a value
+    replaced in the store (by this process or another worker) can never be
+    served stale. Plaintext is held in a bytearray that is overwritten with
+    zeros when the entry is evicted or invalidated; Python cannot guarantee no
+    other copies exist, so this is best-effort hygiene rather than mlock.
+    """
+
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 60.0):
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: (
+            "OrderedDict[Tuple[str, str], Tuple[bytes, bytearray, float]]"
+        ) = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _wipe(buffer: bytearray):
+        buffer[:] = bytes(len(buffer))
+
+    def _drop(self, key: Tuple[str, str]):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._wipe(entry[1])
+            self.evictions += 1
+
+    def get(self, key: Tuple[str, str], ciphertext: bytes) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            cached_ciphertext, plaintext, cached_at = entry
+            if (
+                cached_ciphertext == ciphertext
+                and time.monotonic() - cached_at < self._ttl_seconds
+            ):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return plaintext.decode()
+            self._drop(key)
+        self.misses += 1
+        return None
+
+    def put(self, key: Tuple[str, str], ciphertext: bytes, plaintext: str):
+        if self._max_size <= 0:
+            return
+        self._drop(key)
+        self._entries[key] = (
+            ciphertext,
+            bytearray(plaintext.encode()),
+            time.monotonic(),
+        )
+        while len(self._entries) > self._max_size:
+            self._drop(next(iter(self._entries)))
+
+    def invalidate(self, account_id: str, key: Optional[str] = None):
+        """Drops one cached value, or every cached value for an account."""
+        if key is not None:
+            self._drop((account_id, key))
+            return
+        for cached_key in [k for k in self._entries if k[0] == account_id]:
+            self._drop(cached_key)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
 
 
 class SessionManager:
     """Manages encrypted session data for broker adapters."""
 
-    def __init__(self, secret_key: str):
+    def __init__(
+        self,
+        secret_key: str,
+        store: Optional[ISessionStore] = None,
+        broker_name: str = "default",
+        access_token_ttl: Optional[timedelta] = None,
+        cache_size: int = 256,
+        cache_ttl_seconds: float = 60.0,
+    ):
         if not secret_key:
             raise ValueError("SECRET_KEY must be provided for session management.")
         self._fernet = Fernet(secret_key.encode())
-        self._sessions = {}
+        self._store = store if store is not None else InMemorySessionStore()
+        self._broker_name = broker_name
+        self._access_token_ttl = access_token_ttl
+        self._cache = DecryptedValueCache(cache_size, cache_ttl_seconds)
 
-    def _get_namespaced_key(self, broker_id: str, key: str) -> str:
-        """Creates a namespaced key to prevent collisions."""
-        return f"{broker_id}:{key}"
-
-    def set_session(self, broker_id: str, key: str, value: str):
+    def set_session(
+        self,
+        broker_id: str,
+        key: str,
+        value: str,
+        expires_at: Optional[datetime] = None,
+    ):
         """
         Encrypts and stores a session value for a given broker.
+
+        Access tokens without an explicit ``expires_at`` get the configured
+        access-token TTL, so later expiry checks are purely local.
         """
-        namespaced_key = self._get_namespaced_key(broker_id, key)
+        if (
+            expires_at is None
+            and key == "access_token"
+            and self._access_token_ttl is not None
+        ):
+            expires_at = datetime.now(timezone.utc) + self._access_token_ttl
         encrypted_value = self._fernet.encrypt(value.encode())
-        self._sessions[namespaced_key] = encrypted_value
+        self._cache.invalidate(broker_id, key)
+        self._store.set(self._broker_name, broker_id, key, encrypted_value, expires_at)
 
     def get_session(self, broker_id: str, key: str) -> str | None:
         """
         Retrieves and decrypts a session value for a given broker.
+
+        Returns None if the value is missing, expired, or was encrypted with a
+        different SECRET_KEY. Repeat reads of an unchanged value are served from
+        the decrypted-value cache instead of running Fernet again.
         """
-        namespaced_key = self._get_namespaced_key(broker_id, key)
-        encrypted_value = self._sessions.get(namespaced_key)
-        if not encrypted_value:
-            return None
-        decrypted_value = self._fernet.decrypt(encrypted_value).decode()
-        return decrypted_value
+        with tracing.span("session.get_session", broker=broker_id, key=key) as span:
+            stored = self._store.get(self._broker_name, broker_id, key)
+            if not stored or stored.is_expired():
+                return None
+            cached = self._cache.get((broker_id, key), stored.value)
+            if span is not None:
+                span.set("cache_hit", cached is not None)
+            if cached is not None:
+                return cached
+            try:
+                decrypted_value = self._fernet.decrypt(stored.value).decode()
+            except InvalidToken:
+                return None
+            self._cache.put((broker_id, key), stored.value, decrypted_value)
+            return decrypted_value
+
+    def get_expiry(self, broker_id: str, key: str) -> datetime | None:
+        """Returns when a stored session value expires, without decrypting it."""
+        stored = self._store.get(self._broker_name, broker_id, key)
+        return stored.expires_at if stored else None
+
+    def clear_session(self, broker_id: str, key: Optional[str] = None):
+        """Removes one session value, or every value for the broker account."""
+        self._cache.invalidate(broker_id, key)
+        self._store.delete(self._broker_name, broker_id, key)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Returns hit/miss counters for the decrypted-value cache."""
+        return self._cache.stats()
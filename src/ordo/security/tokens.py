@@ -0,0 +1,168 @@
+"""Per-client API tokens with scopes, looked up through a hash index."""
+
+import asyncio
+import hashlib
+import logging
+import secrets
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional
+
+from ordo.config import settings
+from ordo.persistence.api_token_store import (
+    ApiTokenRecord,
+    IApiTokenStore,
+    get_api_token_store,
+)
+
+logger = logging.getLogger(__name__)
+
+READ = "read"
+TRADE = "trade"
+ADMIN = "admin"
+
+# Each scope grants itself and every scope below it.
+IMPLIED_SCOPES: Dict[str, FrozenSet[str]] = {
+    READ: frozenset({READ}),
+    TRADE: frozenset({READ, TRADE}),
+    ADMIN: frozenset({READ, TRADE, ADMIN}),
+}
+
+DEFAULT_CLIENT_ID = "default"
+
+_current_client: ContextVar[Optional["ApiClient"]] = ContextVar(
+    "current_client", default=None
+)
+
+
+def hash_token(token: str) -> str:
+    """
+    Returns the SHA-256 hex digest stored for a token. Tokens are random
+    and high-entropy, so a plain digest needs no salt or key stretching.
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def expand_scopes(scopes: Iterable[str]) -> FrozenSet[str]:
+    """Returns ``scopes`` plus every scope they imply."""
+    expanded = set()
+    for scope in scopes:
+        if scope not in IMPLIED_SCOPES:
+            raise ValueError(f"Unknown scope: {scope}")
+        expanded |= IMPLIED_SCOPES[scope]
+    return frozenset(expanded)
+
+
+@dataclass(frozen=True)
+class ApiClient:
+    """The authenticated caller of a request."""
+
+    client_id: str
+    scopes: FrozenSet[str]
+
+    def allows(self, scope: str) -> bool:
+        return scope in self.scopes
+
+
+@contextmanager
+def client_scope(client: Optional[ApiClient]) -> Iterator[None]:
+    """Marks work done within the scope as done on behalf of ``client``."""
+    token = _current_client.set(client)
+    try:
+        yield
+    finally:
+        _current_client.reset(token)
+
+
+def current_client() -> Optional[ApiClient]:
+    """Returns the client of the request being handled, if any."""
+    return _current_client.get()
+
+
+class TokenIndex:
+    """
+    Maps the SHA-256 digest of every valid token to its client.
+
+    Authenticating a request hashes the presented token and does one dict
+    lookup, so the cost does not grow with the number of clients and no
+    comparison ever runs against a stored secret. The index is rebuilt from
+    the store and swapped in whole, so lookups never see a half-built index;
+    other workers pick up issued and revoked tokens by running :meth:`watch`.
+    """
+
+    def __init__(
+        self,
+        store: Optional[IApiTokenStore] = None,
+        default_token: Optional[str] = None,
+    ):
+        self._store = store
+        self._default_token = default_token
+        self._index: Optional[Dict[bytes, ApiClient]] = None
+
+    @property
+    def store(self) -> IApiTokenStore:
+        if self._store is None:
+            self._store = get_api_token_store()
+        return self._store
+
+    def reload(self) -> Dict[bytes, ApiClient]:
+        """Rebuilds the index from the store."""
+        index = {
+            bytes.fromhex(record.token_hash): ApiClient(
+                record.client_id, expand_scopes(record.scopes)
+            )
+            for record in self.store.load_all()
+        }
+        default_token = self._default_token or settings.ORDO_API_TOKEN
+        index[hashlib.sha256(default_token.encode()).digest()] = ApiClient(
+            DEFAULT_CLIENT_ID, IMPLIED_SCOPES[ADMIN]
+        )
+        self._index = index
+        return index
+
+    def authenticate(self, token: bytes) -> Optional[ApiClient]:
+        """Returns the client a raw token belongs to, or None."""
+        index = self._index if self._index is not None else self.reload()
+        return index.get(hashlib.sha256(token).digest())
+
+    def issue(self, client_id: str, scopes: Iterable[str]) -> str:
+        """
+        Creates (or rotates) the token for ``client_id`` and returns it. Only
+        its hash is kept, so this is the one time the token is visible.
+        """
+        if client_id == DEFAULT_CLIENT_ID:
+            raise ValueError(f"{DEFAULT_CLIENT_ID} is reserved for ORDO_API_TOKEN")
+        scopes = frozenset(scopes)
+        expand_scopes(scopes)
+        token = secrets.token_urlsafe(32)
+        self.store.save(ApiTokenRecord(client_id, hash_token(token), scopes))
+        self.reload()
+        logger.info("Issued API token for %s with scopes %s", client_id, sorted(scopes))
+        return token
+
+    def revoke(self, client_id: str) -> bool:
+        revoked = self.store.delete(client_id)
+        self.reload()
+        if revoked:
+            logger.info("Revoked API token for %s", client_id)
+        return revoked
+
+    def clients(self) -> List[Dict[str, object]]:
+        return [
+            {"client_id": record.client_id, "scopes": sorted(record.scopes)}
+            for record in sorted(self.store.load_all(), key=lambda r: r.client_id)
+        ]
+
+    async def watch(self, interval: float):
+        """Rebuilds the index whenever another worker changes the tokens."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if self.store.changed():
+                    self.reload()
+            except Exception:
+                logger.exception("API token refresh failed")
+
+
+token_index = TokenIndex()
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 import respx
 from httpx import Response
@@ -5,6 +7,8 @@ from unittest.mock import MagicMock, patch
 
 from ordo.adapters.base import IBrokerAdapter
 from ordo.adapters.hdfc import HDFCAdapter
+from ordo.adapters.registry import AdapterRegistry
+from ordo.core.retry import RetryingInterceptor, idempotency_key_scope
 from ordo.models.api.errors import ApiException
 
 
@@ -779,3 +783,47 @@ async def test_get_positions_success(mock_session_manager, hdfc_credentials):
     assert len(result) == 1
     assert result[0].symbol == "HDFC"
     assert result[0].quantity == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@respx.mock
+async def test_place_order_that_reached_the_broker_is_not_retried(
+    mock_session_manager, hdfc_credentials
+):
+    """
+    A 502 may hide a placed order, so even under an idempotency key the
+    order is sent once, with the caller's reference left as it was.
+    """
+    registry = AdapterRegistry(plugins={"hdfc": HDFCAdapter})
+    registry.use(RetryingInterceptor(base_delay=0.001, max_delay=0.01))
+    adapter = registry.get("hdfc")
+    mock_session_manager.get_session.return_value = "test_access_token"
+    route = respx.post(
+        f"{adapter.base_url}/orders/regular?api_key={hdfc_credentials['api_key']}"
+    ).mock(
+        side_effect=[
+            Response(502),
+            Response(200, json={"data": {"order_id": "ORDER123"}, "status": "ok"}),
+        ]
+    )
+    order_details = {
+        "exchange": "NSE",
+        "security_id": "WIPLTDEQNR",
+        "instrument_segment": "EQUITY",
+        "transaction_type": "BUY",
+        "product": "DELIVERY",
+        "order_type": "LIMIT",
+        "quantity": 1,
+        "price": 458,
+        "validity": "DAY",
+        "external_reference_number": 42,
+    }
+
+    with idempotency_key_scope("key-1"):
+        with pytest.raises(ApiException):
+            await adapter.place_order({"credentials": hdfc_credentials}, order_details)
+
+    assert route.call_count == 1
+    sent = json.loads(route.calls[0].request.content)
+    assert sent["external_reference_number"] == 42
@@ -0,0 +1,59 @@
+import pytest
+import respx
+from httpx import Response
+
+from ordo.adapters.http_pool import HttpClientPool
+
+
+@pytest.mark.unit
+def test_get_client_reuses_client_per_broker():
+    pool = HttpClientPool()
+    client = pool.get_client("hdfc")
+    assert pool.get_client("hdfc") is client
+    assert pool.get_client("fyers") is not client
+
+
+@pytest.mark.unit
+def test_get_client_applies_limits_and_headers():
+    pool = HttpClientPool(max_connections=7, max_keepalive_connections=3)
+    client = pool.get_client("hdfc", headers={"User-Agent": "ordo-test"})
+    assert client.headers["User-Agent"] == "ordo-test"
+    stats = pool.stats()["hdfc"]
+    assert stats["max_connections"] == 7
+    assert stats["max_keepalive_connections"] == 3
+    assert stats["connections"] == 0
+
+
+@pytest.mark.unit
+def test_stats_leave_out_counts_the_transport_cannot_report():
+    pool = HttpClientPool(max_connections=7)
+    client = pool.get_client("hdfc")
+    client._transport = object()
+    assert pool.stats()["hdfc"] == {
+        "max_connections": 7,
+        "max_keepalive_connections": pool._limits().max_keepalive_connections,
+        "closed": False,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_aclose_closes_clients_and_recreates_on_demand():
+    pool = HttpClientPool()
+    async with pool:
+        client = pool.get_client("hdfc")
+    assert client.is_closed
+    assert pool.stats() == {}
+    assert pool.get_client("hdfc") is not client
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@respx.mock
+async def test_pooled_client_serves_requests():
+    pool = HttpClientPool()
+    respx.get("https://broker.example/ping").mock(return_value=Response(200))
+    client = pool.get_client("hdfc")
+    response = await client.get("https://broker.example/ping")
+    assert response.status_code == 200
+    await pool.aclose()
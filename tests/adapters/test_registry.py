@@ -0,0 +1,61 @@
+import pytest
+
+from ordo.adapters.mock import MockAdapter
+from ordo.adapters.registry import AdapterRegistry
+
+
+@pytest.mark.unit
+def test_registry_resolves_builtin_adapter_lazily():
+    registry = AdapterRegistry()
+    adapter = registry.get("mock")
+    assert isinstance(adapter, MockAdapter)
+    assert registry.get("mock") is adapter
+
+
+@pytest.mark.unit
+def test_registry_unknown_adapter_raises():
+    registry = AdapterRegistry(plugins={})
+    with pytest.raises(ValueError, match="Unknown adapter: nope"):
+        registry.get("nope")
+
+
+@pytest.mark.unit
+def test_registry_register_replaces_cached_instances():
+    class OtherMockAdapter(MockAdapter):
+        pass
+
+    registry = AdapterRegistry()
+    original = registry.get("mock")
+    registry.register("mock", OtherMockAdapter)
+    replacement = registry.get("mock")
+    assert replacement is not original
+    assert isinstance(replacement, OtherMockAdapter)
+
+
+@pytest.mark.unit
+def test_registry_loads_entry_point_adapters(monkeypatch):
+    class FakeEntryPoint:
+        name = "plugin"
+        value = "ordo.adapters.mock:MockAdapter"
+
+    monkeypatch.setattr(
+        "ordo.adapters.registry.entry_points", lambda group: [FakeEntryPoint()]
+    )
+    registry = AdapterRegistry(plugins={})
+    assert "plugin" in registry.available()
+    assert isinstance(registry.get("plugin"), MockAdapter)
+
+
+@pytest.mark.unit
+def test_registry_reports_session_cache_stats_per_instance():
+    registry = AdapterRegistry()
+    registry.get("mock")
+    fyers = registry.get("fyers", "acc-1")
+    fyers.session_manager.set_session("stats-app", "access_token", "token")
+    fyers.session_manager.get_session("stats-app", "access_token")
+    fyers.session_manager.get_session("stats-app", "access_token")
+
+    stats = registry.session_cache_stats()
+    assert list(stats) == ["fyers:acc-1"]
+    assert (stats["fyers:acc-1"]["hits"], stats["fyers:acc-1"]["misses"]) == (1, 1)
+    fyers.session_manager.clear_session("stats-app")
@@ -0,0 +1,107 @@
+from fastapi.testclient import TestClient
+
+from ordo.config import settings
+from ordo.main import app
+
+AUTH_HEADERS = {"Authorization": f"Bearer {settings.ORDO_API_TOKEN}"}
+
+
+def test_book_routes_return_unified_responses():
+    with TestClient(app) as client:
+        responses = {
+            path: client.get(f"/api/v1/brokers/mock/{path}", headers=AUTH_HEADERS)
+            for path in ("orders", "trades", "holdings", "positions")
+        }
+    for response in responses.values():
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["overall_status"] == "success"
+    orders = responses["orders"].json()["results"][0]["payload"]
+    assert orders[0]["order_id"] == "MOCK-ORDER-1"
+    assert responses["trades"].json()["results"][0]["payload"][0]["trade_id"]
+
+
+def test_modify_and_cancel_order():
+    with TestClient(app) as client:
+        modified = client.patch(
+            "/api/v1/brokers/mock/orders/MOCK-1?account_id=acc-1",
+            json={"changes": {"quantity": 2}},
+            headers=AUTH_HEADERS,
+        )
+        empty = client.patch(
+            "/api/v1/brokers/mock/orders/MOCK-1",
+            json={"changes": {}},
+            headers=AUTH_HEADERS,
+        )
+        cancelled = client.delete(
+            "/api/v1/brokers/mock/orders/MOCK-1", headers=AUTH_HEADERS
+        )
+    result = modified.json()["results"][0]
+    assert result["account_id"] == "acc-1"
+    assert result["payload"] == {"order_id": "MOCK-1", "status": "modified"}
+    assert empty.status_code == 422
+    assert cancelled.json()["results"][0]["payload"]["status"] == "cancelled"
+
+
+def test_kill_switch_blocks_modify_but_not_cancel():
+    with TestClient(app) as client:
+        client.post("/api/v1/killswitch", json={"active": True}, headers=AUTH_HEADERS)
+        try:
+            modified = client.patch(
+                "/api/v1/brokers/mock/orders/MOCK-1",
+                json={"changes": {"quantity": 2}},
+                headers=AUTH_HEADERS,
+            )
+            cancelled = client.delete(
+                "/api/v1/brokers/mock/orders/MOCK-1", headers=AUTH_HEADERS
+            )
+        finally:
+            client.post(
+                "/api/v1/killswitch", json={"active": False}, headers=AUTH_HEADERS
+            )
+    assert modified.status_code == 423
+    assert cancelled.status_code == 200
+
+
+def test_unknown_broker_is_reported_as_failure():
+    with TestClient(app) as client:
+        response = client.get("/api/v1/brokers/nope/orders", headers=AUTH_HEADERS)
+    assert response.status_code == 503
+    assert response.json()["results"][0]["code"] == "INVALID_REQUEST"
+
+
+def test_order_book_since_returns_deltas():
+    with TestClient(app) as client:
+        full = client.get(
+            "/api/v1/brokers/mock/orders?account_id=since-acc", headers=AUTH_HEADERS
+        )
+        version = int(full.headers["X-Order-Book-Version"])
+        epoch = full.headers["X-Order-Book-Epoch"]
+        delta = client.get(
+            "/api/v1/brokers/mock/orders?account_id=since-acc"
+            f"&since={version}&epoch={epoch}",
+            headers=AUTH_HEADERS,
+        )
+        stale = client.get(
+            f"/api/v1/brokers/mock/orders?account_id=since-acc&since=0&epoch={epoch}",
+            headers=AUTH_HEADERS,
+        )
+        other_worker = client.get(
+            f"/api/v1/brokers/mock/orders?account_id=since-acc&since={version}"
+            "&epoch=another-worker",
+            headers=AUTH_HEADERS,
+        )
+    assert version >= 1
+    assert other_worker.json()["full"]
+    assert delta.json() == {
+        "epoch": epoch,
+        "version": version,
+        "since": version,
+        "full": False,
+        "orders": [],
+        "removed": [],
+    }
+    assert [o["order_id"] for o in stale.json()["orders"]] == [
+        "MOCK-ORDER-1",
+        "MOCK-ORDER-2",
+    ]
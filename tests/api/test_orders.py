@@ -0,0 +1,103 @@
+from fastapi.testclient import TestClient
+
+from ordo.config import settings
+from ordo.core.pipeline import circuit_breakers
+from ordo.main import app
+
+AUTH_HEADERS = {"Authorization": f"Bearer {settings.ORDO_API_TOKEN}"}
+
+ORDER_REQUEST = {
+    "targets": [{"broker": "mock"}],
+    "order": {"symbol": "RELIANCE-EQ", "quantity": 1, "transaction_type": "BUY"},
+}
+
+
+def test_place_order_without_idempotency_key():
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/v1/orders", json=ORDER_REQUEST, headers=AUTH_HEADERS
+        )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["overall_status"] == "success"
+    assert body["results"][0]["payload"]["order_id"].startswith("MOCK-")
+    assert "Idempotent-Replayed" not in response.headers
+
+
+def test_place_order_idempotency_key_replays_first_response():
+    headers = {**AUTH_HEADERS, "Idempotency-Key": "test-orders-replay"}
+    with TestClient(app) as client:
+        first = client.post("/api/v1/orders", json=ORDER_REQUEST, headers=headers)
+        second = client.post("/api/v1/orders", json=ORDER_REQUEST, headers=headers)
+        changed = client.post(
+            "/api/v1/orders",
+            json={**ORDER_REQUEST, "order": {"symbol": "TCS-EQ", "quantity": 1}},
+            headers=headers,
+        )
+    assert first.headers["Idempotent-Replayed"] == "false"
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert second.json() == first.json()
+    assert changed.status_code == 422
+    assert changed.json()["error_code"] == "IDEMPOTENCY_KEY_MISMATCH"
+
+
+def test_orders_rejected_before_reaching_a_broker_are_not_replayed(monkeypatch):
+    headers = {**AUTH_HEADERS, "Idempotency-Key": "test-orders-cb-open"}
+    breaker = circuit_breakers.breaker_for("mock")
+    with TestClient(app) as client:
+        with monkeypatch.context() as patched:
+            patched.setattr(breaker, "allow", lambda: False)
+            rejected = client.post(
+                "/api/v1/orders", json=ORDER_REQUEST, headers=headers
+            )
+        retried = client.post("/api/v1/orders", json=ORDER_REQUEST, headers=headers)
+    assert rejected.status_code == 503
+    assert rejected.json()["results"][0]["code"] == "CB_OPEN"
+    assert retried.status_code == 200
+    assert retried.headers["Idempotent-Replayed"] == "false"
+
+
+def test_kill_switch_blocks_new_orders():
+    with TestClient(app) as client:
+        enabled = client.post(
+            "/api/v1/killswitch", json={"active": True}, headers=AUTH_HEADERS
+        )
+        try:
+            blocked = client.post(
+                "/api/v1/orders", json=ORDER_REQUEST, headers=AUTH_HEADERS
+            )
+            status = client.get("/api/v1/status", headers=AUTH_HEADERS)
+        finally:
+            client.post(
+                "/api/v1/killswitch", json={"active": False}, headers=AUTH_HEADERS
+            )
+        allowed = client.post(
+            "/api/v1/orders", json=ORDER_REQUEST, headers=AUTH_HEADERS
+        )
+    assert enabled.json()["active"] is True
+    assert blocked.status_code == 423
+    assert blocked.json()["error_code"] == "KILL_SWITCH_ACTIVE"
+    assert status.json()["kill_switch"]["active"] is True
+    assert allowed.status_code == 200
+
+
+def test_place_basket_returns_results_in_leg_order():
+    basket = {
+        "legs": [
+            {"broker": "mock", "order": {"symbol": "RELIANCE-EQ", "quantity": 1}},
+            {"broker": "mock", "order": {"symbol": "TCS-EQ", "quantity": 2}},
+        ]
+    }
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/v1/orders/basket", json=basket, headers=AUTH_HEADERS
+        )
+        unknown = client.post(
+            "/api/v1/orders/basket",
+            json={"legs": [{"broker": "nope", "order": {}}]},
+            headers=AUTH_HEADERS,
+        )
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == 2
+    assert unknown.status_code == 400
+    assert unknown.json()["error_code"] == "INVALID_BASKET"
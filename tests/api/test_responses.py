@@ -0,0 +1,30 @@
+import pytest
+
+from ordo.api.v1.responses import error_response
+from ordo.models.api.errors import ApiError, ApiException
+
+
+def _error(code, details=None):
+    return ApiException(ApiError(error_code=code, message="boom", details=details))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "code, status_code",
+    [
+        ("CB_OPEN", 503),
+        ("DEADLINE_EXCEEDED", 504),
+        ("BROKER_API_ERROR", 502),
+        ("BROKER_REQUEST_FAILED", 502),
+        ("INVALID_BASKET", 400),
+    ],
+)
+def test_error_codes_map_to_http_status(code, status_code):
+    assert error_response(_error(code)).status_code == status_code
+
+
+@pytest.mark.unit
+def test_rate_limited_is_429_with_retry_after():
+    response = error_response(_error("RATE_LIMITED", {"retry_after_seconds": 1.2}))
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "2"
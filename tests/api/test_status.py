@@ -0,0 +1,25 @@
+from fastapi.testclient import TestClient
+
+from ordo.config import settings
+from ordo.main import app
+
+AUTH_HEADERS = {"Authorization": f"Bearer {settings.ORDO_API_TOKEN}"}
+
+
+def test_status_requires_token():
+    with TestClient(app) as client:
+        response = client.get("/api/v1/status")
+    assert response.status_code == 401
+
+
+def test_status_reports_http_pools():
+    with TestClient(app) as client:
+        response = client.get("/api/v1/status", headers=AUTH_HEADERS)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ok"
+    assert isinstance(body["http_pools"], dict)
+    assert isinstance(body["circuit_breakers"], dict)
+    assert isinstance(body["rate_limits"], dict)
+    assert isinstance(body["retries"]["retries"], dict)
+    assert isinstance(body["session_caches"], dict)
@@ -0,0 +1,57 @@
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from ordo.adapters.mock import MockAdapter
+from ordo.adapters.registry import adapter_registry
+from ordo.api.v1.endpoints.stream import sse_event
+from ordo.config import settings
+from ordo.core.order_stream import order_stream
+from ordo.main import app
+
+AUTH_HEADERS = {"Authorization": f"Bearer {settings.ORDO_API_TOKEN}"}
+
+
+class FillingAdapter(MockAdapter):
+    polls = 0
+
+    async def get_order_book(self, session_data):
+        FillingAdapter.polls += 1
+        status = "open" if FillingAdapter.polls == 1 else "completed"
+        return [{"order_id": "A", "status": status}]
+
+    async def get_trade_book(self, session_data):
+        return []
+
+
+def test_sse_event_format():
+    assert sse_event({"type": "trade", "trade": {}}) == (
+        'event: trade\ndata: {"type": "trade", "trade": {}}\n\n'
+    )
+
+
+def test_websocket_pushes_order_transitions(monkeypatch):
+    adapter_registry.register("filling", FillingAdapter)
+    monkeypatch.setattr(order_stream, "interval", 0.01)
+    with TestClient(app) as client:
+        with client.websocket_connect(
+            "/api/v1/stream/filling/ws", headers=AUTH_HEADERS
+        ) as websocket:
+            event = websocket.receive_json()
+    assert event["type"] == "order"
+    assert event["previous_status"] == "open"
+    assert event["order"]["status"] == "completed"
+
+
+def test_websocket_requires_token_and_known_broker():
+    with TestClient(app) as client:
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect("/api/v1/stream/mock/ws") as websocket:
+                websocket.receive_json()
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect(
+                "/api/v1/stream/nope/ws", headers=AUTH_HEADERS
+            ) as websocket:
+                websocket.receive_json()
+        response = client.get("/api/v1/stream/nope", headers=AUTH_HEADERS)
+    assert response.status_code == 400
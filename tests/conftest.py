@@ -0,0 +1,10 @@
+import pytest
+
+from ordo.core.audit import audit_log
+
+
+@pytest.fixture(autouse=True)
+def audit_log_in_tmp_path(tmp_path, monkeypatch):
+    """Keeps the audit log written by app lifespans out of the working tree."""
+    monkeypatch.setattr(audit_log, "directory", str(tmp_path / "audit"))
+    monkeypatch.setattr(audit_log, "_size", None)
@@ -0,0 +1,141 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ordo.adapters.interceptors import AdapterCall
+from ordo.config import settings
+from ordo.core.audit import (
+    MASK,
+    AuditInterceptor,
+    AuditLog,
+    audit_log,
+    correlation_scope,
+    mask,
+)
+from ordo.main import app
+
+REQUEST_ID = "9b2f6c1e-3d4a-4e5b-8c7d-0a1b2c3d4e5f"
+AUTH_HEADERS = {"Authorization": f"Bearer {settings.ORDO_API_TOKEN}"}
+
+
+def _lines(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.unit
+def test_mask_hides_secrets_and_pii_at_any_depth():
+    masked = mask(
+        {
+            "credentials": {"app_id": "APP"},
+            "access_token": "abc",
+            "tokenId": "t-1",
+            "orders": [{"symbol": "SBIN", "apiSecret": "s"}],
+            "loginId": "AB123",
+        }
+    )
+    assert masked == {
+        "credentials": MASK,
+        "access_token": MASK,
+        "tokenId": MASK,
+        "orders": [{"symbol": "SBIN", "apiSecret": MASK}],
+        "loginId": MASK,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_writer_appends_batches_as_ndjson(tmp_path):
+    log = AuditLog(str(tmp_path), batch_size=2, flush_interval=0.01)
+    with correlation_scope("corr-1"):
+        for i in range(5):
+            log.record("api", f"GET /{i}", 200, {"password": "hunter2"})
+    writer = asyncio.create_task(log.run())
+    await asyncio.sleep(0.1)
+    writer.cancel()
+    await log.flush()
+
+    records = _lines(log.path)
+    assert [r["action"] for r in records] == [f"GET /{i}" for i in range(5)]
+    assert records[0]["correlation_id"] == "corr-1"
+    assert records[0]["payload"] == {"password": MASK}
+    assert log.stats()["written"] == 5
+    assert log.stats()["batches"] == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_segments_rotate_by_size_and_are_gzipped(tmp_path):
+    log = AuditLog(str(tmp_path), max_bytes=1, compress=True)
+    log.record("api", "first")
+    await log.flush()
+    log.record("api", "second")
+    await log.flush()
+
+    rotated = list(tmp_path.glob("*.ndjson.gz"))
+    assert len(rotated) == 1
+    with gzip.open(rotated[0], "rt") as f:
+        assert json.loads(f.readline())["action"] == "first"
+    assert _lines(log.path)[0]["action"] == "second"
+    assert log.stats()["rotations"] == 1
+
+
+@pytest.mark.unit
+def test_full_queue_samples_routine_records_and_never_blocks(tmp_path):
+    log = AuditLog(str(tmp_path), queue_size=4, high_water=0.5, sample_rate=0.0)
+    assert log.record("api", "a") and log.record("api", "b")
+    assert not log.record("api", "sampled")
+    assert log.record("adapter", "place_order", critical=True)
+    assert log.record("adapter", "place_order", critical=True)
+    assert not log.record("adapter", "place_order", critical=True)
+    stats = log.stats()
+    assert (stats["sampled_out"], stats["dropped"], stats["queued"]) == (1, 1, 4)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_interceptor_records_outcome_with_masked_session(tmp_path):
+    log = AuditLog(str(tmp_path))
+    interceptor = AuditInterceptor(log)
+    call = AdapterCall(
+        broker_id="fyers",
+        account_id="acc",
+        account_key="k",
+        method="place_order",
+        args=({"access_token": "secret"}, {"symbol": "SBIN"}),
+    )
+
+    async def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await interceptor(call, fail)
+    await log.flush()
+
+    (record,) = _lines(log.path)
+    assert record["outcome"] == "RuntimeError"
+    assert record["payload"]["session_data"] == {"access_token": MASK}
+    assert record["payload"]["args"] == [{"symbol": "SBIN"}]
+
+
+def test_requests_are_audited_under_their_correlation_id(tmp_path, monkeypatch):
+    monkeypatch.setattr(audit_log, "directory", str(tmp_path))
+    monkeypatch.setattr(audit_log, "_size", None)
+    with TestClient(app) as client:
+        response = client.get(
+            "/api/v1/brokers/mock/holdings",
+            headers={**AUTH_HEADERS, "X-Correlation-ID": REQUEST_ID},
+        )
+        client.get("/api/v1/status")
+    assert response.json()["correlation_id"] == REQUEST_ID
+
+    records = [r for r in _lines(audit_log.path) if r["correlation_id"] == REQUEST_ID]
+    assert {r["component"] for r in records} == {"api", "adapter"}
+    api = next(r for r in records if r["component"] == "api")
+    assert api["action"] == "GET /api/v1/brokers/mock/holdings"
+    assert (api["outcome"], api["client_id"]) == (200, "default")
+    rejected = [r for r in _lines(audit_log.path) if r["outcome"] == 401]
+    assert rejected[0]["action"] == "GET /api/v1/status"
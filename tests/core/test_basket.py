@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from ordo.adapters.mock import MockAdapter
+from ordo.adapters.registry import AdapterRegistry
+from ordo.core.orchestrator import RequestOrchestrator
+from ordo.core.rate_limit import BrokerRateLimiter
+from ordo.models.api.errors import ApiError, ApiException
+from ordo.models.api.orchestrator import BasketLeg
+
+
+class BasketAdapter(MockAdapter):
+    placed = []
+    cancelled = []
+    in_flight = 0
+    max_in_flight = 0
+
+    def validate_order(self, order_details):
+        if order_details.get("quantity", 0) <= 0:
+            raise ValueError("quantity must be positive")
+
+    async def place_order(self, session_data, order_details):
+        BasketAdapter.in_flight += 1
+        BasketAdapter.max_in_flight = max(
+            BasketAdapter.max_in_flight, BasketAdapter.in_flight
+        )
+        try:
+            await asyncio.sleep(order_details.get("delay", 0.01))
+            if order_details.get("reject"):
+                raise ApiException(
+                    ApiError(error_code="ORDER_REJECTED", message="Rejected.")
+                )
+            order_id = f"{order_details['symbol']}-1"
+            BasketAdapter.placed.append(order_id)
+            return {"order_id": order_id, "status": "success"}
+        finally:
+            BasketAdapter.in_flight -= 1
+
+    async def cancel_order(self, session_data, order_id):
+        BasketAdapter.cancelled.append(order_id)
+        return {"order_id": order_id, "status": "cancelled"}
+
+
+@pytest.fixture
+def orchestrator():
+    BasketAdapter.placed = []
+    BasketAdapter.cancelled = []
+    BasketAdapter.in_flight = 0
+    BasketAdapter.max_in_flight = 0
+    registry = AdapterRegistry(
+        plugins={"basket": BasketAdapter, "other": BasketAdapter}
+    )
+    return RequestOrchestrator(registry=registry), registry
+
+
+def _leg(symbol, broker="basket", **order):
+    return BasketLeg(broker=broker, order={"symbol": symbol, "quantity": 1, **order})
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_basket_places_legs_concurrently_in_input_order(orchestrator):
+    orchestrator, _ = orchestrator
+    legs = [
+        _leg("A", delay=0.03),
+        _leg("B", broker="other"),
+        _leg("C", delay=0.01),
+    ]
+    response = await orchestrator.place_basket(legs)
+    assert response.overall_status == "success"
+    assert [r.payload["order_id"] for r in response.results] == ["A-1", "B-1", "C-1"]
+    assert [r.broker_id for r in response.results] == ["basket", "other", "basket"]
+    assert BasketAdapter.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_invalid_leg_rejects_whole_basket(orchestrator):
+    orchestrator, _ = orchestrator
+    with pytest.raises(ApiException) as exc_info:
+        await orchestrator.place_basket(
+            [_leg("A"), BasketLeg(broker="basket", order={"symbol": "B"})]
+        )
+    assert exc_info.value.error.error_code == "INVALID_BASKET"
+    assert exc_info.value.error.details["legs"][0]["leg"] == 1
+    assert BasketAdapter.placed == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_partial_failure_without_all_or_cancel(orchestrator):
+    orchestrator, _ = orchestrator
+    response = await orchestrator.place_basket([_leg("A"), _leg("B", reject=True)])
+    assert response.overall_status == "partial_success"
+    assert [r.code for r in response.results] == [None, "ORDER_REJECTED"]
+    assert BasketAdapter.cancelled == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_all_or_cancel_rolls_back_placed_legs(orchestrator):
+    orchestrator, _ = orchestrator
+    response = await orchestrator.place_basket(
+        [_leg("A"), _leg("B", reject=True), _leg("C", broker="other")],
+        all_or_cancel=True,
+    )
+    assert response.overall_status == "failure"
+    assert [r.code for r in response.results] == [
+        "ROLLED_BACK",
+        "ORDER_REJECTED",
+        "ROLLED_BACK",
+    ]
+    assert sorted(BasketAdapter.cancelled) == ["A-1", "C-1"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_all_or_cancel_reports_legs_cut_off_by_deadline_as_unresolved(
+    orchestrator,
+):
+    orchestrator, _ = orchestrator
+    response = await orchestrator.place_basket(
+        [_leg("A"), _leg("B", broker="other", delay=1.0)],
+        all_or_cancel=True,
+        deadline=0.1,
+    )
+    assert response.overall_status == "failure"
+    assert [r.code for r in response.results] == ["ROLLED_BACK", "UNRESOLVED"]
+    assert "may be live at the broker" in response.results[1].message
+    assert BasketAdapter.cancelled == ["A-1"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_basket_legs_respect_broker_rate_limit(orchestrator):
+    orchestrator, registry = orchestrator
+    registry.use(BrokerRateLimiter({"basket": {"rate": 100.0, "burst": 1}}))
+    response = await orchestrator.place_basket([_leg(s, delay=0) for s in "ABCD"])
+    assert response.overall_status == "success"
+    assert BasketAdapter.max_in_flight == 1
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from ordo.adapters.mock import MockAdapter
+from ordo.adapters.registry import AdapterRegistry
+from ordo.core.cache import ReadThroughCache, cache_age_scope
+
+
+class CountingAdapter(MockAdapter):
+    calls = 0
+    delay = 0.0
+
+    async def get_portfolio(self, session_data):
+        CountingAdapter.calls += 1
+        await asyncio.sleep(CountingAdapter.delay)
+        return await super().get_portfolio(session_data)
+
+    async def cancel_order(self, session_data, order_id):
+        return {"order_id": order_id, "status": "cancelled"}
+
+
+@pytest.fixture
+def adapter_and_cache():
+    CountingAdapter.calls = 0
+    CountingAdapter.delay = 0.0
+    cache = ReadThroughCache({"get_portfolio": 60.0})
+    registry = AdapterRegistry(plugins={"counting": CountingAdapter})
+    registry.use(cache)
+    return registry.get("counting"), cache
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_serves_repeat_reads(adapter_and_cache):
+    adapter, cache = adapter_and_cache
+    first = await adapter.get_portfolio({})
+    with cache_age_scope() as age:
+        second = await adapter.get_portfolio({})
+    assert second is first
+    assert CountingAdapter.calls == 1
+    assert age.max_age is not None and age.max_age >= 0
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_is_per_account():
+    CountingAdapter.calls = 0
+    registry = AdapterRegistry(plugins={"counting": CountingAdapter})
+    registry.use(ReadThroughCache({"get_portfolio": 60.0}))
+    await registry.get("counting", "a").get_portfolio({})
+    await registry.get("counting", "b").get_portfolio({})
+    assert CountingAdapter.calls == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_write_invalidates_account_entries(adapter_and_cache):
+    adapter, cache = adapter_and_cache
+    await adapter.get_portfolio({})
+    await adapter.cancel_order({}, "order-1")
+    await adapter.get_portfolio({})
+    assert CountingAdapter.calls == 2
+    assert cache.stats()["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_read_in_flight_across_write_is_not_stored(adapter_and_cache):
+    adapter, _ = adapter_and_cache
+    CountingAdapter.delay = 0.05
+    read = asyncio.ensure_future(adapter.get_portfolio({}))
+    await asyncio.sleep(0.01)
+    await adapter.cancel_order({}, "order-1")
+    await read
+    CountingAdapter.delay = 0.0
+    await adapter.get_portfolio({})
+    assert CountingAdapter.calls == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_failed_reads_are_not_cached():
+    cache = ReadThroughCache({"get_profile": 60.0})
+    registry = AdapterRegistry(plugins={"mock": MockAdapter})
+    registry.use(cache)
+    mock = registry.get("mock")
+    with pytest.raises(NotImplementedError):
+        await mock.get_profile({})
+    assert cache.stats()["entries"] == 0
+
+
+def test_fan_out_reports_cache_age_header():
+    from fastapi.testclient import TestClient
+
+    from ordo.config import settings
+    from ordo.main import app
+
+    headers = {"Authorization": f"Bearer {settings.ORDO_API_TOKEN}"}
+    body = {"operation": "get_portfolio", "targets": [{"broker": "mock"}]}
+    with TestClient(app) as client:
+        client.post("/api/v1/fan-out", json=body, headers=headers)
+        response = client.post("/api/v1/fan-out", json=body, headers=headers)
+    assert response.status_code == 200
+    assert "Age" in response.headers
+    assert response.json()["results"][0]["cache_age_ms"] is not None
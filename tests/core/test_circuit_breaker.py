@@ -0,0 +1,220 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ordo.adapters.mock import MockAdapter
+from ordo.adapters.registry import AdapterRegistry
+from ordo.core.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    BrokerCircuitBreaker,
+    CircuitBreaker,
+    is_broker_failure,
+)
+from ordo.core.orchestrator import RequestOrchestrator
+from ordo.models.api.errors import ApiError, ApiException
+from ordo.models.api.orchestrator import BrokerTarget
+from ordo.persistence.circuit_breaker_store import (
+    CircuitBreakerRecord,
+    InMemoryCircuitBreakerStore,
+)
+
+
+def _api_error(code, status_code=None):
+    details = {"status_code": status_code} if status_code else None
+    return ApiException(ApiError(error_code=code, message="boom", details=details))
+
+
+class FlakyAdapter(MockAdapter):
+    fail = True
+    delay = 0.0
+    calls = 0
+
+    async def get_portfolio(self, session_data):
+        FlakyAdapter.calls += 1
+        await asyncio.sleep(FlakyAdapter.delay)
+        if "invalid" in session_data:
+            raise session_data["invalid"]
+        if FlakyAdapter.fail:
+            raise _api_error("BROKER_API_ERROR", 503)
+        return await super().get_portfolio(session_data)
+
+
+@pytest.fixture
+def flaky():
+    FlakyAdapter.fail = True
+    FlakyAdapter.delay = 0.0
+    FlakyAdapter.calls = 0
+    breakers = BrokerCircuitBreaker(
+        failure_threshold=2,
+        window=60.0,
+        reset_timeout=0.05,
+        store=InMemoryCircuitBreakerStore(),
+    )
+    registry = AdapterRegistry(plugins={"flaky": FlakyAdapter})
+    registry.use(breakers)
+    return registry.get("flaky"), breakers
+
+
+@pytest.mark.unit
+def test_failure_classification():
+    assert is_broker_failure(asyncio.TimeoutError())
+    assert is_broker_failure(_api_error("BROKER_API_ERROR", 502))
+    assert is_broker_failure(_api_error("BROKER_REQUEST_FAILED"))
+    assert not is_broker_failure(_api_error("BROKER_API_ERROR", 400))
+    assert not is_broker_failure(_api_error("UNAUTHORIZED"))
+    assert not is_broker_failure(NotImplementedError())
+
+
+@pytest.mark.unit
+def test_failures_outside_window_do_not_open():
+    breaker = CircuitBreaker("fyers", failure_threshold=2, window=0.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_open_circuit_fails_fast(flaky):
+    adapter, breakers = flaky
+    for _ in range(2):
+        with pytest.raises(ApiException):
+            await adapter.get_portfolio({})
+    assert breakers.breaker_for("flaky").state == OPEN
+
+    with pytest.raises(ApiException) as exc_info:
+        await adapter.get_portfolio({})
+    assert exc_info.value.error.error_code == "CB_OPEN"
+    assert FlakyAdapter.calls == 2
+    assert breakers.stats()["flaky"]["rejected"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_half_open_admits_single_probe_then_closes(flaky):
+    adapter, breakers = flaky
+    for _ in range(2):
+        with pytest.raises(ApiException):
+            await adapter.get_portfolio({})
+    await asyncio.sleep(0.06)
+
+    FlakyAdapter.fail = False
+    FlakyAdapter.delay = 0.02
+    results = await asyncio.gather(
+        adapter.get_portfolio({}), adapter.get_portfolio({}), return_exceptions=True
+    )
+    assert not isinstance(results[0], Exception)
+    assert results[1].error.error_code == "CB_OPEN"
+    assert breakers.breaker_for("flaky").state == CLOSED
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_failed_probe_reopens(flaky):
+    adapter, breakers = flaky
+    for _ in range(2):
+        with pytest.raises(ApiException):
+            await adapter.get_portfolio({})
+    await asyncio.sleep(0.06)
+
+    with pytest.raises(ApiException) as exc_info:
+        await adapter.get_portfolio({})
+    assert exc_info.value.error.error_code == "BROKER_API_ERROR"
+    assert breakers.breaker_for("flaky").state == OPEN
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_probe_rejected_by_the_client_side_stays_half_open(flaky):
+    adapter, breakers = flaky
+    for _ in range(2):
+        with pytest.raises(ApiException):
+            await adapter.get_portfolio({})
+    await asyncio.sleep(0.06)
+
+    FlakyAdapter.fail = False
+    with pytest.raises(ApiException):
+        await adapter.get_portfolio({"invalid": _api_error("VALIDATION_ERROR", 400)})
+    breaker = breakers.breaker_for("flaky")
+    assert breaker.state == HALF_OPEN
+    # The slot was released, so the next call is the probe.
+    await adapter.get_portfolio({})
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cancelled_probe_releases_slot():
+    breaker = CircuitBreaker("fyers", failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_orchestrator_timeouts_count_as_failures(flaky):
+    FlakyAdapter.fail = False
+    FlakyAdapter.delay = 1.0
+    _, breakers = flaky
+    registry = AdapterRegistry(plugins={"flaky": FlakyAdapter})
+    registry.use(breakers)
+    orchestrator = RequestOrchestrator(registry, target_timeout=0.01)
+
+    codes = []
+    for _ in range(3):
+        response = await orchestrator.fan_out(
+            "get_portfolio", [BrokerTarget(broker="flaky")]
+        )
+        codes.append(response.results[0].code)
+
+    assert codes == ["TIMEOUT", "TIMEOUT", "CB_OPEN"]
+    assert breakers.breaker_for("flaky").state == OPEN
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_caller_going_away_leaves_no_outcome(flaky):
+    FlakyAdapter.fail = False
+    FlakyAdapter.delay = 1.0
+    adapter, breakers = flaky
+    call = asyncio.ensure_future(adapter.get_portfolio({}))
+    await asyncio.sleep(0.01)
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    assert breakers.breaker_for("flaky").stats()["failure_count"] == 0
+
+
+@pytest.mark.unit
+def test_state_survives_restart():
+    store = InMemoryCircuitBreakerStore()
+    breaker = CircuitBreaker("fyers", failure_threshold=1, store=store)
+    breaker.record_failure()
+    assert store.load("fyers").state == OPEN
+
+    restored = CircuitBreaker("fyers", reset_timeout=120.0, store=store)
+    assert restored.state == OPEN
+    assert 0 < restored.retry_after() <= 120.0
+
+
+@pytest.mark.unit
+def test_restored_circuit_past_reset_timeout_probes():
+    store = InMemoryCircuitBreakerStore()
+    store.save(
+        CircuitBreakerRecord(
+            adapter_id="hdfc",
+            state=OPEN,
+            failure_count=5,
+            last_failure_at=datetime.now(timezone.utc) - timedelta(minutes=5),
+        )
+    )
+    breaker = CircuitBreaker("hdfc", reset_timeout=120.0, store=store)
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from ordo.adapters.hdfc import parse_trade_book
+from ordo.core.concurrency import ParsePool, gather_or_cancel
+
+
+async def _value(value, delay=0.0):
+    await asyncio.sleep(delay)
+    return value
+
+
+async def _fail(exc, delay=0.0):
+    await asyncio.sleep(delay)
+    raise exc
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_gather_or_cancel_returns_results_in_order():
+    assert await gather_or_cancel(_value("a", 0.02), _value("b")) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_gather_or_cancel_runs_concurrently():
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await gather_or_cancel(_value(1, 0.1), _value(2, 0.1))
+    assert loop.time() - start < 0.19
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_gather_or_cancel_cancels_sibling_and_reraises_unwrapped():
+    sibling_cancelled = asyncio.Event()
+
+    async def sibling():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            sibling_cancelled.set()
+            raise
+
+    with pytest.raises(KeyError):
+        await gather_or_cancel(_fail(KeyError("x")), sibling())
+    assert sibling_cancelled.is_set()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_gather_or_cancel_prefers_earliest_argument_failure():
+    with pytest.raises(ValueError):
+        await gather_or_cancel(_fail(ValueError()), _fail(KeyError()))
+
+
+@pytest.mark.unit
+def test_parse_pool_routes_by_body_size():
+    pool = ParsePool(inline_max_bytes=10, process_min_bytes=100, process_workers=1)
+    assert [pool.mode(size) for size in (9, 10, 99, 100)] == [
+        "inline",
+        "thread",
+        "thread",
+        "process",
+    ]
+    assert ParsePool(inline_max_bytes=10).mode(10**9) == "thread"
+    assert ParsePool(thread_workers=0).mode(10**9) == "inline"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_parse_pool_parses_large_bodies_off_the_loop():
+    pool = ParsePool(inline_max_bytes=10, thread_workers=1)
+    threads = []
+
+    def parser(body):
+        threads.append(threading.current_thread().name)
+        return json.loads(body)
+
+    try:
+        results = await asyncio.gather(
+            pool.parse(b"[1]", parser), pool.parse(b'["large body"]', parser)
+        )
+    finally:
+        pool.shutdown()
+
+    assert results == [[1], ["large body"]]
+    assert threads[0] == threading.current_thread().name
+    assert threads[1].startswith("ordo-parse")
+    stats = pool.stats()
+    assert stats["calls"] == {"inline": 1, "thread": 1, "process": 0}
+    assert stats["pools"]["thread"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_parse_pool_hands_very_large_bodies_to_a_process():
+    pool = ParsePool(inline_max_bytes=1, process_min_bytes=1, process_workers=1)
+    body = json.dumps(
+        {
+            "data": [
+                {
+                    "trade_id": f"T{i}",
+                    "order_id": f"O{i}",
+                    "exchange": "NSE",
+                    "product": "DELIVERY",
+                    "average_price": 1500.0,
+                    "filled_quantity": 10,
+                    "exchange_order_id": f"E{i}",
+                    "transaction_type": "BUY",
+                    "fill_timestamp": "04/10/2025 12:00:00",
+                    "security_id": "HDFC",
+                    "company_name": "HDFC Bank",
+                    "client_id": "TESTCLIENT",
+                    "pending_quantity": 0,
+                    "underlying_symbol": "HDFCBANK",
+                    "instrument_segment": "EQUITY",
+                    "expiry_date": None,
+                    "strike_price": None,
+                    "option_type": None,
+                    "isin": "INE040A01034",
+                    "status": "completed",
+                    "validity": "DAY",
+                    "total_traded_value": 15000.0,
+                    "order_source": "API",
+                    "order_type": "LIMIT",
+                }
+                for i in range(500)
+            ]
+        }
+    ).encode()
+    try:
+        trades = await pool.parse(body, parse_trade_book)
+    finally:
+        pool.shutdown()
+    assert [t.trade_id for t in trades[:2]] == ["T0", "T1"]
+    assert pool.stats()["calls"]["process"] == 1
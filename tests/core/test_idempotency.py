@@ -0,0 +1,150 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ordo.core.idempotency import (
+    IdempotencyManager,
+    IdempotentResponse,
+    request_hash,
+)
+from ordo.core.retry import current_idempotency_key
+from ordo.models.api.errors import ApiException
+from ordo.persistence.idempotency_store import (
+    IdempotencyRecord,
+    InMemoryIdempotencyStore,
+)
+
+
+class Counter:
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.delay = delay
+        self.keys = []
+
+    async def __call__(self):
+        self.calls += 1
+        self.keys.append(current_idempotency_key())
+        await asyncio.sleep(self.delay)
+        return IdempotentResponse(200, {"call": self.calls})
+
+
+@pytest.fixture
+def manager():
+    return IdempotencyManager(store=InMemoryIdempotencyStore())
+
+
+@pytest.mark.unit
+def test_request_hash_ignores_key_order():
+    assert request_hash({"a": 1, "b": [1, 2]}) == request_hash({"b": [1, 2], "a": 1})
+    assert request_hash({"a": 1}) != request_hash({"a": 2})
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_completed_key_replays_response(manager):
+    execute = Counter()
+    first, replayed = await manager.run("k1", "h", execute)
+    assert not replayed
+    second, replayed = await manager.run("k1", "h", execute)
+    assert replayed
+    assert second == first
+    assert execute.calls == 1
+    assert execute.keys == ["k1"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_concurrent_duplicates_share_one_execution(manager):
+    execute = Counter(delay=0.02)
+    results = await asyncio.gather(*(manager.run("k1", "h", execute) for _ in range(5)))
+    assert execute.calls == 1
+    assert [replayed for _, replayed in results].count(False) == 1
+    assert all(response == results[0][0] for response, _ in results)
+    assert manager.stats()["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_key_reused_with_different_request_is_rejected(manager):
+    await manager.run("k1", "h1", Counter())
+    with pytest.raises(ApiException) as exc_info:
+        await manager.run("k1", "h2", Counter())
+    assert exc_info.value.error.error_code == "IDEMPOTENCY_KEY_MISMATCH"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_failed_request_releases_key(manager):
+    async def fail():
+        raise RuntimeError("broker down")
+
+    with pytest.raises(RuntimeError):
+        await manager.run("k1", "h", fail)
+    response, replayed = await manager.run("k1", "h", Counter())
+    assert not replayed
+    assert response.body == {"call": 1}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_response_that_reached_no_broker_releases_key(manager):
+    async def rejected_locally():
+        return IdempotentResponse(503, {"code": "CB_OPEN"}, replayable=False)
+
+    response, replayed = await manager.run("k1", "h", rejected_locally)
+    assert (response.status_code, replayed) == (503, False)
+    assert manager.store.get("k1") is None
+
+    response, replayed = await manager.run("k1", "h", Counter())
+    assert not replayed
+    assert response.body == {"call": 1}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_replays_from_store_after_restart():
+    store = InMemoryIdempotencyStore()
+    await IdempotencyManager(store=store).run("k1", "h", Counter())
+
+    restarted = IdempotencyManager(store=store)
+    execute = Counter()
+    response, replayed = await restarted.run("k1", "h", execute)
+    assert replayed
+    assert response.body == {"call": 1}
+    assert execute.calls == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_key_reserved_by_another_worker_is_in_progress():
+    store = InMemoryIdempotencyStore()
+    store.reserve(
+        IdempotencyRecord(
+            key="k1",
+            response_snapshot_json=json.dumps(
+                {"state": "in_progress", "request_hash": "h"}
+            ),
+            expires_at=datetime.now(timezone.utc) + timedelta(minutes=1),
+        )
+    )
+    with pytest.raises(ApiException) as exc_info:
+        await IdempotencyManager(store=store).run("k1", "h", Counter())
+    assert exc_info.value.error.error_code == "IDEMPOTENCY_KEY_IN_PROGRESS"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_sweep_removes_expired_keys():
+    manager = IdempotencyManager(
+        store=InMemoryIdempotencyStore(), ttl=timedelta(seconds=-1)
+    )
+    await manager.run("k1", "h", Counter())
+    assert manager.sweep() == 1
+    assert manager.stats()["indexed"] == 0
+
+    execute = Counter()
+    _, replayed = await manager.run("k1", "h", execute)
+    assert not replayed
+    assert execute.calls == 1
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from ordo.core.kill_switch import KillSwitch
+from ordo.models.api.errors import ApiException
+from ordo.persistence.kill_switch_store import (
+    InMemoryKillSwitchStore,
+    SQLiteKillSwitchStore,
+)
+
+
+@pytest.mark.unit
+def test_check_raises_only_when_active():
+    switch = KillSwitch(store=InMemoryKillSwitchStore())
+    switch.check()
+    switch.set(True)
+    with pytest.raises(ApiException) as exc_info:
+        switch.check()
+    assert exc_info.value.error.error_code == "KILL_SWITCH_ACTIVE"
+    switch.set(False)
+    switch.check()
+
+
+@pytest.mark.unit
+def test_state_survives_restart(tmp_path):
+    path = str(tmp_path / "ordo.db")
+    KillSwitch(store=SQLiteKillSwitchStore(path)).set(True)
+
+    restarted = KillSwitch(store=SQLiteKillSwitchStore(path))
+    assert restarted.active is False
+    restarted.load()
+    assert restarted.active is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_toggle_propagates_to_other_workers(tmp_path):
+    path = str(tmp_path / "ordo.db")
+    worker_a = KillSwitch(store=SQLiteKillSwitchStore(path))
+    worker_b = KillSwitch(store=SQLiteKillSwitchStore(path))
+    watcher = asyncio.create_task(worker_b.watch(0.01))
+    try:
+        worker_a.set(True)
+        for _ in range(100):
+            if worker_b.active:
+                break
+            await asyncio.sleep(0.01)
+        assert worker_b.active is True
+    finally:
+        watcher.cancel()
@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ordo.config import settings
+from ordo.core.loop_monitor import SlowCallbackDetector
+from ordo.main import app
+
+AUTH_HEADERS = {"Authorization": f"Bearer {settings.ORDO_API_TOKEN}"}
+
+
+def parse_blocking():
+    time.sleep(0.2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_blocking_callback_is_caught_with_its_stack():
+    detector = SlowCallbackDetector(threshold=0.05)
+    detector.start()
+    try:
+        await asyncio.sleep(0.05)
+        parse_blocking()
+        await asyncio.sleep(0.1)
+    finally:
+        detector.stop()
+
+    (event,) = detector.events
+    assert event["hot_spot"].endswith("in parse_blocking")
+    assert 100 < event["blocked_ms"] < 400
+    (spot,) = detector.top()
+    assert spot["count"] == 1 and spot["hot_spot"] == event["hot_spot"]
+    assert detector.stats()["detected"] == 1
+    assert not detector.stats()["watching"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_an_idle_loop_reports_nothing():
+    detector = SlowCallbackDetector(threshold=0.05)
+    detector.start()
+    await asyncio.sleep(0.2)
+    detector.stop()
+    assert detector.detected == 0
+
+
+def test_event_loop_diagnostics_are_admin_only():
+    with TestClient(app) as client:
+        response = client.get("/api/v1/diagnostics/event-loop", headers=AUTH_HEADERS)
+        unauthenticated = client.get("/api/v1/diagnostics/event-loop")
+    assert unauthenticated.status_code == 401
+    body = response.json()
+    assert body["slow_callbacks"]["watching"]
+    assert set(body) == {"lag", "slow_callbacks", "hot_spots", "recent"}
@@ -0,0 +1,151 @@
+import json
+import time
+
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from ordo.adapters.http_pool import HttpClientPool
+from ordo.adapters.interceptors import AdapterCall
+from ordo.api.metrics import collect_service_stats
+from ordo.config import settings
+from ordo.core.metrics import (
+    ADAPTER_CALL_SECONDS,
+    BROKER_HTTP_RESPONSES,
+    MetricsInterceptor,
+    MetricsRegistry,
+    _merge,
+    metrics,
+    render,
+)
+from ordo.core.pipeline import retries
+from ordo.main import app
+from ordo.models.api.errors import ApiError, ApiException
+
+AUTH_HEADERS = {"Authorization": f"Bearer {settings.ORDO_API_TOKEN}"}
+
+
+@pytest.mark.unit
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = registry.histogram("t_seconds", "Latency.", ("broker",), (0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value, "fyers")
+    text = render(_merge([registry.snapshot()], False, float("inf")))
+    assert 't_seconds_bucket{broker="fyers",le="0.1"} 2' in text
+    assert 't_seconds_bucket{broker="fyers",le="1.0"} 3' in text
+    assert 't_seconds_bucket{broker="fyers",le="+Inf"} 4' in text
+    assert 't_seconds_count{broker="fyers"} 4' in text
+    assert "# TYPE t_seconds histogram" in text
+
+
+@pytest.mark.unit
+def test_collectors_refresh_values_on_snapshot():
+    registry = MetricsRegistry()
+    gauge = registry.gauge("t_entries", "Entries.")
+    source = {"entries": 3}
+    registry.add_collector(lambda: gauge.set(source["entries"]))
+    source["entries"] = 7
+    assert registry.snapshot()["metrics"]["t_entries"]["samples"] == [[[], 7]]
+
+
+@pytest.mark.unit
+def test_worker_snapshots_merge_and_stale_gauges_drop_out():
+    def worker(pid, age):
+        registry = MetricsRegistry()
+        registry.counter("t_total", "Calls.").inc()
+        registry.gauge("t_busy", "Busy.").set(2)
+        registry.gauge("t_ratio", "Ratio.", merge="all").set(0.5)
+        registry.histogram("t_seconds", "Latency.", buckets=(1.0,)).observe(0.5)
+        snapshot = registry.snapshot()
+        snapshot.update(pid=pid, written_at=time.time() - age)
+        return snapshot
+
+    merged = _merge([worker(1, 0), worker(2, 0), worker(3, 60)], True, 15)
+    assert merged["t_total"]["samples"] == {(): 3.0}
+    assert merged["t_busy"]["samples"] == {(): 4}
+    assert merged["t_ratio"]["samples"] == {("1",): 0.5, ("2",): 0.5}
+    assert merged["t_seconds"]["samples"][()] == ([3, 0], 1.5)
+    assert 't_ratio{pid="2"} 0.5' in render(merged)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_multiprocess_scrape_reports_every_worker(tmp_path):
+    first = MetricsRegistry(directory=str(tmp_path))
+    second = MetricsRegistry(directory=str(tmp_path))
+    for registry in (first, second):
+        registry.counter("t_total", "Calls.").inc(amount=2)
+    # Stand in for another worker's periodic write.
+    snapshot = second.snapshot()
+    snapshot["pid"] = -1
+    (tmp_path / "metrics--1.json").write_text(json.dumps(snapshot))
+
+    assert "t_total 4.0" in await first.scrape()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_interceptor_times_calls_by_outcome():
+    call = AdapterCall(
+        broker_id="t-broker", account_id=None, account_key="", method="get_holdings"
+    )
+
+    async def ok():
+        return []
+
+    async def rejected():
+        raise ApiException(ApiError(error_code="CB_OPEN", message="open"))
+
+    interceptor = MetricsInterceptor()
+    await interceptor(call, ok)
+    with pytest.raises(ApiException):
+        await interceptor(call, rejected)
+    samples = ADAPTER_CALL_SECONDS._values
+    assert sum(samples[("t-broker", "get_holdings", "success")][0]) == 1
+    assert sum(samples[("t-broker", "get_holdings", "CB_OPEN")][0]) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_pool_counts_broker_status_codes():
+    pool = HttpClientPool()
+    with respx.mock:
+        respx.get("https://broker.test/quote").respond(503)
+        await pool.get_client("t-pool").get("https://broker.test/quote")
+    await pool.aclose()
+    assert BROKER_HTTP_RESPONSES._values[("t-pool", "503")] == 1
+
+
+@pytest.mark.unit
+def test_retries_and_give_ups_are_exported(monkeypatch):
+    monkeypatch.setattr(retries, "attempts", type(retries.attempts)())
+    monkeypatch.setattr(retries, "outcomes", type(retries.outcomes)())
+    retries.attempts[("t-retry", "get_holdings", "attempt")] += 3
+    retries.attempts[("t-retry", "get_holdings", "server_error")] += 2
+    retries.outcomes[("t-retry", "get_holdings", "exhausted")] += 1
+    collect_service_stats()
+    text = render(_merge([metrics.snapshot()], False, float("inf")))
+    assert (
+        'ordo_broker_retries_total{broker="t-retry",method="get_holdings",'
+        'reason="server_error"} 2' in text
+    )
+    assert 'reason="attempt"' not in text
+    assert (
+        'ordo_broker_retry_give_ups_total{broker="t-retry",method="get_holdings",'
+        'reason="exhausted"} 1' in text
+    )
+
+
+def test_metrics_endpoint_requires_token_and_exposes_pipeline():
+    with TestClient(app) as client:
+        unauthenticated = client.get("/metrics")
+        client.get("/api/v1/brokers/mock/holdings", headers=AUTH_HEADERS)
+        response = client.get("/metrics", headers=AUTH_HEADERS)
+    assert unauthenticated.status_code == 401
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'ordo_adapter_call_seconds_count{broker="mock"' in response.text
+    assert 'ordo_edge_requests_total{client="default",decision="admitted"}' in (
+        response.text
+    )
+    assert "ordo_read_cache_hit_ratio" in response.text
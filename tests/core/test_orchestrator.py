@@ -0,0 +1,147 @@
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ordo.adapters.mock import MockAdapter
+from ordo.adapters.registry import AdapterRegistry
+from ordo.config import settings
+from ordo.core.orchestrator import RequestOrchestrator
+from ordo.models.api.errors import ApiError, ApiException
+from ordo.models.api.orchestrator import BrokerTarget
+
+
+class SlowAdapter(MockAdapter):
+    delay = 0.2
+    cancelled = False
+
+    async def get_portfolio(self, session_data):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            SlowAdapter.cancelled = True
+            raise
+        return await super().get_portfolio(session_data)
+
+
+class FailingAdapter(MockAdapter):
+    async def get_portfolio(self, session_data):
+        raise ApiException(ApiError(error_code="BROKER_API_ERROR", message="boom"))
+
+
+@pytest.fixture
+def registry():
+    return AdapterRegistry(
+        plugins={"mock": MockAdapter, "slow": SlowAdapter, "failing": FailingAdapter}
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_fan_out_all_success(registry):
+    orchestrator = RequestOrchestrator(registry)
+    response = await orchestrator.fan_out(
+        "get_portfolio",
+        [BrokerTarget(broker="mock"), BrokerTarget(broker="mock", account_id="b")],
+    )
+    assert response.overall_status == "success"
+    assert [r.status for r in response.results] == ["success", "success"]
+    assert response.results[1].account_id == "b"
+    assert "holdings" in response.results[0].payload
+    assert response.errors is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_fan_out_partial_success_keeps_request_order(registry):
+    orchestrator = RequestOrchestrator(registry)
+    response = await orchestrator.fan_out(
+        "get_portfolio", [BrokerTarget(broker="failing"), BrokerTarget(broker="mock")]
+    )
+    assert response.overall_status == "partial_success"
+    assert response.results[0].broker_id == "failing"
+    assert response.results[0].code == "BROKER_API_ERROR"
+    assert response.errors[0].details["broker_id"] == "failing"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_fan_out_runs_targets_concurrently(registry):
+    orchestrator = RequestOrchestrator(registry)
+    start = time.perf_counter()
+    response = await orchestrator.fan_out(
+        "get_portfolio",
+        [BrokerTarget(broker="slow", account_id=str(i)) for i in range(5)],
+    )
+    assert response.overall_status == "success"
+    assert time.perf_counter() - start < SlowAdapter.delay * 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_fan_out_per_target_timeout(registry):
+    orchestrator = RequestOrchestrator(registry)
+    response = await orchestrator.fan_out(
+        "get_portfolio",
+        [BrokerTarget(broker="slow"), BrokerTarget(broker="mock")],
+        target_timeout=0.05,
+    )
+    assert response.overall_status == "partial_success"
+    assert response.results[0].code == "TIMEOUT"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_fan_out_deadline_cancels_stragglers(registry):
+    SlowAdapter.cancelled = False
+    orchestrator = RequestOrchestrator(registry)
+    response = await orchestrator.fan_out(
+        "get_portfolio", [BrokerTarget(broker="slow")], target_timeout=5, deadline=0.05
+    )
+    assert response.overall_status == "failure"
+    assert response.results[0].code == "DEADLINE_EXCEEDED"
+    assert SlowAdapter.cancelled
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_fan_out_unsupported_and_unknown_targets(registry):
+    orchestrator = RequestOrchestrator(registry)
+    response = await orchestrator.fan_out(
+        "get_profile", [BrokerTarget(broker="mock"), BrokerTarget(broker="nope")]
+    )
+    assert response.overall_status == "failure"
+    assert [r.code for r in response.results] == ["NOT_SUPPORTED", "INVALID_REQUEST"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_fan_out_rejects_write_operations(registry):
+    with pytest.raises(ValueError):
+        await RequestOrchestrator(registry).fan_out(
+            "cancel_order", [BrokerTarget(broker="mock")]
+        )
+
+
+def test_fan_out_endpoint_status_codes():
+    from ordo.main import app
+
+    headers = {"Authorization": f"Bearer {settings.ORDO_API_TOKEN}"}
+    with TestClient(app) as client:
+        ok = client.post(
+            "/api/v1/fan-out",
+            json={"operation": "get_portfolio", "targets": [{"broker": "mock"}]},
+            headers=headers,
+        )
+        partial = client.post(
+            "/api/v1/fan-out",
+            json={
+                "operation": "get_portfolio",
+                "targets": [{"broker": "mock"}, {"broker": "unknown"}],
+            },
+            headers=headers,
+        )
+    assert ok.status_code == 200
+    assert ok.json()["overall_status"] == "success"
+    assert partial.status_code == 207
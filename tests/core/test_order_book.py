@@ -0,0 +1,110 @@
+import pytest
+from pydantic import BaseModel
+
+from ordo.core.order_book import OrderBookTracker, VersionedOrderBook
+
+
+def _order(order_id, status="open", filled=0):
+    return {"order_id": order_id, "status": status, "filled": filled}
+
+
+@pytest.mark.unit
+def test_apply_reports_inserts_updates_and_removals():
+    book = VersionedOrderBook()
+    first = book.apply([_order("A"), _order("B")])
+    assert [o["order_id"] for o in first.inserted] == ["A", "B"]
+    assert book.version == 1
+
+    unchanged = book.apply([_order("A"), _order("B")])
+    assert not unchanged
+    assert book.version == 1
+
+    changes = book.apply([_order("A", "completed", 1), _order("C")])
+    assert changes.updated == [(_order("A"), _order("A", "completed", 1))]
+    assert changes.inserted == [_order("C")]
+    assert changes.removed == [_order("B")]
+    assert book.version == 2
+
+
+@pytest.mark.unit
+def test_since_returns_only_changes_after_a_version():
+    book = VersionedOrderBook()
+    book.apply([_order("A"), _order("B")])
+    book.apply([_order("A", "completed", 1), _order("B")])
+    book.apply([_order("A", "completed", 1), _order("C")])
+
+    delta = book.since(1, book.epoch)
+    assert not delta.full
+    assert (delta.version, delta.since) == (3, 1)
+    assert delta.orders == [_order("A", "completed", 1), _order("C")]
+    assert delta.removed == ["B"]
+
+    current = book.since(3, book.epoch)
+    assert current.orders == [] and current.removed == []
+
+
+@pytest.mark.unit
+def test_unknown_or_expired_versions_get_a_snapshot():
+    book = VersionedOrderBook(max_log=2)
+    for filled in range(4):
+        book.apply([_order("A", filled=filled)])
+    assert book.oldest_version == 3
+
+    for version in (None, 1, 99):
+        delta = book.since(version, book.epoch)
+        assert delta.full
+        assert delta.orders == [_order("A", filled=3)]
+    assert not book.since(3, book.epoch).full
+
+
+@pytest.mark.unit
+def test_versions_of_another_epoch_get_a_snapshot():
+    book, other = VersionedOrderBook(), VersionedOrderBook()
+    book.apply([_order("A")])
+    other.apply([_order("B")])
+    other.apply([_order("B", "completed", 1)])
+    assert book.epoch != other.epoch
+
+    delta = other.since(book.version, book.epoch)
+    assert delta.full and delta.epoch == other.epoch
+    assert delta.orders == [_order("B", "completed", 1)]
+    assert other.since(1, None).full
+
+
+@pytest.mark.unit
+def test_tracker_keeps_one_book_per_account():
+    tracker = OrderBookTracker()
+    assert tracker.book("mock", "a") is tracker.book("mock", "a")
+    assert tracker.book("mock", "a") is not tracker.book("mock", "b")
+    tracker.book("mock", "a").apply([_order("A")])
+    assert tracker.stats()["mock:a"] == {"version": 1, "orders": 1}
+
+
+@pytest.mark.unit
+def test_polls_fetched_earlier_than_the_applied_one_are_dropped():
+    book = VersionedOrderBook()
+    older, newer = book.fetch_sequence(), book.fetch_sequence()
+    assert book.apply([_order("A", "completed", 1)], newer)
+    stale = book.apply([_order("A")], older)
+    assert stale.stale and not stale
+    assert book.version == 1
+    assert book.snapshot().orders == [_order("A", "completed", 1)]
+
+
+@pytest.mark.unit
+def test_model_orders_are_only_converted_when_they_change():
+    class Order(BaseModel):
+        order_id: str
+        status: str
+
+    book = VersionedOrderBook()
+    book.apply([Order(order_id="A", status="open"), Order(order_id="B", status="open")])
+    changes = book.apply(
+        [Order(order_id="A", status="open"), Order(order_id="B", status="completed")]
+    )
+    assert changes.updated == [
+        ({"order_id": "B", "status": "open"}, {"order_id": "B", "status": "completed"})
+    ]
+    assert book.since(1, book.epoch).orders == [
+        {"order_id": "B", "status": "completed"}
+    ]
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from ordo.adapters.mock import MockAdapter
+from ordo.adapters.registry import AdapterRegistry
+from ordo.core.order_book import OrderBookTracker
+from ordo.core.order_stream import OVERFLOW_EVENT, OrderStreamHub
+
+
+class BookAdapter(MockAdapter):
+    polls = 0
+    orders = []
+    trades = []
+
+    async def get_order_book(self, session_data):
+        BookAdapter.polls += 1
+        return [dict(o) for o in BookAdapter.orders]
+
+    async def get_trade_book(self, session_data):
+        return [dict(t) for t in BookAdapter.trades]
+
+
+@pytest.fixture
+def hub():
+    BookAdapter.polls = 0
+    BookAdapter.orders = [{"order_id": "A", "status": "open", "filled": 0}]
+    BookAdapter.trades = []
+    registry = AdapterRegistry(plugins={"book": BookAdapter})
+    return OrderStreamHub(interval=0.01, registry=registry, books=OrderBookTracker())
+
+
+async def _next(subscription):
+    return await asyncio.wait_for(subscription.get(), 1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_subscribers_share_one_poller_and_see_transitions(hub):
+    subscriptions = [hub.subscribe("book") for _ in range(10)]
+    await asyncio.sleep(0.03)
+    polls = BookAdapter.polls
+    BookAdapter.orders = [
+        {"order_id": "A", "status": "completed", "filled": 1},
+        {"order_id": "B", "status": "open", "filled": 0},
+    ]
+    BookAdapter.trades = [{"trade_id": "T1", "order_id": "A"}]
+
+    for subscription in subscriptions:
+        events = [await _next(subscription) for _ in range(3)]
+        assert events[0]["event"] == "update"
+        assert events[0]["previous_status"] == "open"
+        assert events[0]["order"]["status"] == "completed"
+        assert events[1]["event"] == "new"
+        assert events[2] == {
+            "type": "trade",
+            "trade": {"trade_id": "T1", "order_id": "A"},
+        }
+    # One broker poll per interval, however many subscribers there are.
+    assert BookAdapter.polls - polls < 10
+    assert hub.stats()["book:"]["subscribers"] == 10
+
+    for subscription in subscriptions:
+        subscription.close()
+    polls = BookAdapter.polls
+    await asyncio.sleep(0.03)
+    assert BookAdapter.polls == polls
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_lagging_subscriber_is_dropped_with_overflow_event(hub):
+    hub.queue_size = 2
+    slow = hub.subscribe("book")
+    await asyncio.sleep(0.03)
+    for status in ("a", "b", "c"):
+        BookAdapter.orders = [{"order_id": "A", "status": status}]
+        await asyncio.sleep(0.03)
+
+    assert await _next(slow) == OVERFLOW_EVENT
+    assert await slow.get() is None
+    assert hub.stats()["book:"]["subscribers"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_dropping_the_last_subscriber_mid_poll_stops_the_poller(hub):
+    hub.queue_size = 1
+    slow = hub.subscribe("book")
+    feed = hub._feeds[("book", None)]
+    task = feed._task
+    await asyncio.sleep(0.03)
+    # One poll publishes two events, overflowing the queue inside publish().
+    BookAdapter.orders = [
+        {"order_id": "A", "status": "rejected"},
+        {"order_id": "B", "status": "open"},
+    ]
+    await asyncio.sleep(0.03)
+
+    assert await _next(slow) == OVERFLOW_EVENT
+    assert task.done() and not task.cancelled()
+    assert feed._task is None and feed._orders == {} and not feed._baseline
+
+
+@pytest.mark.unit
+def test_unknown_broker_is_rejected(hub):
+    with pytest.raises(ValueError):
+        hub.subscribe("nope")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_changes_seen_first_by_a_rest_poll_still_reach_subscribers():
+    BookAdapter.orders = [{"order_id": "A", "status": "open", "filled": 0}]
+    BookAdapter.trades = []
+    books = OrderBookTracker()
+    registry = AdapterRegistry(plugins={"book": BookAdapter})
+    hub = OrderStreamHub(interval=60, registry=registry, books=books)
+    subscription = hub.subscribe("book")
+    await asyncio.sleep(0.01)
+
+    BookAdapter.orders = [{"order_id": "A", "status": "completed", "filled": 1}]
+    # A REST /orders poll lands between two stream polls.
+    books.book("book").apply([dict(o) for o in BookAdapter.orders])
+    await hub._feeds[("book", None)].poll()
+
+    event = await _next(subscription)
+    assert (event["event"], event["previous_status"]) == ("update", "open")
+    subscription.close()
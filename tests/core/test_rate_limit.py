@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from ordo.adapters.mock import MockAdapter
+from ordo.adapters.registry import AdapterRegistry
+from ordo.core.rate_limit import (
+    READ_PRIORITY,
+    WRITE_PRIORITY,
+    BrokerRateLimiter,
+    TokenBucket,
+)
+from ordo.models.api.errors import ApiException
+
+
+class OrderingAdapter(MockAdapter):
+    async def cancel_order(self, session_data, order_id):
+        return {"order_id": order_id, "status": "cancelled"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_bucket_allows_burst_then_waits():
+    bucket = TokenBucket(rate=20.0, burst=2)
+    await bucket.acquire()
+    await bucket.acquire()
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await bucket.acquire()
+    assert loop.time() - start >= 0.03
+    stats = bucket.stats()
+    assert stats["acquired"] == 3
+    assert stats["queued"] == 1
+    assert stats["max_wait_ms"] > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_writes_go_ahead_of_queued_reads():
+    bucket = TokenBucket(rate=50.0, burst=1)
+    await bucket.acquire()
+    order = []
+
+    async def take(name, priority):
+        await bucket.acquire(priority)
+        order.append(name)
+
+    reads = [asyncio.create_task(take(f"read{i}", READ_PRIORITY)) for i in range(3)]
+    await asyncio.sleep(0)
+    write = asyncio.create_task(take("write", WRITE_PRIORITY))
+    await asyncio.gather(*reads, write)
+    assert order[0] == "write"
+    assert order[1:] == ["read0", "read1", "read2"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_full_queue_rejects_reads_and_displaces_them_for_writes():
+    bucket = TokenBucket(rate=5.0, burst=1, max_queue_depth=1)
+    await bucket.acquire()
+    queued_read = asyncio.create_task(bucket.acquire(READ_PRIORITY))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ApiException) as exc_info:
+        await bucket.acquire(READ_PRIORITY)
+    assert exc_info.value.error.error_code == "RATE_LIMITED"
+
+    write = asyncio.create_task(bucket.acquire(WRITE_PRIORITY))
+    with pytest.raises(ApiException):
+        await queued_read
+    await write
+    assert bucket.stats()["rejected"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_wait_timeout_raises_rate_limited():
+    bucket = TokenBucket(rate=1.0, burst=1)
+    await bucket.acquire()
+    with pytest.raises(ApiException) as exc_info:
+        await bucket.acquire(timeout=0.01)
+    assert exc_info.value.error.error_code == "RATE_LIMITED"
+    assert bucket.stats()["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_limiter_buckets_are_per_broker_and_account():
+    limiter = BrokerRateLimiter({"ordering": {"rate": 1.0, "burst": 1}}, max_wait=0.01)
+    registry = AdapterRegistry(
+        plugins={"ordering": OrderingAdapter, "mock": MockAdapter}
+    )
+    registry.use(limiter)
+    adapter = registry.get("ordering")
+
+    await adapter.cancel_order({}, "1")
+    with pytest.raises(ApiException):
+        await adapter.cancel_order({}, "2")
+
+    # Unlisted brokers are not limited.
+    mock = registry.get("mock")
+    for _ in range(3):
+        await mock.get_portfolio({})
+
+    assert list(limiter.stats()) == ["ordering:default"]
+    assert limiter.bucket_for("ordering", "other") is not limiter.bucket_for(
+        "ordering", "default"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rejections_say_when_to_retry():
+    bucket = TokenBucket(rate=2.0, burst=1, max_queue_depth=0)
+    await bucket.acquire()
+    with pytest.raises(ApiException) as exc_info:
+        await bucket.acquire()
+    assert 0.4 < exc_info.value.error.details["retry_after_seconds"] <= 0.5
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("rate, burst", [(0, 5), (-1.0, 5), (10.0, 0)])
+def test_limits_that_never_refill_are_rejected_up_front(rate, burst):
+    with pytest.raises(ValueError):
+        TokenBucket(rate, burst)
+    with pytest.raises(ValueError):
+        BrokerRateLimiter({"mock": {"rate": rate, "burst": burst}})
@@ -0,0 +1,157 @@
+import httpx
+import pytest
+
+from ordo.adapters.mock import MockAdapter
+from ordo.adapters.registry import AdapterRegistry
+from ordo.core.retry import (
+    RetryingInterceptor,
+    classify,
+    idempotency_key_scope,
+    parse_retry_after,
+)
+from ordo.models.api.errors import ApiError, ApiException
+
+
+def _status_error(status_code, retry_after=None):
+    return ApiException(
+        ApiError(
+            error_code="BROKER_API_ERROR",
+            message="boom",
+            details={"status_code": status_code, "retry_after": retry_after},
+        )
+    )
+
+
+def _wrapped(transport_error):
+    try:
+        raise transport_error
+    except Exception as e:
+        try:
+            raise ApiException(
+                ApiError(error_code="BROKER_REQUEST_FAILED", message=str(e))
+            )
+        except ApiException as wrapped:
+            return wrapped
+
+
+class ScriptedAdapter(MockAdapter):
+    """Raises the scripted errors in turn, then succeeds."""
+
+    script = []
+    calls = 0
+
+    async def _next(self, result):
+        ScriptedAdapter.calls += 1
+        if ScriptedAdapter.script:
+            raise ScriptedAdapter.script.pop(0)
+        return result
+
+    async def get_portfolio(self, session_data):
+        return await self._next({"ok": True})
+
+    async def cancel_order(self, session_data, order_id):
+        return await self._next({"order_id": order_id})
+
+
+@pytest.fixture
+def scripted():
+    ScriptedAdapter.script = []
+    ScriptedAdapter.calls = 0
+    retries = RetryingInterceptor(max_attempts=3, base_delay=0.001, max_delay=0.01)
+    registry = AdapterRegistry(plugins={"scripted": ScriptedAdapter})
+    registry.use(retries)
+    return registry.get("scripted"), retries
+
+
+@pytest.mark.unit
+def test_classification():
+    assert classify(_status_error(503)).reason == "server_error"
+    assert classify(_status_error(429, "2")).retry_after == 2.0
+    assert classify(_status_error(400)) is None
+    assert classify(ValueError("bad")) is None
+
+    connect = classify(_wrapped(httpx.ConnectError("refused")))
+    assert connect.reason == "connect_error"
+    assert connect.request_sent is False
+    assert classify(_wrapped(httpx.ReadTimeout("slow"))).reason == "transport_error"
+
+
+@pytest.mark.unit
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.unit
+def test_backoff_uses_full_jitter():
+    retries = RetryingInterceptor(base_delay=0.5, multiplier=2.0, max_delay=1.5)
+    for attempt, ceiling in [(1, 0.5), (2, 1.0), (3, 1.5), (4, 1.5)]:
+        delays = [retries.backoff(attempt) for _ in range(50)]
+        assert all(0 <= d <= ceiling for d in delays)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_transient_read_errors_are_retried(scripted):
+    adapter, retries = scripted
+    ScriptedAdapter.script = [_status_error(502), _status_error(429, "0")]
+    assert await adapter.get_portfolio({}) == {"ok": True}
+    assert ScriptedAdapter.calls == 3
+    counts = retries.stats()["retries"]["scripted:get_portfolio"]
+    assert counts == {"attempt": 3, "server_error": 1, "rate_limited": 1}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_gives_up_after_max_attempts(scripted):
+    adapter, retries = scripted
+    ScriptedAdapter.script = [_status_error(503) for _ in range(3)]
+    with pytest.raises(ApiException):
+        await adapter.get_portfolio({})
+    assert ScriptedAdapter.calls == 3
+    assert retries.stats()["retries"]["scripted:get_portfolio"]["gave_up_exhausted"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_client_errors_are_not_retried(scripted):
+    adapter, _ = scripted
+    ScriptedAdapter.script = [_status_error(400)]
+    with pytest.raises(ApiException):
+        await adapter.get_portfolio({})
+    assert ScriptedAdapter.calls == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_writes_retry_only_when_safe(scripted):
+    adapter, _ = scripted
+    ScriptedAdapter.script = [_status_error(503)]
+    with pytest.raises(ApiException):
+        await adapter.cancel_order({}, "1")
+    assert ScriptedAdapter.calls == 1
+
+    # The broker never saw the request, so a retry cannot duplicate it.
+    ScriptedAdapter.script = [_wrapped(httpx.ConnectError("refused"))]
+    assert await adapter.cancel_order({}, "2") == {"order_id": "2"}
+
+    # An idempotency key alone does not stop the broker acting twice.
+    ScriptedAdapter.calls = 0
+    ScriptedAdapter.script = [_status_error(503)]
+    with idempotency_key_scope("key-1"):
+        with pytest.raises(ApiException):
+            await adapter.cancel_order({}, "3")
+    assert ScriptedAdapter.calls == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_retry_budget_limits_retries(scripted):
+    adapter, retries = scripted
+    retries.budget_for("scripted")._tokens = 0
+    ScriptedAdapter.script = [_status_error(503)]
+    with pytest.raises(ApiException):
+        await adapter.get_portfolio({})
+    assert ScriptedAdapter.calls == 1
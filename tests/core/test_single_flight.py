@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from ordo.adapters.mock import MockAdapter
+from ordo.adapters.registry import AdapterRegistry
+from ordo.core.cache import ReadThroughCache
+from ordo.core.single_flight import SingleFlight
+
+
+class CountingAdapter(MockAdapter):
+    calls = 0
+    delay = 0.05
+    fail = False
+
+    async def get_order_book(self, session_data):
+        CountingAdapter.calls += 1
+        call = CountingAdapter.calls
+        await asyncio.sleep(CountingAdapter.delay)
+        if CountingAdapter.fail:
+            raise RuntimeError("broker down")
+        return [{"order_id": f"O-{call}"}]
+
+
+@pytest.fixture
+def registry():
+    CountingAdapter.calls = 0
+    CountingAdapter.fail = False
+    return AdapterRegistry(plugins={"counting": CountingAdapter})
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_concurrent_reads_share_one_call(registry):
+    flights = SingleFlight({"get_order_book": True})
+    registry.use(flights)
+    adapter = registry.get("counting")
+    results = await asyncio.gather(*(adapter.get_order_book({}) for _ in range(5)))
+    assert CountingAdapter.calls == 1
+    assert all(r is results[0] for r in results)
+    assert flights.stats()["methods"]["get_order_book"] == {
+        "calls": 1,
+        "coalesced": 4,
+    }
+    assert flights.stats()["in_flight"] == 0
+
+    await adapter.get_order_book({})
+    assert CountingAdapter.calls == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_coalescing_is_per_account_and_configurable(registry):
+    registry.use(SingleFlight({"get_order_book": False}))
+    await asyncio.gather(*(registry.get("counting").get_order_book({}) for _ in "ab"))
+    assert CountingAdapter.calls == 2
+
+    other = AdapterRegistry(plugins={"counting": CountingAdapter})
+    other.use(SingleFlight({"get_order_book": True}))
+    await asyncio.gather(
+        other.get("counting", "a").get_order_book({}),
+        other.get("counting", "b").get_order_book({}),
+    )
+    assert CountingAdapter.calls == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_errors_are_shared_and_not_remembered(registry):
+    registry.use(SingleFlight({"get_order_book": True}))
+    adapter = registry.get("counting")
+    CountingAdapter.fail = True
+    results = await asyncio.gather(
+        *(adapter.get_order_book({}) for _ in range(3)), return_exceptions=True
+    )
+    assert CountingAdapter.calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    CountingAdapter.fail = False
+    assert await adapter.get_order_book({})
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cancelled_caller_does_not_cancel_shared_call(registry):
+    registry.use(SingleFlight({"get_order_book": True}))
+    adapter = registry.get("counting")
+    first = asyncio.ensure_future(adapter.get_order_book({}))
+    second = asyncio.ensure_future(adapter.get_order_book({}))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert await second == [{"order_id": "O-1"}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_reads_after_a_write_do_not_join_earlier_flight(registry):
+    registry.use(SingleFlight({"get_order_book": True}))
+    adapter = registry.get("counting")
+    before = asyncio.ensure_future(adapter.get_order_book({}))
+    await asyncio.sleep(0.01)
+    await adapter.place_order({}, {"symbol": "A"})
+    after = await adapter.get_order_book({})
+    assert (await before) != after
+    assert CountingAdapter.calls == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_concurrent_cache_misses_reach_broker_once(registry):
+    cache = ReadThroughCache({"get_order_book": 60.0})
+    registry.use(cache)
+    registry.use(SingleFlight({"get_order_book": True}))
+    adapter = registry.get("counting")
+    await asyncio.gather(*(adapter.get_order_book({}) for _ in range(5)))
+    await adapter.get_order_book({})
+    assert CountingAdapter.calls == 1
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,125 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from ordo.config import settings
+from ordo.core.audit import correlation_scope
+from ordo.core.tracing import (
+    FileExporter,
+    RingBufferExporter,
+    Tracer,
+    httpx_event_hooks,
+    tracing,
+)
+from ordo.main import app
+
+AUTH_HEADERS = {"Authorization": f"Bearer {settings.ORDO_API_TOKEN}"}
+
+
+def _tracer(sample_rate=1.0):
+    buffer = RingBufferExporter(100)
+    return Tracer(sample_rate=sample_rate, exporters=[buffer]), buffer
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_spans_nest_across_tasks_under_the_correlation_id():
+    tracer, buffer = _tracer()
+
+    async def leg(name):
+        with tracer.span(name):
+            await asyncio.sleep(0)
+
+    with correlation_scope("corr-1"):
+        with tracer.span("root") as root:
+            await asyncio.gather(leg("a"), leg("b"))
+
+    spans = buffer.trace("corr-1")
+    assert [s["name"] for s in spans] == ["root", "a", "b"]
+    assert all(s["parent_id"] == root.span_id for s in spans[1:])
+    assert buffer.traces() == [
+        {
+            "trace_id": "corr-1",
+            "root": "root",
+            "duration_ms": spans[0]["duration_ms"],
+            "spans": 3,
+        }
+    ]
+
+
+@pytest.mark.unit
+def test_unsampled_traces_record_nothing_below_the_root():
+    tracer, buffer = _tracer(sample_rate=0.0)
+    with tracer.span("root") as root:
+        with tracer.span("child") as child:
+            assert tracer.start_span("http GET") is None
+    assert root is None and child is None
+    assert len(buffer) == 0
+    assert tracer.stats()["traces_started"] == 1
+    assert tracer.stats()["traces_sampled"] == 0
+
+
+@pytest.mark.unit
+def test_failed_spans_carry_the_exception_type():
+    tracer, buffer = _tracer()
+    with pytest.raises(ValueError):
+        with tracer.span("root") as root:
+            raise ValueError("bad")
+    assert buffer.trace(root.trace_id)[0]["status"] == "ValueError"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_httpx_hooks_record_broker_requests():
+    tracer, buffer = _tracer()
+    with respx.mock:
+        respx.post("https://broker.test/orders").respond(201)
+        async with httpx.AsyncClient(
+            event_hooks=httpx_event_hooks(tracer, "hdfc")
+        ) as client:
+            with tracer.span("root") as root:
+                await client.post("https://broker.test/orders?token=x")
+
+    http = buffer.trace(root.trace_id)[1]
+    assert http["name"] == "http POST"
+    assert http["parent_id"] == root.span_id
+    assert http["attributes"] == {
+        "broker": "hdfc",
+        "url": "https://broker.test/orders",
+        "http.status_code": 201,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_file_exporter_appends_ndjson(tmp_path):
+    path = tmp_path / "spans.ndjson"
+    exporter = FileExporter(str(path))
+    tracer = Tracer(sample_rate=1.0, exporters=[exporter])
+    with tracer.span("root"):
+        pass
+    await exporter.flush()
+    (line,) = path.read_text().splitlines()
+    assert json.loads(line)["name"] == "root"
+
+
+def test_request_traces_are_served_by_correlation_id(monkeypatch):
+    monkeypatch.setattr(tracing, "sample_rate", 1.0)
+    with TestClient(app) as client:
+        response = client.get("/api/v1/brokers/mock/holdings", headers=AUTH_HEADERS)
+        trace = client.get(
+            f"/api/v1/traces/{response.json()['correlation_id']}",
+            headers=AUTH_HEADERS,
+        )
+        missing = client.get("/api/v1/traces/nope", headers=AUTH_HEADERS)
+
+    names = [span["name"] for span in trace.json()]
+    assert names[0] == "GET /api/v1/brokers/mock/holdings"
+    assert "orchestrator.get_holdings" in names
+    assert "adapter.get_holdings" in names
+    assert trace.json()[0]["attributes"]["http.status_code"] == 200
+    assert missing.status_code == 404
@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from ordo.persistence.circuit_breaker_store import (
+    CircuitBreakerRecord,
+    SQLiteCircuitBreakerStore,
+)
+
+
+@pytest.mark.unit
+def test_sqlite_store_round_trips_records(tmp_path):
+    path = str(tmp_path / "ordo.db")
+    failed_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    store = SQLiteCircuitBreakerStore(path)
+    assert store.load("fyers") is None
+
+    store.save(CircuitBreakerRecord("fyers", "OPEN", 5, failed_at))
+    store.save(CircuitBreakerRecord("fyers", "HALF_OPEN", 5, failed_at))
+    store.close()
+
+    reopened = SQLiteCircuitBreakerStore(path)
+    assert reopened.load("fyers") == CircuitBreakerRecord(
+        "fyers", "HALF_OPEN", 5, failed_at
+    )
+    reopened.close()
@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ordo.persistence.idempotency_store import (
+    IdempotencyRecord,
+    SQLiteIdempotencyStore,
+)
+
+
+def _record(key, snapshot="{}", ttl=timedelta(hours=1)):
+    return IdempotencyRecord(key, snapshot, datetime.now(timezone.utc) + ttl)
+
+
+@pytest.mark.unit
+def test_sqlite_reservation_is_exclusive(tmp_path):
+    path = str(tmp_path / "ordo.db")
+    first = SQLiteIdempotencyStore(path)
+    second = SQLiteIdempotencyStore(path)
+
+    assert first.reserve(_record("k1", '{"state": "in_progress"}')) is None
+    existing = second.reserve(_record("k1", '{"state": "other"}'))
+    assert existing.response_snapshot_json == '{"state": "in_progress"}'
+
+    first.update(_record("k1", '{"state": "completed"}'))
+    assert second.get("k1").response_snapshot_json == '{"state": "completed"}'
+
+    first.delete("k1")
+    assert second.get("k1") is None
+    first.close()
+    second.close()
+
+
+@pytest.mark.unit
+def test_sqlite_expired_keys_are_swept_and_reusable(tmp_path):
+    store = SQLiteIdempotencyStore(str(tmp_path / "ordo.db"))
+    store.reserve(_record("old", ttl=timedelta(seconds=-1)))
+    store.reserve(_record("live"))
+
+    assert store.reserve(_record("old", '{"new": true}')) is None
+    store.update(_record("old", ttl=timedelta(seconds=-1)))
+    assert store.delete_expired() == 1
+    assert store.get("old") is None
+    assert store.get("live") is not None
+    store.close()
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ordo.persistence.session_store import (
+    InMemorySessionStore,
+    SQLiteSessionStore,
+    StoredSessionValue,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "ordo.db")
+
+
+@pytest.mark.unit
+def test_in_memory_store_set_get_delete():
+    store = InMemorySessionStore()
+    store.set("fyers", "acc", "access_token", b"enc")
+    assert store.get("fyers", "acc", "access_token") == StoredSessionValue(b"enc")
+    store.delete("fyers", "acc")
+    assert store.get("fyers", "acc", "access_token") is None
+
+
+@pytest.mark.unit
+def test_sqlite_store_round_trips_tokens_and_metadata(db_path):
+    store = SQLiteSessionStore(db_path)
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    store.set("hdfc", "acc", "access_token", b"access", expires_at)
+    store.set("hdfc", "acc", "refresh_token", b"refresh")
+    store.set("hdfc", "acc", "state", b"state")
+
+    reopened = SQLiteSessionStore(db_path)
+    access = reopened.get("hdfc", "acc", "access_token")
+    assert access.value == b"access"
+    assert access.expires_at == expires_at
+    assert reopened.get("hdfc", "acc", "refresh_token").value == b"refresh"
+    assert reopened.get("hdfc", "acc", "state").value == b"state"
+
+
+@pytest.mark.unit
+def test_sqlite_store_uses_wal_and_doc_schema(db_path):
+    store = SQLiteSessionStore(db_path)
+    conn = store._conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(DbSession)")}
+    assert {"access_token_encrypted", "access_expires_at", "metadata_json"} <= columns
+
+
+@pytest.mark.unit
+def test_sqlite_store_sees_writes_from_other_workers(db_path):
+    worker_a = SQLiteSessionStore(db_path)
+    worker_b = SQLiteSessionStore(db_path)
+    worker_a.set("hdfc", "acc", "access_token", b"first")
+    assert worker_b.get("hdfc", "acc", "access_token").value == b"first"
+
+    worker_a.set("hdfc", "acc", "access_token", b"second")
+    assert worker_b.get("hdfc", "acc", "access_token").value == b"second"
+
+    worker_a.delete("hdfc", "acc", "access_token")
+    assert worker_b.get("hdfc", "acc", "access_token") is None
+
+
+@pytest.mark.unit
+def test_sqlite_store_cache_is_bounded(db_path):
+    store = SQLiteSessionStore(db_path, cache_size=2)
+    for account in ("a", "b", "c"):
+        store.set("hdfc", account, "access_token", account.encode())
+    assert len(store._cache) == 2
+    assert store.get("hdfc", "a", "access_token").value == b"a"
+
+
+@pytest.mark.unit
+def test_stored_value_expiry():
+    past = datetime.now(timezone.utc) - timedelta(seconds=1)
+    assert StoredSessionValue(b"x", past).is_expired()
+    assert not StoredSessionValue(b"x").is_expired()
@@ -0,0 +1,17 @@
+import pytest
+
+from scripts.benchmark_api import SCENARIOS, run_benchmark, within_budget
+
+
+@pytest.mark.asyncio
+async def test_benchmark_covers_every_scenario():
+    results = await run_benchmark(requests=5, concurrency=2, warmup=1)
+    assert set(results) == {name for name, *_ in SCENARIOS}
+    for stats in results.values():
+        assert 0 < stats["median_ms"] <= stats["p95_ms"] <= stats["max_ms"]
+
+
+def test_within_budget():
+    assert within_budget({"median_ms": 10.0, "p95_ms": 20.0, "max_ms": 30.0})
+    assert not within_budget({"median_ms": 60.0, "p95_ms": 70.0, "max_ms": 80.0})
+    assert not within_budget({"median_ms": 10.0, "p95_ms": 20.0, "max_ms": 300.0})
@@ -2,6 +2,7 @@ from fastapi.testclient import TestClient
 
 from ordo.config import settings
 from ordo.main import app
+from ordo.security.authentication import UNAUTHORIZED_BODY, bearer_token
 
 TEST_API_TOKEN = settings.ORDO_API_TOKEN
 
@@ -56,3 +57,25 @@ def test_health_check_with_valid_token():
     )
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_unauthorized_body_is_pre_serialized():
+    """Verify that every 401 carries the same pre-serialized body."""
+    first = client.get("/protected")
+    second = client.get("/protected", headers={"Authorization": "Basic abc"})
+    assert first.content == second.content == UNAUTHORIZED_BODY
+    assert first.headers["www-authenticate"] == "Bearer"
+
+
+def test_exempt_login_route_no_token():
+    """Verify that exempt paths reach the app without a token."""
+    response = client.post("/login/initiate", json={})
+    assert response.status_code != 401
+
+
+def test_bearer_token_parsing():
+    """Verify that only a well-formed Bearer header yields a token."""
+    assert bearer_token([(b"authorization", b"Bearer abc")]) == b"abc"
+    assert bearer_token([(b"authorization", b"Bearer ")]) is None
+    assert bearer_token([(b"authorization", b"Basic abc")]) is None
+    assert bearer_token([(b"accept", b"*/*")]) is None
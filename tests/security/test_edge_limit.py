@@ -0,0 +1,152 @@
+"""Tests for the per-client edge rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ordo.config import settings
+from ordo.main import app
+from ordo.security.edge_limit import (
+    RATE_LIMITED_BODY,
+    ClientQuota,
+    EdgeRateLimiter,
+    EdgeRateLimitMiddleware,
+    edge_limiter,
+)
+from ordo.security.tokens import READ, ApiClient
+
+AUTH_HEADERS = {"Authorization": f"Bearer {settings.ORDO_API_TOKEN}"}
+
+
+@pytest.mark.unit
+def test_quota_allows_burst_then_refills():
+    quota = ClientQuota(rate=2.0, burst=2, max_in_flight=10, now=0.0)
+    assert quota.try_acquire(0.0) is None
+    assert quota.try_acquire(0.0) is None
+    assert quota.try_acquire(0.0) == pytest.approx(0.5)
+    assert quota.try_acquire(0.5) is None
+    assert quota.stats()["rejected"] == 1
+
+
+@pytest.mark.unit
+def test_quota_caps_in_flight_requests():
+    quota = ClientQuota(rate=100.0, burst=100, max_in_flight=1, now=0.0)
+    assert quota.try_acquire(0.0) is None
+    assert quota.try_acquire(0.0) == 1.0
+    quota.in_flight -= 1
+    assert quota.try_acquire(0.0) is None
+
+
+@pytest.mark.unit
+def test_overrides_apply_per_client():
+    limiter = EdgeRateLimiter(10.0, 20, 5, overrides={"noisy": {"rate": 1.0}})
+    assert limiter.quota_for("noisy").rate == 1.0
+    assert limiter.quota_for("noisy").burst == 20
+    assert limiter.quota_for("quiet").rate == 10.0
+
+
+@pytest.mark.unit
+def test_limits_that_never_refill_are_rejected_when_set():
+    with pytest.raises(ValueError):
+        EdgeRateLimiter(0, 10, 4)
+    with pytest.raises(ValueError):
+        EdgeRateLimiter(10.0, 10, 4, overrides={"stuck": {"rate": 0}})
+
+    limiter = EdgeRateLimiter(10.0, 10, 4, overrides={"noisy": {"rate": 1.0}})
+    with pytest.raises(ValueError):
+        limiter.configure("noisy", rate=0)
+    with pytest.raises(ValueError):
+        limiter.configure("new", burst=0)
+    assert limiter.overrides == {"noisy": {"rate": 1.0}}
+    assert limiter.quota_for("noisy").rate == 1.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_middleware_rejects_concurrent_requests_of_one_client_only():
+    release = asyncio.Event()
+
+    async def slow_app(scope, receive, send):
+        await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = EdgeRateLimitMiddleware(slow_app, EdgeRateLimiter(100.0, 100, 1))
+
+    async def call(client_id):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {
+            "type": "http",
+            "path": "/",
+            "state": {"client": ApiClient(client_id, frozenset({READ}))},
+        }
+        await middleware(scope, None, send)
+        return messages
+
+    first = asyncio.create_task(call("noisy"))
+    await asyncio.sleep(0)
+    rejected = await call("noisy")
+    other = asyncio.create_task(call("quiet"))
+    release.set()
+    ok, quiet = await first, await other
+
+    assert rejected[0]["status"] == 429
+    assert (b"retry-after", b"1") in rejected[0]["headers"]
+    assert rejected[1]["body"] == RATE_LIMITED_BODY
+    assert ok[0]["status"] == 200
+    assert quiet[0]["status"] == 200
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_open_streams_do_not_hold_in_flight_slots():
+    release = asyncio.Event()
+
+    async def streaming_app(scope, receive, send):
+        await release.wait()
+
+    limiter = EdgeRateLimiter(100.0, 100, 1)
+    middleware = EdgeRateLimitMiddleware(streaming_app, limiter)
+    scope = {
+        "type": "http",
+        "path": "/api/v1/stream/mock",
+        "state": {"client": ApiClient("listener", frozenset({READ}))},
+    }
+    streams = [asyncio.create_task(middleware(scope, None, None)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    quota = limiter.quota_for("listener")
+    assert (quota.in_flight, quota.admitted) == (0, 3)
+    assert quota.try_acquire(time.monotonic()) is None
+    release.set()
+    await asyncio.gather(*streams)
+
+
+def test_rate_limited_client_gets_429_with_retry_after():
+    with TestClient(app) as client:
+        issued = client.post(
+            "/api/v1/tokens",
+            json={"client_id": "edge-test", "scopes": ["read"]},
+            headers=AUTH_HEADERS,
+        )
+        edge_limiter.configure("edge-test", rate=0.5, burst=2, max_in_flight=4)
+        headers = {"Authorization": f"Bearer {issued.json()['token']}"}
+        try:
+            responses = [
+                client.get("/api/v1/status", headers=headers) for _ in range(3)
+            ]
+            status = client.get("/api/v1/status", headers=AUTH_HEADERS)
+        finally:
+            client.delete("/api/v1/tokens/edge-test", headers=AUTH_HEADERS)
+
+    assert [r.status_code for r in responses] == [200, 200, 429]
+    assert responses[2].headers["retry-after"] == "2"
+    assert responses[2].json()["error_code"] == "RATE_LIMITED"
+    assert status.status_code == 200
+    assert status.json()["edge_limits"]["edge-test"]["rejected"] == 1
@@ -1,9 +1,12 @@
 """Tests for the SessionManager."""
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from cryptography.fernet import Fernet
 
-from ordo.security.session import SessionManager
+from ordo.persistence.session_store import InMemorySessionStore
+from ordo.security.session import DecryptedValueCache, SessionManager
 
 # Generate a key for testing
 TEST_SECRET_KEY = Fernet.generate_key().decode()
@@ -65,3 +68,95 @@ def test_session_namespacing():
     assert retrieved_value_1 == value_1
     assert retrieved_value_2 == value_2
     assert retrieved_value_1 != retrieved_value_2
+
+
+def test_expired_session_returns_none():
+    """Test that an expired value is treated as missing without decrypting it."""
+    manager = SessionManager(TEST_SECRET_KEY)
+    expired = datetime.now(timezone.utc) - timedelta(minutes=1)
+    manager.set_session("fyers", "access_token", "token", expires_at=expired)
+
+    assert manager.get_session("fyers", "access_token") is None
+    assert manager.get_expiry("fyers", "access_token") == expired
+
+
+def test_access_token_ttl_sets_expiry():
+    """Test that access tokens get an expiry from the configured TTL."""
+    manager = SessionManager(TEST_SECRET_KEY, access_token_ttl=timedelta(hours=1))
+    manager.set_session("fyers", "access_token", "token")
+
+    expires_at = manager.get_expiry("fyers", "access_token")
+    assert expires_at > datetime.now(timezone.utc)
+    assert manager.get_session("fyers", "access_token") == "token"
+
+
+def test_shared_store_between_managers():
+    """Test that managers sharing a store see each other's sessions."""
+    store = InMemorySessionStore()
+    first = SessionManager(TEST_SECRET_KEY, store=store, broker_name="fyers")
+    second = SessionManager(TEST_SECRET_KEY, store=store, broker_name="fyers")
+    first.set_session("app", "state", "abc")
+
+    assert second.get_session("app", "state") == "abc"
+    second.clear_session("app")
+    assert first.get_session("app", "state") is None
+
+
+def test_value_encrypted_with_other_key_returns_none():
+    """Test that a rotated SECRET_KEY invalidates stored sessions."""
+    store = InMemorySessionStore()
+    SessionManager(TEST_SECRET_KEY, store=store).set_session("fyers", "k", "v")
+    other = SessionManager(Fernet.generate_key().decode(), store=store)
+
+    assert other.get_session("fyers", "k") is None
+
+
+def test_get_session_serves_repeat_reads_from_cache(mocker):
+    """Test that repeated reads decrypt only once."""
+    manager = SessionManager(TEST_SECRET_KEY)
+    manager.set_session("fyers", "access_token", "token")
+    decrypt = mocker.spy(manager._fernet, "decrypt")
+
+    assert manager.get_session("fyers", "access_token") == "token"
+    assert manager.get_session("fyers", "access_token") == "token"
+
+    assert decrypt.call_count == 1
+    assert manager.cache_stats()["hits"] == 1
+    assert manager.cache_stats()["misses"] == 1
+
+
+def test_set_session_invalidates_cached_value():
+    """Test that overwriting a value never serves the old plaintext."""
+    manager = SessionManager(TEST_SECRET_KEY)
+    manager.set_session("fyers", "access_token", "old")
+    manager.get_session("fyers", "access_token")
+    manager.set_session("fyers", "access_token", "new")
+
+    assert manager.get_session("fyers", "access_token") == "new"
+
+
+def test_cache_detects_values_replaced_by_another_worker():
+    """Test that a cached value is ignored once the stored ciphertext changes."""
+    store = InMemorySessionStore()
+    ours = SessionManager(TEST_SECRET_KEY, store=store)
+    theirs = SessionManager(TEST_SECRET_KEY, store=store)
+    ours.set_session("fyers", "access_token", "old")
+    assert ours.get_session("fyers", "access_token") == "old"
+
+    theirs.set_session("fyers", "access_token", "new")
+    assert ours.get_session("fyers", "access_token") == "new"
+
+
+def test_cache_ttl_and_eviction_wipe_plaintext():
+    """Test that expired or evicted entries are zeroed and not served."""
+    cache = DecryptedValueCache(max_size=1, ttl_seconds=60)
+    cache.put(("a", "k"), b"c1", "secret")
+    buffer = cache._entries[("a", "k")][1]
+    cache.put(("b", "k"), b"c2", "other")
+
+    assert bytes(buffer) == bytes(len("secret"))
+    assert cache.get(("a", "k"), b"c1") is None
+
+    expired = DecryptedValueCache(max_size=4, ttl_seconds=0)
+    expired.put(("a", "k"), b"c1", "secret")
+    assert expired.get(("a", "k"), b"c1") is None
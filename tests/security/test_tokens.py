@@ -0,0 +1,99 @@
+"""Tests for the API token index and scopes."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ordo.config import settings
+from ordo.main import app
+from ordo.persistence.api_token_store import (
+    InMemoryApiTokenStore,
+    SQLiteApiTokenStore,
+)
+from ordo.security.tokens import ADMIN, READ, TRADE, TokenIndex, token_index
+
+AUTH_HEADERS = {"Authorization": f"Bearer {settings.ORDO_API_TOKEN}"}
+
+
+@pytest.mark.unit
+def test_issued_tokens_authenticate_with_implied_scopes():
+    index = TokenIndex(store=InMemoryApiTokenStore(), default_token="root")
+    token = index.issue("strategy-a", [TRADE])
+
+    client = index.authenticate(token.encode())
+    assert client.client_id == "strategy-a"
+    assert client.allows(READ) and client.allows(TRADE)
+    assert not client.allows(ADMIN)
+    assert index.authenticate(b"root").client_id == "default"
+    assert index.authenticate(b"wrong") is None
+
+
+@pytest.mark.unit
+def test_only_hashes_are_stored_and_rotation_revokes_old_token():
+    store = InMemoryApiTokenStore()
+    index = TokenIndex(store=store, default_token="root")
+    first = index.issue("strategy-a", [READ])
+    second = index.issue("strategy-a", [READ])
+
+    assert [r.token_hash for r in store.load_all()] != [first]
+    assert index.authenticate(first.encode()) is None
+    assert index.authenticate(second.encode()).client_id == "strategy-a"
+    assert index.revoke("strategy-a")
+    assert index.authenticate(second.encode()) is None
+    assert not index.revoke("strategy-a")
+
+
+@pytest.mark.unit
+def test_invalid_issues_are_rejected():
+    index = TokenIndex(store=InMemoryApiTokenStore(), default_token="root")
+    with pytest.raises(ValueError):
+        index.issue("strategy-a", ["superuser"])
+    with pytest.raises(ValueError):
+        index.issue("default", [READ])
+
+
+@pytest.mark.unit
+def test_other_workers_see_issued_tokens_after_reload(tmp_path):
+    path = str(tmp_path / "ordo.db")
+    worker_a = TokenIndex(store=SQLiteApiTokenStore(path), default_token="root")
+    worker_b = TokenIndex(store=SQLiteApiTokenStore(path), default_token="root")
+    worker_b.reload()
+
+    token = worker_a.issue("strategy-a", [READ])
+    assert worker_b.authenticate(token.encode()) is None
+    assert worker_b.store.changed()
+    worker_b.reload()
+    assert worker_b.authenticate(token.encode()).client_id == "strategy-a"
+
+
+def test_routes_enforce_scopes():
+    with TestClient(app) as client:
+        issued = client.post(
+            "/api/v1/tokens",
+            json={"client_id": "read-only", "scopes": ["read"]},
+            headers=AUTH_HEADERS,
+        )
+        headers = {"Authorization": f"Bearer {issued.json()['token']}"}
+        try:
+            status = client.get("/api/v1/status", headers=headers)
+            order = client.post(
+                "/api/v1/orders",
+                json={"targets": [{"broker": "mock"}], "order": {"symbol": "A"}},
+                headers=headers,
+            )
+            kill = client.post(
+                "/api/v1/killswitch", json={"active": True}, headers=headers
+            )
+            listed = client.get("/api/v1/tokens", headers=AUTH_HEADERS)
+        finally:
+            revoked = client.delete("/api/v1/tokens/read-only", headers=AUTH_HEADERS)
+        after = client.get("/api/v1/status", headers=headers)
+
+    assert issued.status_code == 201
+    assert status.status_code == 200
+    assert order.status_code == 403
+    assert order.json()["error_code"] == "FORBIDDEN"
+    assert kill.status_code == 403
+    assert {"client_id": "read-only", "scopes": ["read"]} in listed.json()
+    assert revoked.status_code == 204
+    assert after.status_code == 401
+    assert token_index.authenticate(settings.ORDO_API_TOKEN.encode()).allows(ADMIN)
@@ -13,3 +13,15 @@ def test_get_adapter_unknown(monkeypatch):
     monkeypatch.setattr(settings, "BROKER_ADAPTER", "unknown")
     with pytest.raises(ValueError):
         get_adapter()
+
+
+def test_get_adapter_returns_cached_instance(monkeypatch):
+    monkeypatch.setattr(settings, "BROKER_ADAPTER", "mock")
+    assert get_adapter() is get_adapter("mock")
+
+
+def test_get_adapter_per_account_instances():
+    first = get_adapter("mock", account_id="acc-1")
+    second = get_adapter("mock", account_id="acc-2")
+    assert first is not second
+    assert get_adapter("mock", account_id="acc-1") is first